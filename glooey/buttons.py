@@ -8,16 +8,20 @@ import pyglet
 import autoprop
 
 from vecrec import Vector, Rect
-from glooey import containers
+from glooey import drawing, containers
 from glooey.widget import Widget
 from glooey.containers import Deck, Stack
 from glooey.text import Label
 from glooey.images import Image, Background
 from glooey.helpers import *
 
-@autoprop
-class Rollover(Deck):
-    custom_predicate = lambda self, w: True
+class _RolloverMixin:
+    """
+    Keep track of the rollover state of one or more controller widgets.
+
+    Derived classes must provide `is_state_missing()` and `set_state()`, and 
+    must put the initial controller in ``self._controllers``.
+    """
     custom_rollover_state_priorities = {
             'base': 0,
             'over': 1,
@@ -25,12 +29,9 @@ class Rollover(Deck):
             'off': 3,
     }
 
-    def __init__(self, controller, initial_state, predicate=None, **states):
-        super().__init__(initial_state, **states)
-        self._controllers = [controller]
-        self._predicate = predicate or self.custom_predicate
-
     def do_attach(self):
+        super().do_attach()
+
         for widget in self._controllers:
             self._add_handlers(widget)
 
@@ -39,6 +40,8 @@ class Rollover(Deck):
         self._update_state()
 
     def do_detach(self):
+        super().do_detach()
+
         for widget in self._controllers:
             self._remove_handlers(widget)
 
@@ -50,19 +53,6 @@ class Rollover(Deck):
         self._controllers.remove(widget)
         self._remove_handlers(widget)
 
-    def get_predicate(self):
-        return self._predicate
-
-    def set_predicate(self, new_predicate):
-        self._predicate = new_predicate
-
-    def is_state_missing(self, state):
-        if state not in self.known_states:
-            return True
-        else:
-            widget = self.get_widget(state)
-            return not self.predicate(widget)
-
     def _update_state(self, *ignored_event_args):
         state = 'base'
         priority = self.custom_rollover_state_priorities
@@ -100,6 +90,127 @@ class Rollover(Deck):
         )
 
 
+@autoprop
+class Rollover(_RolloverMixin, Deck):
+    custom_predicate = lambda self, w: True
+    custom_retain_hidden_states = True
+
+    def __init__(self, controller, initial_state, predicate=None, **states):
+        super().__init__(initial_state, **states)
+        self._controllers = [controller]
+        self._predicate = predicate or self.custom_predicate
+
+    def get_predicate(self):
+        return self._predicate
+
+    def set_predicate(self, new_predicate):
+        self._predicate = new_predicate
+
+    def is_state_missing(self, state):
+        if state not in self.known_states:
+            return True
+
+        # Don't call the factories of states that haven't been shown yet just 
+        # to check the predicate; assume they aren't missing.
+        widget = self._states[state]
+        if widget is None:
+            return False
+
+        return not self.predicate(widget)
+
+
+@autoprop
+class BackgroundRollover(_RolloverMixin, Background):
+    """
+    A single `Background` widget that changes its appearance to match the 
+    rollover state of one or more controller widgets.
+
+    This looks the same as a `Rollover` deck with a `Background` widget for 
+    each state, but it only needs one widget and one set of artists.  Each 
+    state is instead described by a dictionary of keyword arguments for 
+    `set_appearance()`, which are swapped into the background whenever the 
+    state changes.  States with empty appearances are treated as missing, so 
+    e.g. the "over" state falls back to "base" just like it does in a 
+    `Rollover` deck.
+    """
+
+    def __init__(self, controller, initial_state='base', **appearances):
+        super().__init__()
+        self._controllers = [controller]
+        self._state = initial_state
+        self._appearances = {}
+        self._empty_states = set()
+        self._min_size = 0, 0
+        self.set_appearances(**appearances)
+
+    def do_claim(self):
+        # Claim enough space for the biggest state, so changing state doesn't 
+        # require a repack.  See `Deck.do_claim()`.
+        return self._min_size
+
+    def is_state_missing(self, state):
+        return state not in self._appearances or state in self._empty_states
+
+    def get_state(self):
+        return self._state
+
+    def set_state(self, new_state):
+        if new_state not in self._appearances:
+            raise ValueError(f"unknown state '{new_state}'")
+
+        if new_state != self._state:
+            self._state = new_state
+            self._artist.set_appearance(**self._appearances[new_state])
+
+    def get_known_states(self):
+        return self._appearances.keys()
+
+    def get_appearances(self):
+        return self._appearances
+
+    def set_appearances(self, **appearances):
+        """
+        Set the appearance of every state at once.
+
+        Keyword arguments map states (e.g. 'base', 'over', 'down', 'off') to 
+        dictionaries of arguments for `drawing.Background.set_appearance()`.  
+        Any states not given are removed.
+        """
+        self._appearances = {k: dict(v) for k, v in appearances.items()}
+
+        # Work out which states are empty and how much space the biggest one 
+        # needs now, rather than every time the state changes.
+        self._empty_states = set()
+        self._min_size = 0, 0
+        scratch = drawing.Background(hidden=True)
+
+        for state, appearance in self._appearances.items():
+            scratch.set_appearance(**appearance)
+            if scratch.is_empty:
+                self._empty_states.add(state)
+
+            width, height = scratch.min_size
+            self._min_size = (
+                    max(width, self._min_size[0]),
+                    max(height, self._min_size[1]),
+            )
+
+        self._artist.set_appearance(**self._appearances.get(self._state, {}))
+        self._repack()
+
+    def get_state_appearance(self, state):
+        return self._appearances[state]
+
+    def set_state_appearance(self, state, appearance):
+        """
+        Set the appearance of a single state.  The appearance should be a 
+        dictionary of arguments for `drawing.Background.set_appearance()`.
+        """
+        appearances = self._appearances.copy()
+        appearances[state] = appearance
+        self.set_appearances(**appearances)
+
+
 @autoprop
 class Button(Widget):
     """
@@ -251,14 +362,7 @@ class Button(Widget):
 
         self._foreground = self.Foreground(*args, **kwargs) \
                 if self.Foreground else None
-        self._background = Rollover(
-                self, 'base', predicate=lambda w: not w.is_empty)
-        self._background.add_states(
-                base = (self.Base or self.Background)(),
-                over = (self.Over or self.Background)(),
-                down = (self.Down or self.Background)(),
-                off  = (self.Off  or self.Background)(),
-        )
+        self._background = self._make_background()
 
         if self.custom_text is not None:
             self._foreground.text = self.custom_text
@@ -286,15 +390,13 @@ class Button(Widget):
             align_widget_in_box(layer, self.rect)
 
     def do_regroup_children(self):
-        from pyglet.graphics import OrderedGroup
-
         # Don't make unnecessary layers, see `Stack.do_regroup_children()`.
 
         if self._foreground is None:
             self._background._regroup(self.group)
         else:
-            self._foreground._regroup(OrderedGroup(2, self.group))
-            self._background._regroup(OrderedGroup(1, self.group))
+            self._foreground._regroup(drawing.get_ordered_group(2, self.group))
+            self._background._regroup(drawing.get_ordered_group(1, self.group))
 
     def get_foreground(self):
         return self._foreground
@@ -352,27 +454,10 @@ class Button(Widget):
         method, but this will just result in the last call overriding all the 
         earlier ones.
         """
-        rollover_states = self._background.known_states
-        appearance_args = {k: {} for k in rollover_states}
-
-        for key, arg in kwargs.items():
-            tokens = key.split('_', 1)
+        widgets, appearance_args = self._parse_background_args(kwargs)
 
-            # Each keyword argument should begin with the name of one of the 
-            # rollover states (e.g. 'base', 'over', 'down', 'off').
-            if tokens[0] not in rollover_states:
-                options = ', '.join(f"'{x}'" for x in rollover_states)
-                raise ValueError(f"keyword argument '{key}' should begin with one of {options}")
-
-            # If we just got the name of a state with no suffix, replace that 
-            # state with the given argument (which should be a widget).
-            if len(tokens) == 1:
-                self._background.add_state(arg)
-
-            # Otherwise, pass the argument through to the `set_appearance()` 
-            # method for the indicated background widget.
-            else:
-                appearance_args[tokens[0]][tokens[1]] = arg
+        for key, widget in widgets.items():
+            self._background.add_state(key, widget)
 
         # We have to make only one call to `set_appearance()` per background 
         # widget, otherwise later calls would override earlier calls.
@@ -406,6 +491,47 @@ class Button(Widget):
     def set_off_background(self, widget):
         self._background.add_state('off', widget)
 
+    def _make_background(self):
+        background = Rollover(
+                self, 'base', predicate=lambda w: not w.is_empty)
+        background.add_states(
+                base = (self.Base or self.Background)(),
+                over = (self.Over or self.Background)(),
+                down = (self.Down or self.Background)(),
+                off  = (self.Off  or self.Background)(),
+        )
+        return background
+
+    def _parse_background_args(self, kwargs):
+        """
+        Sort the arguments to `set_background()` into widgets for each state 
+        and `set_appearance()` arguments for each state.
+        """
+        rollover_states = self._background.known_states
+        widgets = {}
+        appearance_args = {k: {} for k in rollover_states}
+
+        for key, arg in kwargs.items():
+            tokens = key.split('_', 1)
+
+            # Each keyword argument should begin with the name of one of the 
+            # rollover states (e.g. 'base', 'over', 'down', 'off').
+            if tokens[0] not in rollover_states:
+                options = ', '.join(f"'{x}'" for x in rollover_states)
+                raise ValueError(f"keyword argument '{key}' should begin with one of {options}")
+
+            # If we just got the name of a state with no suffix, replace that 
+            # state with the given argument (which should be a widget).
+            if len(tokens) == 1:
+                widgets[key] = arg
+
+            # Otherwise, pass the argument through to the `set_appearance()` 
+            # method for the indicated background widget.
+            else:
+                appearance_args[tokens[0]][tokens[1]] = arg
+
+        return widgets, appearance_args
+
     def _yield_layers(self):
         if self._foreground:
             yield self._foreground
@@ -432,6 +558,127 @@ class Button(Widget):
         if background_args:
             self.set_background(**background_args)
             
+@autoprop
+class FastButton(Button):
+    """
+    A button that draws its background with a single `BackgroundRollover` 
+    widget, rather than a `Rollover` deck with a widget for each state.
+
+    A normal `Button` has a `Background` widget (each with its own artists) 
+    for every rollover state, even though only one is visible at a time.  
+    That adds up for toolbars or menus with hundreds of buttons.  This class 
+    instead works out the appearance of each state up front, and just swaps 
+    the appearance of one background whenever the rollover state changes.
+
+    The `Base`, `Over`, `Down`, `Off` and `Background` inner classes, the 
+    ``custom_<state>_<attr>`` attributes and `set_background()` all work the 
+    same way they do for `Button`, except that the background classes must be 
+    derived from `Background` or `Image`.  The per-state background 
+    attributes (e.g. ``base_background``) are appearance dictionaries rather 
+    than widgets.  To make a fast version of a themed button, put this class 
+    first in the list of bases:
+
+    >>> class MyButton(glooey.FastButton, glooey.themes.kenney.Button):
+    ...     pass
+    """
+
+    def set_background(self, **kwargs):
+        """
+        Set appearance options for any of the background states.
+
+        See `Button.set_background()`.  Arguments of the ``<rollover>`` form 
+        can be `Background` or `Image` widgets, and are used only for their 
+        appearance.
+        """
+        widgets, appearance_args = self._parse_background_args(kwargs)
+
+        for key, widget in widgets.items():
+            appearance_args[key] = _get_background_appearance(widget)
+
+        self._background.set_appearances(**appearance_args)
+
+    def get_base_background(self):
+        return self._background.get_state_appearance('base')
+
+    def set_base_background(self, widget):
+        self._set_state_background('base', widget)
+
+    def get_over_background(self):
+        return self._background.get_state_appearance('over')
+
+    def set_over_background(self, widget):
+        self._set_state_background('over', widget)
+
+    def get_down_background(self):
+        return self._background.get_state_appearance('down')
+
+    def set_down_background(self, widget):
+        self._set_state_background('down', widget)
+
+    def get_off_background(self):
+        return self._background.get_state_appearance('off')
+
+    def set_off_background(self, widget):
+        self._set_state_background('off', widget)
+
+    def _make_background(self):
+        return BackgroundRollover(
+                self, 'base',
+                base = _get_background_appearance(self.Base or self.Background),
+                over = _get_background_appearance(self.Over or self.Background),
+                down = _get_background_appearance(self.Down or self.Background),
+                off  = _get_background_appearance(self.Off  or self.Background),
+        )
+
+    def _set_state_background(self, state, widget_or_appearance):
+        appearance = widget_or_appearance \
+                if isinstance(widget_or_appearance, dict) \
+                else _get_background_appearance(widget_or_appearance)
+        self._background.set_state_appearance(state, appearance)
+
+
+def _get_background_appearance(widget_or_cls):
+    """
+    Return the `drawing.Background.set_appearance()` arguments that describe 
+    the given `Background` or `Image` widget (or widget class).
+
+    Classes are inspected without being instantiated, so no widgets need to 
+    be made just to find out what they would look like.
+    """
+    is_cls = isinstance(widget_or_cls, type)
+    cls = widget_or_cls if is_cls else type(widget_or_cls)
+
+    if issubclass(cls, Image):
+        image = widget_or_cls.custom_image if is_cls else widget_or_cls.image
+        return {'image': image}
+
+    if issubclass(cls, Background):
+        if not is_cls:
+            return _background_appearance_from_artist(widget_or_cls._artist)
+
+        keys = (
+                'color', 'outline', 'image', 'center',
+                'top', 'bottom', 'left', 'right',
+                'top_left', 'top_right', 'bottom_left', 'bottom_right',
+                'vtile', 'htile',
+        )
+        return {k: getattr(cls, f'custom_{k}') for k in keys}
+
+    raise UsageError(f"can't use {cls.__name__} as a FastButton background; only Background and Image widgets are supported.")
+
+def _background_appearance_from_artist(artist):
+    keys = {
+            (0,0): 'top_left',    (0,1): 'top',    (0,2): 'top_right',
+            (1,0): 'left',        (1,1): 'center', (1,2): 'right',
+            (2,0): 'bottom_left', (2,1): 'bottom', (2,2): 'bottom_right',
+    }
+    appearance = artist.appearance
+    return {
+            keys.get(k, k): v
+            for k, v in appearance.items()
+    }
+
+
 @autoprop
 @register_event_type('on_toggle')
 class Checkbox(Widget):
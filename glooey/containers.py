@@ -163,9 +163,9 @@ class Frame(Widget):
         return claim_stacked_widgets(self.box, self.decoration)
 
     def do_regroup_children(self):
-        self.box._regroup(pyglet.graphics.OrderedGroup(
+        self.box._regroup(drawing.get_ordered_group(
             self.custom_box_layer, self.group))
-        self.decoration._regroup(pyglet.graphics.OrderedGroup(
+        self.decoration._regroup(drawing.get_ordered_group(
             self.custom_decoration_layer, self.group))
 
     def get_box(self):
@@ -274,9 +274,12 @@ class Grid(Widget):
         super().__init__()
         self._children = {}
         self._children_can_overlap = False
+        # Only the cells that hold children are ever looked up, so there's no 
+        # need to make rects for the empty ones.
         self._grid = drawing.Grid(
                 num_rows=num_rows or self.custom_num_rows,
                 num_cols=num_cols or self.custom_num_cols,
+                sparse=True,
         )
         self.cell_padding = first_not_none((
                 self.custom_cell_padding, self.custom_padding, 0))
@@ -321,6 +324,28 @@ class Grid(Widget):
         self._children[row, col] = child
         self._repack_and_regroup_children()
 
+    def add_many(self, children):
+        """
+        Add several widgets to the grid at once.
+
+        The ``children`` argument should be a dictionary mapping (row, col) 
+        tuples to widgets, or an iterable of ((row, col), widget) pairs.  This 
+        is equivalent to calling `add()` for each widget, except that the grid 
+        is only repacked once, after all the widgets have been added.  This is 
+        much faster when filling a large grid.
+
+        Example:
+
+        >>> grid.add_many({
+        ...     (i, j): glooey.Placeholder()
+        ...     for i in range(100)
+        ...     for j in range(100)
+        ... })
+        """
+        with self.hold_updates():
+            for (row, col), child in dict(children).items():
+                self.add(row, col, child)
+
     def remove(self, row, col):
         """
         Remove the widget at the given position in the grid.
@@ -513,7 +538,7 @@ class Grid(Widget):
         """
         Return the height of the given row.
         """
-        return self._grid.row_heights[row]
+        return self._grid.get_row_height(row)
 
     def set_row_height(self, row, new_height):
         """
@@ -545,7 +570,7 @@ class Grid(Widget):
         """
         Return the width of the given column.
         """
-        return self._grid.col_widths[col]
+        return self._grid.get_col_width(col)
 
     def set_col_width(self, col, new_width):
         """
@@ -667,6 +692,26 @@ class HVBox(Widget):
         self._sizes = {}
         self._grid = drawing.Grid()
 
+        # The underlying grid is updated incrementally.  These attributes keep 
+        # track of which cells need to be updated before the next claim: every 
+        # cell from the first one whose child was inserted, removed, or 
+        # replaced on, plus the cells of any children whose claims changed.
+        self._first_moved_index = None
+        self._num_cells = 0
+        self._claim_changed_children = set()
+
+        # The index of each child, as of the last claim.  The indices of the 
+        # children before `_first_moved_index` are always up to date.
+        self._indices = {}
+
+        # The box and claim that each child was last aligned with, so that 
+        # children that haven't moved or changed don't need to be realigned, 
+        # plus the children whose claims changed since they were aligned.
+        self._aligned_boxes = {}
+        self._aligned_cell_alignment = None
+        self._first_unaligned_index = None
+        self._unaligned_children = set()
+
         self.cell_padding = first_not_none((
                 self.custom_cell_padding, self.custom_padding, 0))
         self.cell_alignment = self.custom_cell_alignment
@@ -750,6 +795,32 @@ class HVBox(Widget):
         """
         self.insert(widget, len(self._children), size)
 
+    def extend(self, widgets, sizes=None):
+        """
+        Add several widgets to the back of the layout at once.
+
+        This is equivalent to calling `add()` for each widget, except that the 
+        layout is only repacked once, after all the widgets have been added.  
+        This is much faster when filling a large layout.
+
+        The ``sizes`` argument can either be a single size to use for every 
+        widget, or a list with one size per widget.  See `add()` for details 
+        about the sizes themselves.
+        """
+        widgets = list(widgets)
+
+        if sizes is None or isinstance(sizes, (int, float, str)):
+            sizes = [sizes] * len(widgets)
+        else:
+            sizes = list(sizes)
+
+        if len(sizes) != len(widgets):
+            raise UsageError(f"got {len(widgets)} widgets but {len(sizes)} sizes")
+
+        with self.hold_updates():
+            for widget, size in zip(widgets, sizes):
+                self.add_back(widget, size)
+
     def pack(self, widget):
         """
         Add the given widget to the layout such that it takes as little space 
@@ -786,6 +857,7 @@ class HVBox(Widget):
         self._attach_child(widget)
         self._children.insert(index, widget)
         self._sizes[widget] = size
+        self._note_moved_index(index)
         self._repack_and_regroup_children()
 
     def replace(self, old_widget, new_widget):
@@ -808,9 +880,12 @@ class HVBox(Widget):
         """
         Remove the given widget from the layout.
         """
+        index = self._children.index(widget)
         self._detach_child(widget)
-        self._children.remove(widget)
+        del self._children[index]
         del self._sizes[widget]
+        self._forget_child(widget)
+        self._note_moved_index(index)
         self._repack_and_regroup_children()
 
     def clear(self):
@@ -821,6 +896,12 @@ class HVBox(Widget):
             self._detach_child(child)
         self._children = []
         self._sizes = {}
+        self._claim_changed_children = set()
+        self._indices = {}
+        self._aligned_boxes = {}
+        self._first_unaligned_index = None
+        self._unaligned_children = set()
+        self._note_moved_index(0)
         self._repack_and_regroup_children()
 
     def do_claim(self):
@@ -829,28 +910,116 @@ class HVBox(Widget):
         direction of the layout (e.g. horizontal for `HBox`, vertical for 
         `VBox`) and just enough space for the largest child widget in the 
         opposite direction.
-        """
-        self.do_set_row_col_sizes({
-                i: self._sizes[child]
-                for i, child in enumerate(self._children)
-                if self._sizes[child] is not None
-        })
-        min_cell_rects = {
-                self.do_get_row_col(i): child.claimed_rect
-                for i, child in enumerate(self._children)
-        }
-        return self._grid.make_claim(min_cell_rects)
+
+        Only the cells that have changed since the last claim are updated, see 
+        `do_child_claim_changed()`.
+        """
+        num_children = len(self._children)
+        first_moved = first_not_none((self._first_moved_index, num_children))
+        sizes = {}
+
+        # The children before the first one that moved are still in the same 
+        # cells, but some of them may have changed size.  The children after 
+        # that are all updated below anyway.
+        for child in self._claim_changed_children:
+            i = self._indices.get(child)
+            if i is not None and i < first_moved:
+                row, col = self.do_get_row_col(i)
+                self._grid.set_min_cell_rect(row, col, child.claimed_rect)
+
+        # Every child from the first one that moved is in a different cell 
+        # than it was before.
+        for i in range(first_moved, num_children):
+            child = self._children[i]
+            row, col = self.do_get_row_col(i)
+            self._grid.set_min_cell_rect(row, col, child.claimed_rect)
+            self._indices[child] = i
+            sizes[i] = self._sizes[child]
+
+        # Any cells past the last child are no longer needed.
+        for i in range(num_children, self._num_cells):
+            row, col = self.do_get_row_col(i)
+            self._grid.del_min_cell_rect(row, col)
+            sizes[i] = None
+
+        if sizes:
+            self.do_set_row_col_sizes(sizes)
+
+        # The children that moved need to be realigned even if the cells they 
+        # moved into didn't change.
+        if first_moved < num_children:
+            self._first_unaligned_index = min(
+                    first_moved, first_not_none((
+                        self._first_unaligned_index, first_moved)))
+
+        self._first_moved_index = None
+        self._num_cells = num_children
+        self._claim_changed_children = set()
+
+        return self._grid.make_claim()
+
+    def do_child_claim_changed(self, child):
+        """
+        Make a note that the given child's cell needs to be updated.
+        """
+        if child in self._sizes:
+            self._claim_changed_children.add(child)
+            self._unaligned_children.add(child)
 
     def do_resize_children(self):
         """
         Allocate space to the child widgets according to how much space they 
         asked for when added to the layout (e.g. their "size") and how much 
         space they need (e.g. their "claim").
+
+        Children that are in the same box as the last time they were aligned, 
+        and that haven't changed size since then, are skipped.  The underlying 
+        grid only makes new boxes for cells that moved or changed size, and 
+        reports which cells those were, so the children before the first such 
+        cell don't even need to be looked at (unless their claims changed).
         """
+        if self._aligned_cell_alignment != self.cell_alignment:
+            self._aligned_cell_alignment = self.cell_alignment
+            self._aligned_boxes = {}
+
         cell_rects = self._grid.make_cells(self.rect)
-        for i, child in enumerate(self._children):
+        first_row, first_col = self._grid.pop_first_changed_cell()
+        aligned_boxes = self._aligned_boxes
+
+        if not aligned_boxes or first_row == 0 or first_col == 0:
+            first_index = 0
+        else:
+            first_index = self.do_get_index(first_row, first_col)
+
+        first_index = min(first_index, first_not_none((
+                self._first_unaligned_index, first_index)))
+        self._first_unaligned_index = None
+
+        indices = [
+                i for i in map(self._indices.get, self._unaligned_children)
+                if i is not None and i < first_index
+        ]
+        indices += range(first_index, len(self._children))
+        self._unaligned_children = set()
+
+        for i in indices:
+            child = self._children[i]
             box = cell_rects[self.do_get_row_col(i)]
+            claim = child.claimed_size
+            previous_box, previous_claim = aligned_boxes.get(child, (None, None))
+
+            if box is previous_box and claim == previous_claim:
+                continue
+
             align_widget_in_box(child, box, self.cell_alignment)
+            aligned_boxes[child] = box, claim
+
+    def do_detach(self):
+        """
+        Forget which boxes the children were aligned in, because they'll need 
+        to be realigned (and redrawn) if this widget is attached again.
+        """
+        self._aligned_boxes = {}
 
     def do_find_children_near_mouse(self, x, y):
         """
@@ -902,7 +1071,9 @@ class HVBox(Widget):
         The `sizes` argument is a dictionary mapping 1-dimensional child 
         indices to the sizes provided by `add()` (e.g. 0, 'expand', etc).  This 
         information either needs to be applied to the columns (`HBox`) or rows 
-        (`VBox`) of the underlying grid data structure.
+        (`VBox`) of the underlying grid data structure.  Only the indices that 
+        may have changed are included.  A size of None means that the default 
+        size should be used.
         """
         raise NotImplementedError
 
@@ -1005,6 +1176,16 @@ class HVBox(Widget):
         """
         raise NotImplementedError
 
+    def _note_moved_index(self, index):
+        if self._first_moved_index is None or index < self._first_moved_index:
+            self._first_moved_index = index
+
+    def _forget_child(self, child):
+        self._claim_changed_children.discard(child)
+        self._unaligned_children.discard(child)
+        self._indices.pop(child, None)
+        self._aligned_boxes.pop(child, None)
+
 
 @autoprop
 class HBox(HVBox):
@@ -1043,7 +1224,11 @@ class HBox(HVBox):
         return 0, index
 
     def do_set_row_col_sizes(self, sizes):
-        self._grid.col_widths = sizes
+        for col, size in sizes.items():
+            if size is None:
+                self._grid.del_col_width(col)
+            else:
+                self._grid.set_col_width(col, size)
 
     def get_default_cell_size(self):
         return self._grid.default_col_width
@@ -1089,7 +1274,11 @@ class VBox(HVBox):
         return index, 0
 
     def do_set_row_col_sizes(self, sizes):
-        self._grid.row_heights = sizes
+        for row, size in sizes.items():
+            if size is None:
+                self._grid.del_row_height(row)
+            else:
+                self._grid.set_row_height(row, size)
 
     def get_default_cell_size(self):
         return self._grid.default_row_height
@@ -1169,6 +1358,21 @@ class Stack(Widget):
         layer = min(self.layers) - 1 if self.layers else 0
         self.insert(widget, layer)
 
+    def extend(self, widgets):
+        """
+        Add several widgets to the top of the stack at once.
+
+        The widgets are stacked in the order given, so the last one ends up on 
+        top.  This is equivalent to calling `add()` for each widget, except 
+        that the stack is only repacked once, after all the widgets have been 
+        added.
+        """
+        layer = max(self.layers) + 1 if self.layers else 0
+
+        with self.hold_updates():
+            for i, widget in enumerate(widgets):
+                self.insert(widget, layer + i)
+
     def insert(self, widget, layer):
         """
         Insert a widget into the given layer of the stack.
@@ -1236,7 +1440,7 @@ class Stack(Widget):
             child._regroup(self.group)
         else:
             for child, layer in self._children.items():
-                child._regroup(pyglet.graphics.OrderedGroup(layer, self.group))
+                child._regroup(drawing.get_ordered_group(layer, self.group))
 
     def do_find_children_near_mouse(self, x, y):
         """
@@ -1244,9 +1448,16 @@ class Stack(Widget):
 
         If `custom_one_child_gets_mouse` is ``True``, only the first applicable 
         widget will be returned.  Otherwise, all applicable widgets will be 
-        returned.
+        returned.  In either case, the widgets are returned from the 
+        foreground to the background.
         """
-        for child in self.children:
+        # If there's a spatial index, only the children it finds need to be 
+        # sorted by layer.  Otherwise this is every child.
+        candidates = sorted(
+                super().do_find_children_near_mouse(x, y),
+                key=lambda w: self._children[w], reverse=True)
+
+        for child in candidates:
             if child.is_visible and child.is_under_mouse(x, y):
                 yield child
                 if self.one_child_gets_mouse:
@@ -1260,7 +1471,7 @@ class Stack(Widget):
         # Cast to a tuple so that basic indexing operations are supported and 
         # so that the list is immutable.
         return sorted(self._children.keys(),
-                key=lambda x: self._children[x], reverse=True)
+                key=lambda w: self._children[w], reverse=True)
 
     def get_layers(self):
         """
@@ -1315,6 +1526,44 @@ class Deck(Widget):
     Use the `set_state()` method to control which state is currently visible:
 
     >>> d.set_state('over')
+
+    Instead of a widget, a state can be given a factory (i.e. any callable 
+    that takes no arguments and returns a widget, such as a widget class).  
+    The widget for that state is then only made the first time the deck is 
+    set to that state.  This is useful for decks with lots of states that 
+    might never be shown, e.g. the pages of a tabbed panel:
+
+    >>> d = glooey.Deck('general',
+    ...         general=GeneralSettings,
+    ...         advanced=lambda: AdvancedSettings(config),
+    ... )
+
+    Widgets made by factories can also be thrown away again when they haven't 
+    been shown for a while (see `custom_max_hidden_states`).
+    """
+    custom_retain_hidden_states = False
+    """
+    If true, states that have been hidden keep their vertex lists (see 
+    `Widget.hide()`), so switching back to them doesn't allocate anything.  
+    This is a good idea for decks that change state often, like rollover 
+    effects, but it means that every state that has been shown will keep 
+    using video memory.
+    """
+
+    custom_max_hidden_states = None
+    """
+    The number of hidden widgets made by state factories to keep around, or 
+    None to keep all of them.  When there are more than this, the ones that 
+    were shown least recently are removed from the deck, and will be made 
+    again by their factories if they're ever shown again.  Widgets that were 
+    given directly (rather than by a factory) are never removed.
+    """
+
+    custom_claim_current_state_only = False
+    """
+    If true, the deck only claims enough space for the current state.  By 
+    default, the deck claims enough space for the biggest state it has a 
+    widget for, so that changing state never requires a repack.
     """
 
     def __init__(self, initial_state, **states):
@@ -1336,16 +1585,29 @@ class Deck(Widget):
         super().__init__()
         self._current_state = initial_state
         self._previous_state = initial_state
-        self._states = {}
+        self._states = {}           # {state: widget, or None if not made yet}
+        self._factories = {}        # {state: factory}
+        self._recent_states = {}    # made by factories, least recent first
         self.add_states(**states)
 
     def __iter__(self):
-        yield from self._states.items()
+        """
+        Yield the states and widgets that have been made so far.
+        """
+        for state, widget in self._states.items():
+            if widget is not None:
+                yield state, widget
 
     def __getitem__(self, state):
         """
         Get the widget associated with the given state.
+
+        If the state has a factory that hasn't been called yet, it will be 
+        called now.
         """
+        if self._states[state] is None:
+            self._make_state(state)
+            self._repack_and_regroup_children()
         return self._states[state]
 
     def __setitem__(self, state, widget):
@@ -1360,9 +1622,15 @@ class Deck(Widget):
         """
         Claim enough space for the biggest child.
 
-        This eliminates the need to repack when changing state.
+        This eliminates the need to repack when changing state.  If 
+        `custom_claim_current_state_only` is true, only claim enough space for 
+        the current state instead.
         """
-        return claim_stacked_widgets(*self._states.values())
+        return claim_stacked_widgets(*self._yield_claimed_widgets())
+
+    def do_resize_children(self):
+        for widget in self._yield_claimed_widgets():
+            widget._resize(self.rect)
 
     def add_state(self, state, widget):
         """
@@ -1373,6 +1641,9 @@ class Deck(Widget):
         its claim and its alignment.  Typically every widget in the deck will 
         be the same size, to allow for smooth transitions between states.  If 
         the given state already exists, it will be overwritten without error.
+
+        The widget can also be a factory that makes the widget the first time 
+        it's needed (see `Deck`).
         """
         self._remove_state(state)
         self._add_state(state, widget)
@@ -1466,17 +1737,66 @@ class Deck(Widget):
         self.remove_states(*self.known_states)
 
     def _add_state(self, state, widget):
+        if _is_widget_factory(widget):
+            self._states[state] = None
+            self._factories[state] = widget
+            if state == self.state:
+                self._make_state(state)
+            return
+
         widget.unhide() if state == self.state else widget.hide()
         self._states[state] = widget
         self._attach_child(widget)
 
     def _remove_state(self, state):
         if state in self._states:
+            widget = self._states.pop(state)
+            self._factories.pop(state, None)
+            self._recent_states.pop(state, None)
+
+            if widget is not None:
+                self._detach_child(widget)
+                # Unhide the child so it'll show up if the user tries to 
+                # reattach it somewhere else.
+                widget.unhide(draw=False)
+
+    def _make_state(self, state):
+        widget = self._factories[state]()
+        widget.unhide() if state == self.state else widget.hide()
+        self._states[state] = widget
+        self._recent_states[state] = None
+        self._attach_child(widget)
+
+    def _evict_states(self):
+        """
+        Remove the least recently shown widgets made by factories, if there 
+        are more than `custom_max_hidden_states` of them.  Return true if any 
+        widgets were removed.
+        """
+        max_states = self.custom_max_hidden_states
+        if max_states is None:
+            return False
+
+        hidden_states = [
+                x for x in self._recent_states
+                if x != self._current_state
+        ]
+        evicted_states = hidden_states[:max(len(hidden_states) - max_states, 0)]
+
+        for state in evicted_states:
             self._detach_child(self._states[state])
-            # Unhide the child so it'll show up if the user tries to reattach 
-            # it somewhere else.
-            self._states[state].unhide(draw=False)
-            del self._states[state]
+            self._states[state] = None
+            del self._recent_states[state]
+
+        return bool(evicted_states)
+
+    def _yield_claimed_widgets(self):
+        if self.custom_claim_current_state_only:
+            widget = self._states.get(self._current_state)
+            if widget is not None:
+                yield widget
+        else:
+            yield from (x for x in self._states.values() if x is not None)
 
     def get_state(self):
         """
@@ -1497,13 +1817,30 @@ class Deck(Widget):
         self._current_state = new_state
 
         if self._current_state != self._previous_state:
-            self._states[self._current_state].unhide()
+            is_new_widget = self._states[self._current_state] is None
+
+            if is_new_widget:
+                self._make_state(self._current_state)
+            else:
+                self._states[self._current_state].unhide()
+
+            if self._current_state in self._recent_states:
+                del self._recent_states[self._current_state]
+                self._recent_states[self._current_state] = None
 
             # The previous state could've been removed since the state was last 
             # changed.  In this case it will have already been hidden, so we 
-            # don't need to do anything.
-            try: self._states[self._previous_state].hide()
-            except KeyError: pass
+            # don't need to do anything.  It also might never have been made.
+            previous_widget = self._states.get(self._previous_state)
+            if previous_widget is not None:
+                previous_widget.hide(retain=self.custom_retain_hidden_states)
+
+            is_widget_evicted = self._evict_states()
+
+            if is_new_widget or is_widget_evicted:
+                self._repack_and_regroup_children()
+            elif self.custom_claim_current_state_only:
+                self._repack()
 
     def set_state_if_known(self, new_state):
         """
@@ -1516,6 +1853,9 @@ class Deck(Widget):
     def get_widget(self, state):
         """
         Return the widget associated with the given state.
+
+        If the state has a factory that hasn't been called yet, it will be 
+        called now.
         """
         return self[state]
 
@@ -1535,6 +1875,10 @@ class Deck(Widget):
         return self._states.keys()
 
 
+def _is_widget_factory(obj):
+    return callable(obj) and not isinstance(obj, Widget)
+
+
 @autoprop
 class Board(Widget):
     """
@@ -1575,6 +1919,34 @@ class Board(Widget):
         self._pins[widget] = pin
         self._repack_and_regroup_children()
 
+    def add_many(self, widgets):
+        """
+        Add several widgets to the board at once.
+
+        The ``widgets`` argument should be a dictionary mapping widgets to 
+        dictionaries of the keyword arguments that would be passed to `add()`, 
+        or an iterable of (widget, kwargs) pairs.  The board is only repacked 
+        once, after all the widgets have been added.
+
+        Example:
+
+        >>> board.add_many({
+        ...     w1: dict(left=10, top=10),
+        ...     w2: dict(center_percent=(0.5, 0.5)),
+        ... })
+        """
+        # Make all the pins first, so that an invalid pin doesn't leave the 
+        # board half-filled.
+        pins = {
+                widget: self._make_pin(kwargs)
+                for widget, kwargs in dict(widgets).items()
+        }
+        with self.hold_updates():
+            for widget, pin in pins.items():
+                self._attach_child(widget)
+                self._pins[widget] = pin
+                self._repack_and_regroup_children()
+
     def move(self, widget, **kwargs):
         self._pins[widget] = self._make_pin(kwargs)
         self._repack_and_regroup_children()
@@ -1657,7 +2029,7 @@ class Board(Widget):
     def do_regroup_children(self):
         for child, pin in self._pins.items():
             if 'layer' in pin:
-                group = pyglet.graphics.OrderedGroup(pin['layer'], self.group)
+                group = drawing.get_ordered_group(pin['layer'], self.group)
             else:
                 group = self.group
 
@@ -4,3 +4,5 @@ from .artists import *
 from .stencil import *
 from .alignment import *
 from .grid import *
+from .spatial import *
+from .groups import *
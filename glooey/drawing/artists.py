@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import math
 import pyglet
+import weakref
 import autoprop
 from vecrec import Vector, Rect
 from collections import defaultdict
@@ -8,19 +10,35 @@ from pyglet.gl import *
 from glooey.helpers import *
 from glooey.drawing.grid import Grid
 from glooey.drawing.color import Color
+from glooey.drawing.groups import get_ordered_group, get_sprite_group
+
+# NumPy is optional.  If it's installed, `RectangleArray` uses it to compute 
+# the vertices for all of its rectangles at once, and writes them straight 
+# into the vertex list.  Otherwise a python loop is used instead.
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 @autoprop
 class Artist(HoldUpdatesMixin):
 
-    def __init__(self, batch, group, count, mode, data, hidden=False):
+    def __init__(self, batch, group, count, mode, data, hidden=False, 
+            pool=None):
         super().__init__()
         self._batch = batch
         self._group = group
         self._count = count
         self._mode = mode
         self._data = data
+        self._pool = pool
         self._vertex_list = None
 
+        # Artists in a pool keep their slot when they're hidden, so they can be 
+        # shown again without asking the pool for a new one.  Other artists 
+        # only do this if they're asked to (see `hide()`).
+        self._hidden_vertex_list = None
+
         if batch and not hidden:
             self._create_vertex_list()
             self._update_vertex_list()
@@ -30,9 +48,19 @@ class Artist(HoldUpdatesMixin):
 
     def set_batch(self, new_batch):
         if self._batch is not new_batch:
-            if self._batch is not None:
+            if self._pool is not None:
+                self._batch = new_batch
+                self._replace_vertex_list()
+                return
+
+            vertex_list = self._vertex_list or self._hidden_vertex_list
+            if self._batch is not None and vertex_list is not None:
                 self._batch.migrate(
-                        self._vertex_list, self._mode, self._group, new_batch)
+                        vertex_list,
+                        self._mode,
+                        self._group_factory(self._group),
+                        new_batch,
+                )
             self._batch = new_batch
 
     def get_group(self):
@@ -52,23 +80,84 @@ class Artist(HoldUpdatesMixin):
     def get_vertex_list(self):
         return self._vertex_list
 
-    def hide(self):
+    def get_pool(self):
+        return self._pool
+
+    def hide(self, retain=False):
+        """
+        Stop drawing the artist.
+
+        Normally this deletes the artist's vertex list.  If ``retain`` is true 
+        (or if the artist is in a pool), the vertex list is instead made 
+        degenerate, i.e. every vertex is moved to the same point, and kept so 
+        that `show()` can use it again without allocating anything.
+        """
         if self._vertex_list:
-            self._vertex_list.delete()
+            if self._pool is None and not retain:
+                self._vertex_list.delete()
+            else:
+                self._degenerate_vertex_list()
+                self._hidden_vertex_list = self._vertex_list
             self._vertex_list = None
 
     def show(self):
         if not self._vertex_list:
-            self._create_vertex_list()
+            if self._hidden_vertex_list:
+                self._vertex_list = self._hidden_vertex_list
+                self._hidden_vertex_list = None
+
+                # Some artists can change how many vertices they need while 
+                # they're hidden.
+                if self._pool is None and \
+                        self._vertex_list.get_size() != self._count:
+                    self._vertex_list.resize(self._count)
+            else:
+                self._create_vertex_list()
             self._update_vertex_list()
 
+    def delete(self):
+        """
+        Remove the artist from its batch.
+
+        This is like `hide()`, except that an artist in a pool gives its slot 
+        back to the pool instead of keeping it to be shown again.
+        """
+        self.hide()
+
+        if self._hidden_vertex_list:
+            self._hidden_vertex_list.delete()
+            self._hidden_vertex_list = None
+
     def _create_vertex_list(self):
-        self._vertex_list = self._batch.add(
+        add = self._batch.add if self._pool is None else \
+                lambda *args: self._pool.add(self._batch, *args)
+
+        self._vertex_list = add(
                 self._count,
                 self._mode,
                 self._group_factory(self._group),
                 *self._data)
 
+    def _replace_vertex_list(self):
+        # Slots can't be moved between the vertex lists of a pool, so a new 
+        # slot is needed whenever the batch or the group changes.
+        if self._hidden_vertex_list:
+            self._hidden_vertex_list.delete()
+            self._hidden_vertex_list = None
+
+        if self._vertex_list:
+            self._vertex_list.delete()
+            self._create_vertex_list()
+            self._update_vertex_list()
+
+    def _degenerate_vertex_list(self):
+        if self._pool is not None:
+            self._vertex_list.degenerate()
+        else:
+            vertices = self._vertex_list.domain.attribute_names['vertices']
+            self._vertex_list.vertices[:] = \
+                    [0] * (vertices.count * self._vertex_list.get_size())
+
     def _update_vertex_list(self):
         raise NotImplementedError
 
@@ -77,9 +166,14 @@ class Artist(HoldUpdatesMixin):
 
     @update_function
     def _update_group(self):
-        if self._vertex_list is not None:
+        if self._pool is not None:
+            self._replace_vertex_list()
+            return
+
+        vertex_list = self._vertex_list or self._hidden_vertex_list
+        if vertex_list is not None:
             self._batch.migrate(
-                    self._vertex_list,
+                    vertex_list,
                     self._mode,
                     self._group_factory(self._group),
                     self._batch,
@@ -90,13 +184,13 @@ class Artist(HoldUpdatesMixin):
 class Rectangle(Artist):
 
     def __init__(self, rect=None, color='green', *,
-            batch=None, group=None, usage='static', hidden=False):
+            batch=None, group=None, usage='static', hidden=False, pool=None):
 
         self._rect = rect or Rect.null()
         self._color = Color.from_anything(color)
 
         data = 'v2f/' + usage, 'c4B/' + usage
-        super().__init__(batch, group, 4, GL_QUADS, data, hidden)
+        super().__init__(batch, group, 4, GL_QUADS, data, hidden, pool)
 
     def get_rect(self):
         return self._rect
@@ -111,11 +205,13 @@ class Rectangle(Artist):
         change to its rectangle.
         """
         if self.vertex_list:
+            left, bottom = self._rect.left, self._rect.bottom
+            right, top = self._rect.right, self._rect.top
             self.vertex_list.vertices = (
-                    self._rect.bottom_left.tuple +
-                    self._rect.bottom_right.tuple +
-                    self._rect.top_right.tuple +
-                    self._rect.top_left.tuple
+                    left, bottom,
+                    right, bottom,
+                    right, top,
+                    left, top,
             )
 
     def get_color(self):
@@ -138,13 +234,13 @@ class Rectangle(Artist):
 class Outline(Artist):
 
     def __init__(self, rect=None, color='green', *,
-            batch=None, group=None, usage='static', hidden=False):
+            batch=None, group=None, usage='static', hidden=False, pool=None):
 
         self._rect = rect or Rect.null()
         self._color = Color.from_anything(color)
 
         data = 'v2f/' + usage, 'c4B/' + usage
-        super().__init__(batch, group, 8, GL_LINES, data, hidden)
+        super().__init__(batch, group, 8, GL_LINES, data, hidden, pool)
 
     def get_rect(self):
         return self._rect
@@ -164,18 +260,19 @@ class Outline(Artist):
             # widget rect is always rounded to the nearest pixel, but OpenGL 
             # doesn't seem deterministic about which side of the pixel it draws 
             # the line on.)
-            rect = self._rect.get_shrunk(0.5)
+            left, bottom = self._rect.left + 0.5, self._rect.bottom + 0.5
+            right, top = self._rect.right - 0.5, self._rect.top - 0.5
             self.vertex_list.vertices = (
-                    rect.bottom_left.tuple +
+                    left, bottom,
                     # Don't know why this offset is necessary, but without it 
                     # the bottom-right pixel doesn't get filled in...
-                    (rect.bottom_right + (1,0)).tuple +
-                    rect.bottom_right.tuple +
-                    rect.top_right.tuple +
-                    rect.top_right.tuple +
-                    rect.top_left.tuple +
-                    rect.top_left.tuple +
-                    rect.bottom_left.tuple
+                    right + 1, bottom,
+                    right, bottom,
+                    right, top,
+                    right, top,
+                    left, top,
+                    left, top,
+                    left, bottom,
             )
 
     def get_color(self):
@@ -194,6 +291,160 @@ class Outline(Artist):
         self.update_color()
 
 
+@autoprop
+class RectangleArray(Artist):
+    """
+    Draw lots of colored rectangles (e.g. a heatmap, a minimap, or a debug 
+    overlay) with a single vertex list.
+
+    Making thousands of `Rectangle` artists works, but each one has to be 
+    created and updated separately, and each update builds a tuple of 
+    vertices in python.  This artist instead takes every rectangle at once, as 
+    an N×4 array (e.g. a numpy array or a list of tuples) of left, bottom, 
+    width and height values.  The colors can either be a single color for 
+    every rectangle, or an N×4 array of RGBA values between 0 and 255.  If 
+    numpy is installed, the vertices and colors are computed for all the 
+    rectangles at once and written straight into the vertex list.
+
+    Use `set_rect()` and `set_color()` to change just one rectangle.
+    """
+
+    def __init__(self, rects=None, colors='green', *,
+            batch=None, group=None, usage='dynamic', hidden=False):
+
+        self._rects = rects if rects is not None else []
+        self._colors = colors
+
+        # Static attributes are interleaved by pyglet, which would prevent 
+        # numpy from writing to them directly.
+        data = 'v2f/' + usage, 'c4B/' + usage
+        count = 4 * len(self._rects)
+        super().__init__(batch, group, count, GL_QUADS, data, hidden)
+
+    def get_rects(self):
+        return self._rects
+
+    def set_rects(self, new_rects, new_colors=None):
+        """
+        Replace every rectangle, and optionally every color.  The number of 
+        rectangles can change.
+        """
+        self._rects = new_rects
+        if new_colors is not None:
+            self._colors = new_colors
+
+        count = 4 * len(new_rects)
+        if count != self._count:
+            self._count = count
+            if self._vertex_list:
+                self._vertex_list.resize(count)
+
+        self._update_vertex_list()
+
+    def update_rects(self):
+        """
+        Call this method to update the vertex list after you've made an 
+        in-place change to the rects array.
+        """
+        if self._vertex_list:
+            _write_rect_vertices(self._vertex_list.vertices, self._rects)
+
+    def set_rect(self, i, new_rect):
+        """
+        Move the i-th rectangle.  The rect can be a vecrec `Rect` or a tuple of 
+        left, bottom, width and height values.
+        """
+        if isinstance(new_rect, Rect):
+            new_rect = new_rect.tuple
+
+        self._rects[i] = new_rect
+
+        if self._vertex_list:
+            left, bottom, width, height = new_rect
+            right, top = left + width, bottom + height
+            self._vertex_list.vertices[8*i:8*i+8] = (
+                    left, bottom,
+                    right, bottom,
+                    right, top,
+                    left, top,
+            )
+
+    def get_colors(self):
+        return self._colors
+
+    def set_colors(self, new_colors):
+        self._colors = new_colors
+        self.update_colors()
+
+    def update_colors(self):
+        """
+        Call this method to update the vertex list after you've made an 
+        in-place change to the colors array.
+        """
+        if self._vertex_list:
+            _write_rect_colors(
+                    self._vertex_list.colors, self._colors, len(self._rects))
+
+    def set_color(self, i, new_color):
+        """
+        Change the color of the i-th rectangle.
+        """
+        if _is_single_color(self._colors):
+            raise UsageError("can't change the color of one rectangle when every rectangle has the same color; set the colors to an N×4 array first.")
+
+        color = Color.from_anything(new_color).tuple
+        self._colors[i] = color
+
+        if self._vertex_list:
+            self._vertex_list.colors[16*i:16*i+16] = 4 * color
+
+    def _update_vertex_list(self):
+        self.update_rects()
+        self.update_colors()
+
+
+def _is_single_color(colors):
+    if isinstance(colors, (str, Color)):
+        return True
+    if numpy is not None and isinstance(colors, numpy.ndarray):
+        return colors.ndim == 1
+    return len(colors) in (3, 4) and isinstance(colors[0], (int, float))
+
+def _write_rect_vertices(vertices, rects):
+    if numpy is not None:
+        rects = numpy.asarray(rects, dtype=float).reshape(-1, 4)
+        left, bottom = rects[:,0], rects[:,1]
+        right, top = left + rects[:,2], bottom + rects[:,3]
+
+        out = numpy.ctypeslib.as_array(vertices).reshape(-1, 8)
+        out[:,0] = left;  out[:,1] = bottom
+        out[:,2] = right; out[:,3] = bottom
+        out[:,4] = right; out[:,5] = top
+        out[:,6] = left;  out[:,7] = top
+
+    else:
+        values = []
+        for left, bottom, width, height in rects:
+            right, top = left + width, bottom + height
+            values += left, bottom, right, bottom, right, top, left, top
+        vertices[:] = values
+
+def _write_rect_colors(colors, rect_colors, num_rects):
+    if _is_single_color(rect_colors):
+        colors[:] = 4 * num_rects * Color.from_anything(rect_colors).tuple
+
+    elif numpy is not None:
+        rect_colors = numpy.asarray(rect_colors, dtype=numpy.uint8)
+        out = numpy.ctypeslib.as_array(colors).reshape(-1, 4, 4)
+        out[:] = rect_colors.reshape(-1, 1, 4)
+
+    else:
+        values = []
+        for color in rect_colors:
+            values += 4 * tuple(color)
+        colors[:] = values
+
+
 @autoprop
 class Tile(Artist):
 
@@ -295,10 +546,10 @@ class Tile(Artist):
         # vertices.  The in-line diagram shows which vertex is represented by 
         # each variable in the case that the image hasn't been rotated.
 
-        a = Vector(*texture.tex_coords[0:2])     #   D┌───┐C
-        b = Vector(*texture.tex_coords[3:5])     #    │   │
-        c = Vector(*texture.tex_coords[6:8])     #    │   │
-        d = Vector(*texture.tex_coords[9:11])    #   A└───┘B
+        ax, ay = texture.tex_coords[0:2]         #   D┌───┐C
+        bx, by = texture.tex_coords[3:5]         #    │   │
+        cx, cy = texture.tex_coords[6:8]         #    │   │
+        dx, dy = texture.tex_coords[9:11]        #   A└───┘B
 
         # Give a really nice error message if the image can't be tiled, because 
         # the restrictions on which images can be tiled don't make sense unless 
@@ -325,30 +576,40 @@ avoids this logic at the expense of less well-organized memory."""
                 raise UsageError(error_template.format('horizontally', 'narrower', self._image.width, underlying_texture.width))
             w = self._rect.width / self._image.width
         else:
-            w = a.get_distance(b)
+            w = math.hypot(bx - ax, by - ay)
 
         if self._vtile:
             if self._image.height != underlying_texture.height:
                 raise UsageError(error_template.format('vertically', 'shorter', self._image.height, underlying_texture.height))
             h = self._rect.height / self._image.height
         else:
-            h = a.get_distance(d)
+            h = math.hypot(dx - ax, dy - ay)
 
-        A = a
-        B = a + (b - a).get_scaled(w)
-        C = a + (c - d).get_scaled(w) + (c - b).get_scaled(h)
-        D = a                         + (d - a).get_scaled(h)
+        # This is called every time the tile is shown, so do the vector math 
+        # with plain floats rather than `vecrec.Vector` objects.
+        abx, aby = _get_scaled(bx - ax, by - ay, w)
+        dcx, dcy = _get_scaled(cx - dx, cy - dy, w)
+        bcx, bcy = _get_scaled(cx - bx, cy - by, h)
+        adx, ady = _get_scaled(dx - ax, dy - ay, h)
 
-        self._vertex_list.tex_coords = A.tuple + B.tuple + C.tuple + D.tuple
+        A = ax, ay
+        B = ax + abx, ay + aby
+        C = ax + dcx + bcx, ay + dcy + bcy
+        D = ax + adx, ay + ady
+
+        left, bottom = self._rect.left, self._rect.bottom
+        right, top = self._rect.right, self._rect.top
+
+        self._vertex_list.tex_coords = A + B + C + D
         self._vertex_list.vertices = (
-                self._rect.bottom_left.tuple +
-                self._rect.bottom_right.tuple +
-                self._rect.top_right.tuple +
-                self._rect.top_left.tuple
+                left, bottom,
+                right, bottom,
+                right, top,
+                left, top,
         )
 
     def _group_factory(self, parent):
-        return pyglet.sprite.SpriteGroup(
+        return get_sprite_group(
                 self._image.get_texture(),
                 self._blend_src,
                 self._blend_dest,
@@ -356,6 +617,308 @@ avoids this logic at the expense of less well-organized memory."""
         )
 
 
+def _get_scaled(x, y, length):
+    """
+    Return the given vector scaled to the given length.
+    """
+    if length == 0:
+        return 0, 0
+    norm = math.hypot(x, y)
+    return x * length / norm, y * length / norm
+
+
+@autoprop
+class _SharedTextureTiles(Artist):
+    """
+    Draw several images from the same texture with one vertex list.
+
+    `Background` uses this artist instead of a `Tile` for each image when all 
+    of its images come from the same texture (e.g. an atlas), so that a 
+    9-slice background only costs one vertex list and one group.  Images that 
+    need to tile are repeated with extra quads rather than by making OpenGL 
+    wrap the texture, which wouldn't work for images in an atlas anyway.
+
+    The tiles are given as a list of ``(rect, image, htile, vtile)`` tuples.
+    """
+
+    def __init__(self, tiles, *, blend_src=GL_SRC_ALPHA, 
+            blend_dest=GL_ONE_MINUS_SRC_ALPHA, batch=None, group=None, 
+            usage='static', hidden=False):
+
+        self._tiles = tiles
+        self._texture = tiles[0][1].get_texture()
+        self._blend_src = blend_src
+        self._blend_dest = blend_dest
+        self._vertices, self._tex_coords = _make_tile_quads(tiles)
+
+        data = 'v2f/' + usage, 't3f/' + usage
+        count = len(self._vertices) // 2
+        super().__init__(batch, group, count, GL_QUADS, data, hidden)
+
+    def get_tiles(self):
+        return self._tiles
+
+    def set_tiles(self, new_tiles):
+        texture = new_tiles[0][1].get_texture()
+        is_new_texture = texture.id != self._texture.id
+
+        self._tiles = new_tiles
+        self._texture = texture
+        self._vertices, self._tex_coords = _make_tile_quads(new_tiles)
+
+        count = len(self._vertices) // 2
+        if count != self._count:
+            self._count = count
+            if self._vertex_list:
+                self._vertex_list.resize(count)
+
+        if is_new_texture:
+            self._update_group()
+
+        self._update_vertex_list()
+
+    @update_function
+    def _update_vertex_list(self):
+        if self._vertex_list is None:
+            return
+
+        self._vertex_list.vertices[:] = self._vertices
+        self._vertex_list.tex_coords[:] = self._tex_coords
+
+    def _group_factory(self, parent):
+        return get_sprite_group(
+                self._texture,
+                self._blend_src,
+                self._blend_dest,
+                parent=parent,
+        )
+
+
+def _make_tile_quads(tiles):
+    """
+    Return the vertices and texture coordinates needed to draw the given 
+    ``(rect, image, htile, vtile)`` tiles as quads.
+    """
+    vertices = []
+    tex_coords = []
+
+    for rect, image, htile, vtile in tiles:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+
+        # The corners of the image in the texture.  Images can be rotated by 
+        # changing which texture coordinates go with which corner, so use 
+        # vectors to go from the bottom left corner (A) to the bottom right (B) 
+        # and top left (D) corners.  See `Tile._update_vertex_list()`.
+        coords = image.get_texture().tex_coords
+        au, av, r = coords[0:3]
+        bu, bv = coords[3:5]
+        du, dv = coords[9:11]
+        abu, abv = bu - au, bv - av
+        adu, adv = du - au, dv - av
+
+        # Tiled images are repeated as many times as it takes to fill the 
+        # rect, and the last repetition is cut short.  Images that don't tile 
+        # are stretched to fill the rect.
+        width = image.width if htile else rect.width
+        height = image.height if vtile else rect.height
+        cols = math.ceil(round(rect.width / width, 6))
+        rows = math.ceil(round(rect.height / height, 6))
+
+        for j in range(cols):
+            left = rect.left + j * width
+            right = min(left + width, rect.right)
+            fx = (right - left) / width
+
+            for i in range(rows):
+                bottom = rect.bottom + i * height
+                top = min(bottom + height, rect.top)
+                fy = (top - bottom) / height
+
+                vertices += (
+                        left, bottom,
+                        right, bottom,
+                        right, top,
+                        left, top,
+                )
+                tex_coords += (
+                        au, av, r,
+                        au + fx * abu, av + fx * abv, r,
+                        au + fx * abu + fy * adu, av + fx * abv + fy * adv, r,
+                        au + fy * adu, av + fy * adv, r,
+                )
+
+    return vertices, tex_coords
+
+
+@autoprop
+class ArtistPool:
+    """
+    Give out small, fixed-size slots from a few big vertex lists, so that 
+    lots of small artists don't each need a vertex list of their own.
+
+    Normally every `Rectangle` or `Outline` adds its own 4- or 8-vertex list 
+    to the batch, and deletes it when it's hidden.  With thousands of them 
+    (e.g. placeholders, colored backgrounds, or debug overlays), that's a lot 
+    of tiny allocations in pyglet's vertex domains.  A pool instead adds one 
+    vertex list with room for `block_size` slots at a time, for each 
+    combination of batch, group, mode, size and vertex format.  A slot that's 
+    hidden or deleted is made degenerate (i.e. every vertex is moved to the 
+    origin, so nothing is drawn), and deleted slots are given out again before 
+    any new vertex lists are added.
+
+    To use a pool, pass it to an artist (e.g. ``Rectangle(..., 
+    pool=drawing.default_pool)``), or use `add()` in place of 
+    `pyglet.graphics.Batch.add()`.  The slots behave like vertex lists with 
+    ``vertices``, ``colors`` and ``tex_coords`` attributes, but they can't be 
+    migrated to a different batch or group.
+    """
+
+    def __init__(self, block_size=64):
+        self._block_size = block_size
+
+        # The blocks are grouped by batch, so that the pool doesn't keep 
+        # batches that aren't being used anymore alive.
+        self._blocks = weakref.WeakKeyDictionary()  # {batch: {key: _Blocks}}
+
+    def add(self, batch, count, mode, group, *data):
+        """
+        Return a slot with room for the given number of vertices.
+
+        The arguments are the same as for `pyglet.graphics.Batch.add()`, except 
+        that the batch comes first.
+        """
+        key = count, mode, group, data
+
+        try:
+            blocks = self._blocks[batch][key]
+        except KeyError:
+            blocks = self._blocks.setdefault(batch, {})[key] = \
+                    _PoolBlocks(count, mode, group, data)
+
+        if not blocks.free_slots:
+            blocks.add_block(batch, self._block_size)
+
+        return blocks.free_slots.pop()
+
+    def get_block_size(self):
+        return self._block_size
+
+    def get_num_vertex_lists(self):
+        """
+        Return the number of vertex lists that have been added to batches by 
+        this pool.
+        """
+        return sum(
+                len(blocks.vertex_lists)
+                for blocks_by_key in self._blocks.values()
+                for blocks in blocks_by_key.values()
+        )
+
+
+class _PoolBlocks:
+
+    # The batch isn't stored here, because the pool uses it as a weak key and 
+    # this object would keep it alive.
+
+    def __init__(self, count, mode, group, data):
+        self.count = count
+        self.mode = mode
+        self.group = group
+        self.data = data
+        self.vertex_lists = []
+        self.free_slots = []
+
+        # The number of values each vertex has for each attribute, e.g. 2 for 
+        # ``vertices`` if the format is 'v2f'.
+        self.sizes = {
+                attribute.plural: attribute.count
+                for attribute in map(
+                    pyglet.graphics.vertexattribute.create_attribute, data)
+        }
+
+    def add_block(self, batch, num_slots):
+        vertex_list = batch.add(
+                self.count * num_slots, self.mode, self.group, *self.data)
+
+        # Pyglet doesn't initialize the memory it gives out, so make every slot 
+        # degenerate until it's used.
+        n = self.sizes['vertices'] * self.count * num_slots
+        vertex_list.vertices[:] = [0] * n
+
+        self.vertex_lists.append(vertex_list)
+        self.free_slots.extend(
+                _PooledVertexList(self, vertex_list, i * self.count)
+                for i in reversed(range(num_slots))
+        )
+
+
+@autoprop
+class _PooledVertexList:
+    """
+    A slot in one of the vertex lists of an `ArtistPool`.
+    """
+
+    def __init__(self, blocks, vertex_list, start):
+        self._blocks = blocks
+        self._vertex_list = vertex_list
+        self._start = start
+        self._is_deleted = False
+
+    def get_size(self):
+        return self._blocks.count
+
+    def get_vertices(self):
+        return self._get('vertices')
+
+    def set_vertices(self, values):
+        self._set('vertices', values)
+
+    def get_colors(self):
+        return self._get('colors')
+
+    def set_colors(self, values):
+        self._set('colors', values)
+
+    def get_tex_coords(self):
+        return self._get('tex_coords')
+
+    def set_tex_coords(self, values):
+        self._set('tex_coords', values)
+
+    def degenerate(self):
+        """
+        Stop drawing this slot, without giving it back to the pool.
+        """
+        self.vertices = [0] * (self._blocks.sizes['vertices'] * self.size)
+
+    def delete(self):
+        """
+        Stop drawing this slot and give it back to the pool.
+        """
+        if not self._is_deleted:
+            self.degenerate()
+            self._is_deleted = True
+
+            # Give the pool a new object for the slot, so that this object 
+            # can't delete the slot again after it's been given out again.
+            self._blocks.free_slots.append(
+                    _PooledVertexList(self._blocks, self._vertex_list, self._start))
+
+    def _get(self, attribute):
+        n = self._blocks.sizes[attribute]
+        array = getattr(self._vertex_list, attribute)
+        return array[n * self._start : n * (self._start + self.size)]
+
+    def _set(self, attribute, values):
+        n = self._blocks.sizes[attribute]
+        array = getattr(self._vertex_list, attribute)
+        array[n * self._start : n * (self._start + self.size)] = values
+
+
+default_pool = ArtistPool()
+
+
 @autoprop
 class Background(HoldUpdatesMixin):
     """\
@@ -388,6 +951,7 @@ class Background(HoldUpdatesMixin):
         self._outline_group = None
         self._tile_images = {}
         self._tile_artists = {}
+        self._shared_tile_artist = None
         self._tile_group = None
         self._htile = False
         self._vtile = False
@@ -416,9 +980,9 @@ class Background(HoldUpdatesMixin):
 
     @update_function
     def _update_group(self):
-        self._color_group = pyglet.graphics.OrderedGroup(0, self._group)
-        self._outline_group = pyglet.graphics.OrderedGroup(2, self._group)
-        self._tile_group = pyglet.graphics.OrderedGroup(1, self._group)
+        self._color_group = get_ordered_group(0, self._group)
+        self._outline_group = get_ordered_group(2, self._group)
+        self._tile_group = get_ordered_group(1, self._group)
 
         if self._color_artist:
             self._color_artist.group = self._color_group
@@ -429,6 +993,9 @@ class Background(HoldUpdatesMixin):
         for artist in self._tile_artists.values():
             artist.group = self._tile_group
 
+        if self._shared_tile_artist:
+            self._shared_tile_artist.group = self._tile_group
+
     @update_function
     def _update_tiles(self):
         if self._hidden or self._rect is None or self._batch is None:
@@ -467,9 +1034,10 @@ class Background(HoldUpdatesMixin):
                     color=self._color, 
                     batch=self._batch,
                     group=self._color_group,
+                    pool=default_pool,
             )
         if not have_color and have_artist:
-            self._color_artist.hide()
+            self._color_artist.delete()
             self._color_artist = None
 
         # Draw an outline if the user requested one.
@@ -487,9 +1055,10 @@ class Background(HoldUpdatesMixin):
                     color=self._outline, 
                     batch=self._batch,
                     group=self._outline_group,
+                    pool=default_pool,
             )
         if not have_outline and have_artist:
-            self._outline_artist.hide()
+            self._outline_artist.delete()
             self._outline_artist = None
 
         # Decide which images to tile.
@@ -502,6 +1071,34 @@ class Background(HoldUpdatesMixin):
         for ij in (0,1), (1,1), (2,1):
             htile_flags[ij] = self._htile
 
+        # If every image comes from the same texture (e.g. an atlas), draw them 
+        # all with a single vertex list and a single group.
+
+        if self._is_texture_shared():
+            for artist in self._tile_artists.values():
+                artist.delete()
+            self._tile_artists = {}
+
+            tiles = [
+                    (tile_rects[ij], img, htile_flags[ij], vtile_flags[ij])
+                    for ij, img in sorted(self._tile_images.items())
+            ]
+
+            if self._shared_tile_artist:
+                self._shared_tile_artist.tiles = tiles
+            else:
+                self._shared_tile_artist = _SharedTextureTiles(
+                        tiles,
+                        batch=self._batch,
+                        group=self._tile_group,
+                        usage=self._usage,
+                )
+            return
+
+        if self._shared_tile_artist:
+            self._shared_tile_artist.delete()
+            self._shared_tile_artist = None
+
         # Draw all the images that the user provided.  The logic is a little 
         # complicated to deal with the fact the we might have to add or remove 
         # tile artists.
@@ -530,9 +1127,21 @@ class Background(HoldUpdatesMixin):
                     htile=htile_flags[ij],
             )
         for ij in artists_to_remove:
-            self._tile_artists[ij].hide()
+            self._tile_artists[ij].delete()
             del self._tile_artists[ij]
 
+    def _is_texture_shared(self):
+        # A single image already gets drawn with one vertex list, and might be 
+        # able to tile by making OpenGL wrap its texture, so use a `Tile`.
+        if len(self._tile_images) < 2:
+            return False
+
+        textures = {
+                img.get_texture().id
+                for img in self._tile_images.values()
+        }
+        return len(textures) == 1
+
     def get_rect(self):
         return self._rect
 
@@ -638,6 +1247,10 @@ frame.  The only difference is that, if 'htile' or 'vtile' are set to 'auto'
             self._batch = new_batch
             if self._color_artist:
                 self._color_artist.batch = new_batch
+            if self._outline_artist:
+                self._outline_artist.batch = new_batch
+            if self._shared_tile_artist:
+                self._shared_tile_artist.batch = new_batch
             for artist in self._tile_artists.values():
                 artist.batch = new_batch
 
@@ -655,8 +1268,14 @@ frame.  The only difference is that, if 'htile' or 'vtile' are set to 'auto'
     def set_usage(self, new_usage):
         if self._usage != new_usage:
             self._usage = new_usage
+
+            for artist in self._yield_artists():
+                artist.delete()
+
             self._color_artist = None
+            self._outline_artist = None
             self._tile_artists = {}
+            self._shared_tile_artist = None
             self._update_tiles()
 
     @property
@@ -673,23 +1292,44 @@ frame.  The only difference is that, if 'htile' or 'vtile' are set to 'auto'
     def get_vtile(self):
         return self._vtile
 
-    def hide(self):
-        if self._color_artist:
-            self._color_artist.hide()
-        if self._outline_artist:
-            self._outline_artist.hide()
-        for artist in self._tile_artists.values():
-            artist.hide()
+    def hide(self, retain=False):
+        """
+        Stop drawing the background.
+
+        If ``retain`` is true, the artists making up the background keep their 
+        vertex lists (see `Artist.hide()`), so that `show()` doesn't have to 
+        make new ones.  Otherwise the artists are deleted.
+        """
+        if retain:
+            for artist in self._yield_artists():
+                artist.hide(retain=True)
+
+        else:
+            for artist in self._yield_artists():
+                artist.delete()
+
+            self._color_artist = None
+            self._outline_artist = None
+            self._shared_tile_artist = None
+            self._tile_artists = {}
 
-        self._color_artist = None
-        self._outline_artist = None
-        self._tile_artists = {}
         self._hidden = True
 
     def show(self):
         if self._hidden:
             self._hidden = False
+            for artist in self._yield_artists():
+                artist.show()
             self._update_tiles()
 
+    def _yield_artists(self):
+        if self._color_artist:
+            yield self._color_artist
+        if self._outline_artist:
+            yield self._outline_artist
+        if self._shared_tile_artist:
+            yield self._shared_tile_artist
+        yield from self._tile_artists.values()
+
 
 
@@ -2,59 +2,69 @@
 
 import math
 import autoprop
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Mapping
 from vecrec import Vector, Rect
 from glooey.helpers import *
 
+# NumPy is optional.  If it's installed, the per-row and per-column arrays
+# used by the grid solver are stored as NumPy arrays, so that the offsets of
+# long runs of rows and columns can be recalculated without a python loop.
+# Otherwise the standard library `array` module is used instead.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 @autoprop
 class Grid:
 
     def __init__(self, *, bounding_rect=None, min_cell_rects=None,
             num_rows=0, num_cols=0, padding=None, inner_padding=None, 
             outer_padding=None, row_heights=None, col_widths=None,
-            default_row_height='expand', default_col_width='expand'):
+            default_row_height='expand', default_col_width='expand',
+            sparse=False):
 
         # Attributes that the user can set to affect the shape of the grid.  
+        # The requested number, heights, and widths of the rows and columns are
+        # kept by the axes themselves.
         self._bounding_rect = bounding_rect or Rect.null()
-        self._min_cell_rects = min_cell_rects or {}
-        self._requested_num_rows = num_rows
-        self._requested_num_cols = num_cols
+        self._min_cell_rects = {}
         self._inner_padding = first_not_none((inner_padding, padding, 0))
         self._outer_padding = first_not_none((outer_padding, padding, 0))
-        self._requested_row_heights = row_heights or {}
-        self._requested_col_widths = col_widths or {}
-        self._default_row_height = default_row_height
-        self._default_col_width = default_col_width
+        self._rows = _GridAxis(
+                'row height', 'rows',
+                num_rows, row_heights or {}, default_row_height)
+        self._cols = _GridAxis(
+                'col width', 'columns',
+                num_cols, col_widths or {}, default_col_width)
 
         # Read-only attributes that reflect the current state of the grid.
         self._num_rows = 0
         self._num_cols = 0
-        self._max_cell_heights = {}
-        self._max_cell_widths = {}
-        self._fixed_rows = set()
-        self._expandable_rows = set()
-        self._fixed_cols = set()
-        self._expandable_cols = set()
-        self._fixed_row_heights = {}
-        self._fixed_col_widths = {}
-        self._min_expandable_row_heights = {}
-        self._min_expandable_col_widths = {}
-        self._padding_height = 0
-        self._padding_width = 0
         self._min_height = 0
         self._min_width = 0
-        self._row_heights = {}
-        self._col_widths = {}
-        self._width = 0
-        self._height = 0
-        self._row_tops = {}
-        self._col_lefts = {}
-        self._cell_rects = {}
+        self._sparse = sparse
+        self._cell_rects = CellRects(self) if sparse else {}
+
+        # The top-left corner of the bounding rect and the number of rows and
+        # columns that the cell rects were last calculated for.  If the corner
+        # moves, every cell rect has to move too.
+        self._cell_origin = None
+        self._cell_shape = 0, 0
+
+        # The first row and column that may have changed since the last call 
+        # to `pop_first_changed_cell()`.
+        self._first_changed_cell = 0, 0
 
         # Attributes that manage the cache.
-        self._is_shape_stale = True
         self._is_claim_stale = True
         self._are_cells_stale = True
 
+        self.set_min_cell_rects(min_cell_rects or {})
+
     def make_claim(self, min_cell_rects=None):
         if min_cell_rects is not None:
             self.min_cell_rects = min_cell_rects
@@ -84,35 +94,83 @@ class Grid:
         # cells.  In practice, the algorithm will identify the top-left-most 
         # cell first and return it.  So the algorithm isn't really ambiguous, 
         # but it is more dependent on what's really an implementation detail.
+        #
+        # Both searches are binary searches over the sorted cell boundaries 
+        # calculated by _GridAxis.update_layout().  In each case, the first
+        # cell that ends past the mouse is found, then the mouse is checked
+        # against the start of that cell (it could be in the padding between
+        # two cells).  Like the inclusive comparisons, this favors the
+        # top-left-most cell when the mouse is exactly between two cells.
+
+        if self._cell_origin is None:
+            return None
+
+        left, top = self._cell_origin
 
         # Find the row the mouse is over.
-        for i in range(self._num_rows):
-            row_top = self._row_tops[i]
-            row_bottom = row_top - self._row_heights[i]
-            if row_top >= y >= row_bottom:
-                break
-        else:
+        i = self._rows.find_line(top - y)
+        if i is None:
             return None
 
         # Find the col the mouse is over.
-        for j in range(self._num_cols):
-            col_left = self._col_lefts[j]
-            col_right = col_left + self._col_widths[j]
-            if col_left <= x <= col_right:
-                break
-        else:
+        j = self._cols.find_line(x - left)
+        if j is None:
             return None
 
         return i, j
 
+    def find_cells_in_rect(self, rect):
+        """
+        Return the ranges of rows and columns with cells that overlap the 
+        given rect.
+
+        Like `find_cell_under_mouse()`, this is a binary search over the cell 
+        boundaries, so it doesn't matter how many cells there are.  Cells that 
+        just touch the edge of the rect don't count as overlapping it.
+        """
+        if self._cell_origin is None:
+            return range(0), range(0)
+
+        left, top = self._cell_origin
+        rows = self._rows.find_lines(top - rect.top, top - rect.bottom)
+        cols = self._cols.find_lines(rect.left - left, rect.right - left)
+        return rows, cols
+
+    def pop_first_changed_cell(self):
+        """
+        Return the row and column of the first cell that may have moved or 
+        changed size since the last time this method was called.
+
+        Every cell in or below the returned row, or in or right of the returned 
+        column, may have changed.  The cells above and left of it are exactly 
+        the same as they were (including being the same objects, unless the 
+        grid is sparse).  This is meant for callers that want to skip cells 
+        that haven't changed, so call `make_cells()` first.
+        """
+        cell = self._first_changed_cell
+        self._first_changed_cell = self._num_rows, self._num_cols
+        return cell
+
+    def get_cell_rect(self, i, j):
+        """
+        Return the rect of the given cell.
+
+        Unlike looking the cell up in `cell_rects`, the rect is made from 
+        scratch each time and isn't cached.  This is useful for callers that 
+        visit lots of different cells in a big sparse grid, and don't want to 
+        keep a rect for each one.
+        """
+        self._update_cells()
+        return self._make_cell_rect(i, j)
+
     def get_width(self):
-        return self._width
+        return self._cols.total
 
     def get_height(self):
-        return self._height
+        return self._rows.total
 
     def get_rect(self):
-        return Rect.from_size(self._width, self._height)
+        return Rect.from_size(self.width, self.height)
 
     def get_min_width(self):
         return self._min_width
@@ -130,6 +188,17 @@ class Grid:
 
     cell_rects = property(get_cell_rects)
 
+    def get_sparse(self):
+        return self._sparse
+
+    def set_sparse(self, new_sparse):
+        if self._sparse != new_sparse:
+            self._sparse = new_sparse
+            self._cell_rects = CellRects(self) if new_sparse else {}
+            self._cell_origin = None
+            self._cell_shape = 0, 0
+            self._invalidate_cells()
+
     def get_bounding_rect(self):
         return self._bounding_rect
 
@@ -145,39 +214,64 @@ class Grid:
         if (i,j) not in self._min_cell_rects or \
                 self._min_cell_rects[i,j] != new_rect:
             self._min_cell_rects[i,j] = new_rect
-            self._invalidate_shape()
+            self._rows.set_cell_size(i, j, new_rect.height)
+            self._cols.set_cell_size(j, i, new_rect.width)
+            self._invalidate_claim()
 
     def del_min_cell_rect(self, i, j):
         if (i,j) in self._min_cell_rects:
             del self._min_cell_rects[i,j]
-            self._invalidate_shape()
+            self._rows.del_cell_size(i, j)
+            self._cols.del_cell_size(j, i)
+            self._invalidate_claim()
 
     def get_min_cell_rects(self):
         return self._min_cell_rects
 
     def set_min_cell_rects(self, new_rects):
-        if self._min_cell_rects != new_rects:
-            self._min_cell_rects = new_rects
-            self._invalidate_shape()
+        # Only pass the cells that actually changed on to the axes, so that
+        # only the rows and columns containing those cells are recalculated.
+        # Only the sizes of the cells matter, so compare those directly rather
+        # than comparing the rects themselves.
+        old_rects = self._min_cell_rects
+        if old_rects is new_rects:
+            return
+
+        for i, j in old_rects.keys() - new_rects.keys():
+            self._rows.del_cell_size(i, j)
+            self._cols.del_cell_size(j, i)
+            self._invalidate_claim()
+
+        for (i, j), new_rect in new_rects.items():
+            old_rect = old_rects.get((i, j))
+            if old_rect is None or old_rect.height != new_rect.height:
+                self._rows.set_cell_size(i, j, new_rect.height)
+                self._invalidate_claim()
+            if old_rect is None or old_rect.width != new_rect.width:
+                self._cols.set_cell_size(j, i, new_rect.width)
+                self._invalidate_claim()
+
+        # Keep a copy, so that changes made to the given dictionary later on
+        # can't get out of sync with the axes.
+        self._min_cell_rects = dict(new_rects)
 
     def del_min_cell_rects(self):
         if self._min_cell_rects:
-            self._min_cell_rects = {}
-            self._invalidate_shape()
+            self.set_min_cell_rects({})
 
     def get_num_rows(self):
         return self._num_rows
 
     def set_num_rows(self, new_num):
-        self._requested_num_rows = new_num
-        self._invalidate_shape()
+        self._rows.requested_num = new_num
+        self._invalidate_claim()
 
     def get_num_cols(self):
         return self._num_cols
 
     def set_num_cols(self, new_num):
-        self._requested_num_cols = new_num
-        self._invalidate_shape()
+        self._cols.requested_num = new_num
+        self._invalidate_claim()
 
     def get_padding(self):
         return self._inner_padding, self._outer_padding
@@ -202,88 +296,84 @@ class Grid:
         self._invalidate_claim()
 
     def get_row_height(self, i):
-        return self._row_heights[i]
+        return self._rows.get_size(i)
 
     def set_row_height(self, i, new_height):
-        self._requested_row_heights[i] = new_height
+        self._rows.set_requested_size(i, new_height)
         self._invalidate_claim()
 
     def del_row_height(self, i):
-        if i in self._requested_row_heights:
-            del self._requested_row_heights[i]
+        if i in self._rows.requested_sizes:
+            self._rows.del_requested_size(i)
             self._invalidate_claim()
 
     def get_row_heights(self):
-        return self._row_heights
+        return self._rows.get_sizes()
 
     def set_row_heights(self, new_heights):
-        self._requested_row_heights = new_heights
+        self._rows.set_requested_sizes(new_heights)
         self._invalidate_claim()
 
     def del_row_heights(self):
-        self._requested_row_heights = {}
+        self._rows.set_requested_sizes({})
         self._invalidate_claim()
 
     def get_col_width(self, j):
-        return self._col_widths[j]
+        return self._cols.get_size(j)
 
     def set_col_width(self, j, new_width):
-        self._requested_col_widths[j] = new_width
+        self._cols.set_requested_size(j, new_width)
         self._invalidate_claim()
 
     def del_col_width(self, j):
-        if j in self._requested_col_widths:
-            del self._requested_col_widths[j]
+        if j in self._cols.requested_sizes:
+            self._cols.del_requested_size(j)
             self._invalidate_claim()
 
     def get_col_widths(self):
-        return self._col_widths
+        return self._cols.get_sizes()
 
     def set_col_widths(self, new_widths):
-        self._requested_col_widths = new_widths
+        self._cols.set_requested_sizes(new_widths)
         self._invalidate_claim()
 
     def del_col_widths(self):
-        self._requested_col_widths = {}
+        self._cols.set_requested_sizes({})
         self._invalidate_claim()
 
     def get_default_row_height(self):
-        return self._default_row_height
+        return self._rows.default_size
 
     def set_default_row_height(self, new_height):
-        self._default_row_height = new_height
+        self._rows.set_default_size(new_height)
         self._invalidate_claim()
 
     def get_default_col_width(self):
-        return self._default_col_width
+        return self._cols.default_size
 
     def set_default_col_width(self, new_width):
-        self._default_col_width = new_width
+        self._cols.set_default_size(new_width)
         self._invalidate_claim()
 
     def get_requested_num_rows(self):
-        return self._requested_num_rows
+        return self._rows.requested_num
 
     def get_requested_num_cols(self):
-        return self._requested_num_cols
+        return self._cols.requested_num
 
     requested_num_cols = property(get_requested_num_cols)
 
     def get_requested_row_height(self, i):
-        return self._requested_row_heights[i]
+        return self._rows.requested_sizes[i]
 
     def get_requested_row_heights(self):
-        return self._requested_row_heights
+        return self._rows.requested_sizes
 
     def get_requested_col_width(self, i):
-        return self._requested_col_widths[i]
+        return self._cols.requested_sizes[i]
 
     def get_requested_col_widths(self):
-        return self._requested_col_widths
-
-    def _invalidate_shape(self):
-        self._is_shape_stale = True
-        self._invalidate_claim()
+        return self._cols.requested_sizes
 
     def _invalidate_claim(self):
         self._is_claim_stale = True
@@ -292,26 +382,18 @@ class Grid:
     def _invalidate_cells(self):
         self._are_cells_stale = True
 
-    def _update_shape(self):
-        if self._is_shape_stale:
-            self._find_num_rows()
-            self._find_num_cols()
-            self._find_max_cell_dimensions()
-            self.is_shape_stale = False
-
     def _update_claim(self):
         if self._is_claim_stale:
-            self._update_shape()
-            self._find_which_rows_expand()
-            self._find_which_cols_expand()
-            self._find_fixed_row_heights()
-            self._find_fixed_col_widths()
-            self._find_min_expandable_row_heights()
-            self._find_min_expandable_col_widths()
-            self._find_padding_height()
-            self._find_padding_width()
-            self._find_min_height()
-            self._find_min_width()
+            self._rows.update_claim()
+            self._cols.update_claim()
+
+            self._num_rows = self._rows.num
+            self._num_cols = self._cols.num
+            self._min_height = self._rows.get_min_total(
+                    self._inner_padding, self._outer_padding)
+            self._min_width = self._cols.get_min_total(
+                    self._inner_padding, self._outer_padding)
+
             self._is_claim_stale = False
 
     def _update_cells(self):
@@ -323,210 +405,504 @@ class Grid:
             if self._bounding_rect.height < self._min_height:
                 raise UsageError("grid cannot fit in {0[0]}x{0[1]}, need to be at least {1} px tall.".format(self._bounding_rect.size, self._min_height))
 
-            self._find_row_heights()
-            self._find_col_widths()
-            self._find_cell_rects()
+            first_row = self._rows.update_layout(
+                    self._bounding_rect.height,
+                    self._inner_padding, self._outer_padding)
+            first_col = self._cols.update_layout(
+                    self._bounding_rect.width,
+                    self._inner_padding, self._outer_padding)
+
+            self._find_cell_rects(first_row, first_col)
             self._are_cells_stale = False
 
-    def _find_num_rows(self):
-        min_num_rows = 0
-        for i,j in self._min_cell_rects:
-            min_num_rows = max(i+1, min_num_rows)
+    def _make_cell_rect(self, i, j):
+        left, top = self._cell_origin
+        return Rect(
+                left + float(self._cols.starts[j]),
+                top - float(self._rows.ends[i]),
+                float(self._cols.sizes[j]),
+                float(self._rows.sizes[i]),
+        )
+
+    def _find_cell_rects(self, first_row, first_col):
+        """
+        Recalculate the rects for any cells that may have moved or changed
+        size, i.e. those in or below the first changed row, or in or right of
+        the first changed column.
+
+        In sparse mode, the rects aren't actually calculated until they're
+        looked up.  The rects that were already looked up are just forgotten.
+        """
+        origin = self._bounding_rect.left, self._bounding_rect.top
+        if origin != self._cell_origin:
+            self._cell_origin = origin
+            first_row = first_col = 0
+
+        prev_row, prev_col = self._first_changed_cell
+        self._first_changed_cell = min(prev_row, first_row), min(prev_col, first_col)
+
+        if self._sparse:
+            self._cell_shape = self._num_rows, self._num_cols
+            self._cell_rects._forget(first_row, first_col)
+            return
+
+        left, top = origin
+        cell_rects = self._cell_rects
+        num_rows, num_cols = self._num_rows, self._num_cols
+        old_num_rows, old_num_cols = self._cell_shape
+        self._cell_shape = num_rows, num_cols
+
+        # Forget about any cells that are no longer in the grid.
+        for i in range(num_rows, old_num_rows):
+            for j in range(old_num_cols):
+                del cell_rects[i,j]
+
+        for i in range(min(num_rows, old_num_rows)):
+            for j in range(num_cols, old_num_cols):
+                del cell_rects[i,j]
+
+        row_heights = self._rows.sizes.tolist()
+        row_bottoms = self._rows.ends.tolist()
+        col_widths = self._cols.sizes.tolist()
+        col_lefts = self._cols.starts.tolist()
+
+        # If no columns changed, only the rows that changed need to be visited.
+        if first_col >= num_cols:
+            first_row_to_visit = first_row
+        else:
+            first_row_to_visit = 0
+
+        for i in range(first_row_to_visit, num_rows):
+            row_height = row_heights[i]
+            row_bottom = top - row_bottoms[i]
+
+            for j in range(0 if i >= first_row else first_col, num_cols):
+                cell_rects[i,j] = Rect(
+                        left + col_lefts[j], row_bottom,
+                        col_widths[j], row_height)
+
+
+class CellRects(Mapping):
+    """
+    A read-only mapping from (row, col) tuples to the rects of the cells in a
+    sparse `Grid`.
+
+    Grids with lots of empty cells only need the rects for a few of them, so
+    rather than making a rect for every cell, each rect is made the first time
+    it's looked up.  This is a view: it always reflects the grid's most recent
+    layout.
+    """
+
+    def __init__(self, grid):
+        self._grid = grid
+        self._rects = {}
+
+    def __getitem__(self, row_col):
+        try:
+            return self._rects[row_col]
+        except KeyError:
+            pass
+
+        if row_col not in self:
+            raise KeyError(row_col)
 
-        if self._requested_num_rows:
-            self._num_rows = self._requested_num_rows
+        rect = self._rects[row_col] = self._grid._make_cell_rect(*row_col)
+        return rect
+
+    def __contains__(self, row_col):
+        try:
+            i, j = row_col
+        except (TypeError, ValueError):
+            return False
+
+        num_rows, num_cols = self._grid._cell_shape
+        return 0 <= i < num_rows and 0 <= j < num_cols
+
+    def __iter__(self):
+        num_rows, num_cols = self._grid._cell_shape
+        for i in range(num_rows):
+            for j in range(num_cols):
+                yield i, j
+
+    def __len__(self):
+        num_rows, num_cols = self._grid._cell_shape
+        return num_rows * num_cols
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict(self)!r})'
+
+    def _forget(self, first_row, first_col):
+        """
+        Forget the rects of any cells that may have moved or changed size.
+        """
+        if first_row == 0 or first_col == 0:
+            self._rects = {}
         else:
-            self._num_rows = min_num_rows
+            self._rects = {
+                    (i, j): rect
+                    for (i, j), rect in self._rects.items()
+                    if i < first_row and j < first_col
+            }
+
 
-        if self._num_rows < min_num_rows:
-            raise UsageError("not enough rows requested")
+class _GridAxis:
+    """
+    The rows or the columns of a `Grid`.
 
-    def _find_num_cols(self):
-        min_num_cols = 0
-        for i,j in self._min_cell_rects:
-            min_num_cols = max(j+1, min_num_cols)
+    Each line (i.e. each row or column) has a min size, which depends on its
+    requested size and on the sizes of the cells in it.  The min sizes are
+    stored in contiguous arrays, and the totals needed to make a claim are
+    kept up to date as individual lines change.  This way, changing one cell
+    or one requested size only requires recalculating the line in question,
+    and the offsets of the lines after it.
 
-        if self._requested_num_cols:
-            self._num_cols = self._requested_num_cols
+    The offsets are measured from the start of the axis, i.e. down from the
+    top of the grid for rows and right from the left of the grid for columns.
+    """
+
+    def __init__(self, size_name, lines_name, requested_num, requested_sizes,
+            default_size):
+
+        # The names used in error messages, e.g. "row height" and "rows".
+        self.size_name = size_name
+        self.lines_name = lines_name
+
+        # Attributes that the user can set to affect the shape of the axis.
+        self.requested_num = requested_num
+        self.requested_sizes = requested_sizes
+        self.default_size = default_size
+        self.cell_sizes = {}  # {line: {position in line: size}}
+        self.last_line_with_cells = -1
+
+        # Attributes used to make the claim.  `min_sizes` is the minimum size
+        # of each line, `is_expandable` indicates which lines expand.
+        self.num = 0
+        self.min_sizes = _make_array(0)
+        self.is_expandable = _make_array(0)
+        self.fixed_total = 0
+        self.expandable_min_sizes = Counter()
+        self.num_expandable = 0
+
+        # Attributes used to lay out the lines.
+        self.sizes = _make_array(0)
+        self.starts = _make_array(0)
+        self.ends = _make_array(0)
+        self.total = 0
+        self.expandable_size = None
+        self.layout_padding = None
+
+        # Attributes that manage the cache.  `first_changed_line` is the first
+        # line that may need to be laid out again, or None if none do.
+        self.is_stale = True
+        self.stale_lines = set()
+        self.first_changed_line = 0
+
+    def set_cell_size(self, line, position, size):
+        sizes = self.cell_sizes.setdefault(line, {})
+        sizes[position] = size
+        self.stale_lines.add(line)
+        self.last_line_with_cells = max(line, self.last_line_with_cells)
+
+    def del_cell_size(self, line, position):
+        sizes = self.cell_sizes[line]
+        del sizes[position]
+        self.stale_lines.add(line)
+
+        if not sizes:
+            del self.cell_sizes[line]
+            if line == self.last_line_with_cells:
+                self.last_line_with_cells = max(self.cell_sizes, default=-1)
+
+    def set_requested_size(self, line, size):
+        self.requested_sizes[line] = size
+        self.stale_lines.add(line)
+
+    def del_requested_size(self, line):
+        del self.requested_sizes[line]
+        self.stale_lines.add(line)
+
+    def set_requested_sizes(self, new_sizes):
+        old_sizes = self.requested_sizes
+
+        if old_sizes is not new_sizes:
+            for line in old_sizes.keys() | new_sizes.keys():
+                if line not in old_sizes or line not in new_sizes or \
+                        old_sizes[line] != new_sizes[line]:
+                    self.stale_lines.add(line)
         else:
-            self._num_cols = min_num_cols
+            self.is_stale = True
+
+        self.requested_sizes = new_sizes
+
+    def set_default_size(self, new_size):
+        if new_size != self.default_size:
+            self.default_size = new_size
+            self.is_stale = True
 
-        if self._num_cols < min_num_cols:
-            raise UsageError("not enough columns requested")
+    def get_size(self, line):
+        if not 0 <= line < len(self.sizes):
+            raise IndexError(f"no {self.size_name} for {line}")
+        return float(self.sizes[line])
 
-    def _find_max_cell_dimensions(self):
+    def get_sizes(self):
+        return dict(enumerate(self.sizes.tolist()))
+
+    def get_min_total(self, inner_padding, outer_padding):
+        max_expandable_size = max(self.expandable_min_sizes, default=0)
+        return \
+                + self.fixed_total \
+                + max_expandable_size * self.num_expandable \
+                + self._get_padding(inner_padding, outer_padding)
+
+    def find_line(self, offset):
         """
-        Find the tallest and widest cell in each dimension.
+        Return the line that contains the given offset, or None if the offset
+        is outside every line.
         """
-        self._max_cell_heights = {}
-        self._max_cell_widths = {}
+        i = _bisect_left(self.ends, offset)
+        if i >= self.num or self.starts[i] > offset:
+            return None
+        return i
 
-        for i,j in self._min_cell_rects:
-            # Use -math.inf so that negative cell sizes can be used.
-            self._max_cell_heights[i] = max(
-                    self._min_cell_rects[i,j].height,
-                    self._max_cell_heights.get(i, -math.inf))
-            self._max_cell_widths[j] = max(
-                    self._min_cell_rects[i,j].width,
-                    self._max_cell_widths.get(j, -math.inf))
-
-    def _find_which_rows_expand(self):
-        self._fixed_rows = set()
-        self._expandable_rows = set()
-
-        for i in range(self._num_rows):
-            size_request = self._get_requested_row_height(i)
-
-            if isinstance(size_request, int):
-                self._fixed_rows.add(i)
-            elif size_request == 'expand':
-                self._expandable_rows.add(i)
-            else:
-                raise UsageError("illegal row height: {}".format(repr(size_request)))
+    def find_lines(self, start, end):
+        """
+        Return the range of lines that overlap the given span of offsets.
+        """
+        first = _bisect_right(self.ends, start)
+        last = _bisect_left(self.starts, end)
+        return range(first, max(first, min(last, self.num)))
 
-        self._num_fixed_rows = len(self._fixed_rows)
-        self._num_expandable_rows = len(self._expandable_rows)
+    def update_claim(self):
+        """
+        Recalculate the min size of every line that has changed.
+        """
+        try:
+            self._update_num()
+
+            for line in self.stale_lines:
+                if line < self.num:
+                    self._update_line(line)
 
-    def _find_which_cols_expand(self):
-        self._fixed_cols = set()
-        self._expandable_cols = set()
+            self.stale_lines = set()
 
-        for j in range(self._num_cols):
-            size_request = self._get_requested_col_width(j)
+        except:
+            # Start from scratch next time, because the error could've left
+            # the running totals in an inconsistent state.
+            self.is_stale = True
+            raise
 
-            if isinstance(size_request, int):
-                self._fixed_cols.add(j)
-            elif size_request == 'expand':
-                self._expandable_cols.add(j)
+    def update_layout(self, length, inner_padding, outer_padding):
+        """
+        Recalculate the sizes and offsets of any lines that may have changed,
+        and return the first such line.
+        """
+        first = self.first_changed_line
+        padding = inner_padding, outer_padding
+
+        if padding != self.layout_padding:
+            first = 0
+
+        if self.num_expandable:
+            expandable_size = (
+                    + length
+                    - self.fixed_total
+                    - self._get_padding(inner_padding, outer_padding)
+                    ) / self.num_expandable
+        else:
+            expandable_size = None
+
+        if expandable_size != self.expandable_size and self.num_expandable:
+            first = min(
+                    _index_of_first_true(self.is_expandable),
+                    self.num if first is None else first)
+
+        self.expandable_size = expandable_size
+        self.layout_padding = padding
+        self.first_changed_line = None
+
+        if first is None:
+            return self.num
+
+        self.sizes = _resize_array(self.sizes, self.num)
+        self.starts = _resize_array(self.starts, self.num)
+        self.ends = _resize_array(self.ends, self.num)
+
+        if first < self.num:
+            if first == 0:
+                cursor = outer_padding
             else:
-                raise UsageError("illegal col width: {}".format(repr(size_request)))
+                cursor = self.ends[first - 1] + inner_padding
 
-        self._num_fixed_cols = len(self._fixed_cols)
-        self._num_expandable_cols = len(self._expandable_cols)
+            _lay_out_lines(
+                    first, self.sizes, self.starts, self.ends,
+                    self.min_sizes, self.is_expandable, expandable_size,
+                    cursor, inner_padding)
 
-    def _find_fixed_row_heights(self):
-        self._fixed_row_heights = {}
-        for i in self._fixed_rows:
-            # Use -math.inf so that negative cell sizes can be used.
-            self._fixed_row_heights[i] = max(
-                    self._get_requested_row_height(i),
-                    self._max_cell_heights.get(i, -math.inf))
+        if self.num:
+            self.total = float(self.ends[-1]) + outer_padding
+        else:
+            self.total = self._get_padding(inner_padding, outer_padding)
 
-    def _find_fixed_col_widths(self):
-        self._fixed_col_widths = {}
-        for j in self._fixed_cols:
+        return first
+
+    def _update_num(self):
+        min_num = self.last_line_with_cells + 1
+
+        if self.requested_num:
+            num = self.requested_num
+        else:
+            num = min_num
+
+        if num < min_num:
+            raise UsageError(f"not enough {self.lines_name} requested")
+
+        if self.is_stale:
+            # Start over with every line being fixed and 0 px, which is the
+            # state that new lines start in below.  Then recalculate every line.
+            self.min_sizes = _make_array(num)
+            self.is_expandable = _make_array(num)
+            self.fixed_total = 0
+            self.expandable_min_sizes = Counter()
+            self.num_expandable = 0
+            self.stale_lines = set(range(num))
+            self.first_changed_line = 0
+            self.layout_padding = None
+            self.is_stale = False
+
+        elif num < self.num:
+            for line in range(num, self.num):
+                self._remove_line(line)
+
+            self.min_sizes = _resize_array(self.min_sizes, num)
+            self.is_expandable = _resize_array(self.is_expandable, num)
+            self._note_changed_line(num)
+
+        elif num > self.num:
+            self.min_sizes = _resize_array(self.min_sizes, num)
+            self.is_expandable = _resize_array(self.is_expandable, num)
+            self.stale_lines.update(range(self.num, num))
+            self._note_changed_line(self.num)
+
+        self.num = num
+
+    def _update_line(self, line):
+        size_request = self.requested_sizes.get(line, self.default_size)
+        cell_sizes = self.cell_sizes.get(line)
+
+        if isinstance(size_request, int):
+            is_expandable = False
             # Use -math.inf so that negative cell sizes can be used.
-            self._fixed_col_widths[j] = max(
-                    self._get_requested_col_width(j),
-                    self._max_cell_widths.get(j, -math.inf))
-
-    def _find_min_expandable_row_heights(self):
-        self._min_expandable_row_heights = {}
-        for i in self._expandable_rows:
-            self._min_expandable_row_heights[i] = \
-                    self._max_cell_heights.get(i, 0)
-
-    def _find_min_expandable_col_widths(self):
-        self._min_expandable_col_widths = {}
-        for j in self._expandable_cols:
-            self._min_expandable_col_widths[j] = \
-                    self._max_cell_widths.get(j, 0)
-
-    def _find_padding_height(self):
-        self._padding_height = \
-                + self._inner_padding * (self._num_rows - 1) \
-                + self._outer_padding * 2
-
-    def _find_padding_width(self):
-        self._padding_width = \
-                + self._inner_padding * (self._num_cols - 1) \
-                + self._outer_padding * 2
-
-    def _find_min_height(self):
-        min_expandable_height = max(
-                self._min_expandable_row_heights.values() or [0])
-        self._min_height = \
-                + sum(self._fixed_row_heights.values()) \
-                + min_expandable_height * self._num_expandable_rows \
-                + self._padding_height
-
-    def _find_min_width(self):
-        min_expandable_width = max(
-                self._min_expandable_col_widths.values() or [0])
-        self._min_width = \
-                + sum(self._fixed_col_widths.values()) \
-                + min_expandable_width * self._num_expandable_cols \
-                + self._padding_width
-
-    def _find_row_heights(self):
-        self._row_heights = self._fixed_row_heights.copy()
-
-        if self._num_expandable_rows:
-            expandable_row_height = (
-                    + self._bounding_rect.height
-                    - sum(self._fixed_row_heights.values())
-                    - self._padding_height
-                    ) / self._num_expandable_rows
-
-            for i in self._expandable_rows:
-                self._row_heights[i] = expandable_row_height
-
-        self._height = \
-                + sum(self._row_heights.values()) \
-                + self._padding_height
-
-    def _find_col_widths(self):
-        self._col_widths = self._fixed_col_widths.copy()
-
-        if self._num_expandable_cols:
-            expandable_col_width = (
-                    + self._bounding_rect.width
-                    - sum(self._fixed_col_widths.values())
-                    - self._padding_width
-                    ) / self._num_expandable_cols
-
-            for j in self._expandable_cols:
-                self._col_widths[j] = expandable_col_width
-
-        self._width = \
-                + sum(self._col_widths.values()) \
-                + self._padding_width
-
-    def _find_cell_rects(self):
-        self._row_tops = {}
-        self._col_lefts = {}
-        self._cell_rects = {}
-
-        top_cursor = self._bounding_rect.top
-
-        for i in range(self._num_rows):
-            top_cursor -= self._get_row_padding(i)
-            left_cursor = self._bounding_rect.left
-            row_height = self._row_heights[i]
-            self._row_tops[i] = top_cursor
-
-            for j in range(self._num_cols):
-                left_cursor += self._get_col_padding(j)
-                col_width = self._col_widths[j]
-
-                self._cell_rects[i,j] = Rect.from_size(col_width, row_height)
-                self._cell_rects[i,j].top_left = left_cursor, top_cursor
-                self._col_lefts[j] = left_cursor
-
-                left_cursor += col_width
-            top_cursor -= row_height
-
-    def _get_requested_row_height(self, i):
-        return self._requested_row_heights.get(i, self._default_row_height)
-
-    def _get_requested_col_width(self, j):
-        return self._requested_col_widths.get(j, self._default_col_width)
-
-    def _get_row_padding(self, i):
-        return self._outer_padding if i == 0 else self._inner_padding
-
-    def _get_col_padding(self, j):
-        return self._outer_padding if j == 0 else self._inner_padding
+            max_cell_size = max(cell_sizes.values()) if cell_sizes else -math.inf
+            min_size = max(size_request, max_cell_size)
+        elif size_request == 'expand':
+            is_expandable = True
+            min_size = max(cell_sizes.values()) if cell_sizes else 0
+        else:
+            raise UsageError("illegal {}: {}".format(self.size_name, repr(size_request)))
+
+        was_expandable = bool(self.is_expandable[line])
+
+        if (min_size, is_expandable) == (self.min_sizes[line], was_expandable):
+            return
+
+        self._remove_line(line)
+
+        self.min_sizes[line] = min_size
+        self.is_expandable[line] = is_expandable
+
+        if is_expandable:
+            self.expandable_min_sizes[min_size] += 1
+            self.num_expandable += 1
+        else:
+            self.fixed_total += min_size
+
+        # The min sizes of expandable lines don't affect the layout directly,
+        # only through the total min size (which determines whether or not the
+        # grid fits in its bounding rect).
+        if not (is_expandable and was_expandable):
+            self._note_changed_line(line)
+
+    def _remove_line(self, line):
+        """
+        Remove the given line from the running totals.
+        """
+        min_size = float(self.min_sizes[line])
+
+        if self.is_expandable[line]:
+            self.expandable_min_sizes[min_size] -= 1
+            if not self.expandable_min_sizes[min_size]:
+                del self.expandable_min_sizes[min_size]
+            self.num_expandable -= 1
+        else:
+            self.fixed_total -= min_size
+
+    def _note_changed_line(self, line):
+        if self.first_changed_line is None or line < self.first_changed_line:
+            self.first_changed_line = line
+
+    def _get_padding(self, inner_padding, outer_padding):
+        return inner_padding * (self.num - 1) + outer_padding * 2
+
+
+def _make_array(n):
+    if numpy is not None:
+        return numpy.zeros(n)
+    else:
+        return array('d', bytes(8 * n))
+
+def _resize_array(a, n):
+    if len(a) == n:
+        return a
+    if len(a) > n:
+        return a[:n]
+    if numpy is not None:
+        return numpy.concatenate((a, numpy.zeros(n - len(a))))
+    else:
+        return a + _make_array(n - len(a))
+
+def _bisect_left(a, x):
+    if numpy is not None:
+        return int(numpy.searchsorted(a, x, side='left'))
+    else:
+        return bisect_left(a, x)
+
+def _bisect_right(a, x):
+    if numpy is not None:
+        return int(numpy.searchsorted(a, x, side='right'))
+    else:
+        return bisect_right(a, x)
+
+def _index_of_first_true(a):
+    if numpy is not None:
+        return int(numpy.argmax(a != 0))
+    else:
+        return next(i for i, x in enumerate(a) if x)
+
+def _lay_out_lines(first, sizes, starts, ends, min_sizes, is_expandable,
+        expandable_size, cursor, inner_padding):
+    """
+    Fill in the sizes, starts, and ends of every line from the given one on.
+    """
+    if numpy is not None:
+        new_sizes = min_sizes[first:]
+        if expandable_size is not None:
+            new_sizes = numpy.where(
+                    is_expandable[first:] != 0, expandable_size, new_sizes)
+
+        steps = new_sizes + inner_padding
+        sizes[first:] = new_sizes
+        starts[first] = cursor
+        starts[first+1:] = cursor + numpy.cumsum(steps[:-1])
+        ends[first:] = starts[first:] + new_sizes
+
+    else:
+        for i in range(first, len(sizes)):
+            size = expandable_size if is_expandable[i] else min_sizes[i]
+            sizes[i] = size
+            starts[i] = cursor
+            ends[i] = cursor = cursor + size
+            cursor += inner_padding
+
 
 def make_grid(rect, cells={}, num_rows=0, num_cols=0, padding=None,
         inner_padding=None, outer_padding=None, row_heights={}, col_widths={}, 
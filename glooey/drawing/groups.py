@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+Share pyglet groups between widgets and artists that need the same OpenGL
+state.
+
+Pyglet considers groups with the same type, order, parent and state (e.g.
+two `pyglet.graphics.OrderedGroup(1, parent)` objects) to be equal, but each
+new group object still has to be compared with the old one, and any artists
+using the old group have to be migrated to the new one.  The functions in this
+module instead return the same object every time they're called with the same
+arguments, for as long as that object is being used somewhere.  This means
+that regrouping a widget or an artist to an equivalent group doesn't do
+anything.
+"""
+
+import weakref
+import pyglet
+from pyglet.gl import GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA
+
+# The groups are only kept for as long as something else (usually the batch)
+# is using them.
+_groups = weakref.WeakValueDictionary()
+
+def get_ordered_group(order, parent=None):
+    """
+    Return a `pyglet.graphics.OrderedGroup` with the given order and parent.
+    """
+    key = 'ordered', order, parent
+
+    try:
+        return _groups[key]
+    except KeyError:
+        group = _groups[key] = pyglet.graphics.OrderedGroup(order, parent)
+        return group
+
+def get_sprite_group(texture, blend_src=GL_SRC_ALPHA,
+        blend_dest=GL_ONE_MINUS_SRC_ALPHA, parent=None):
+    """
+    Return a `pyglet.sprite.SpriteGroup` that binds the given texture and
+    blend mode.
+
+    Images that are regions of the same texture (e.g. images from an atlas)
+    get the same group.
+    """
+    key = 'sprite', texture.target, texture.id, blend_src, blend_dest, parent
+
+    try:
+        return _groups[key]
+    except KeyError:
+        group = _groups[key] = pyglet.sprite.SpriteGroup(
+                texture, blend_src, blend_dest, parent)
+        return group
+
+def get_num_live_groups():
+    """
+    Return the number of distinct groups made by this module that are still
+    being used.
+
+    This is meant to help measure how many OpenGL state changes are needed to
+    draw the GUI, e.g. to make sure it doesn't grow with the number of widgets.
+    """
+    return len(_groups)
+
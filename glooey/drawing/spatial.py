@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+"""
+Data structures for quickly finding which of many rectangles contain a point.
+"""
+
+import math
+import autoprop
+from glooey.helpers import *
+
+@autoprop
+class SpatialHash:
+    """
+    Bucket rectangles into a uniform grid, so that the rectangles containing a
+    given point can be found without checking every one of them.
+
+    This is meant to be used as the ``SpatialIndex`` of a container widget
+    (e.g. `Board`) with lots of children.  Any object with the same `add()`,
+    `discard()`, `clear()` and `find()` methods can be used instead, e.g. to
+    implement a quadtree or an R-tree.  Objects that also have a
+    `find_in_rect()` method are used to quickly find the children that are in
+    view when the container is scrolled (see `ScrollPane.cull_margin`).
+
+    The cell size should be roughly the size of a typical rectangle.  Smaller
+    cells mean that each rectangle has to be stored in more buckets, while
+    larger cells mean that more rectangles have to be checked for each point.
+    """
+
+    def __init__(self, cell_size=64):
+        self._cell_size = cell_size
+        self._buckets = {}  # {(i, j): {item: rect}}
+        self._keys = {}     # {item: [(i, j), ...]}
+
+        if self._cell_size <= 0:
+            raise UsageError(f"cell size must be positive, not {self._cell_size}")
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, item):
+        return item in self._keys
+
+    def add(self, item, rect):
+        """
+        Add the given item to the index, or move it if it's already there.
+        """
+        self.discard(item)
+
+        keys = list(self._yield_keys(rect))
+        for key in keys:
+            self._buckets.setdefault(key, {})[item] = rect
+
+        self._keys[item] = keys
+
+    def discard(self, item):
+        """
+        Remove the given item from the index, if it's there.
+        """
+        for key in self._keys.pop(item, ()):
+            bucket = self._buckets[key]
+            del bucket[item]
+            if not bucket:
+                del self._buckets[key]
+
+    def clear(self):
+        """
+        Remove every item from the index.
+        """
+        self._buckets = {}
+        self._keys = {}
+
+    def find(self, x, y):
+        """
+        Yield every item with a rectangle that contains the given point.
+
+        Points on the edges of a rectangle count as being inside it, the same
+        as with ``(x, y) in rect``.
+        """
+        key = self._get_key(x, y)
+        for item, rect in self._buckets.get(key, {}).items():
+            if (x, y) in rect:
+                yield item
+
+    def find_in_rect(self, rect):
+        """
+        Yield every item with a rectangle that overlaps the given one.
+
+        Rectangles that only touch the edges of the given one don't count.
+        Each item is only yielded once, even if it's in more than one bucket.
+        """
+        left, bottom = rect.left, rect.bottom
+        right, top = rect.right, rect.top
+        seen = set()
+
+        for key in self._yield_keys(rect):
+            for item, item_rect in self._buckets.get(key, {}).items():
+                if item in seen:
+                    continue
+
+                seen.add(item)
+
+                if item_rect.right > left and item_rect.left < right and \
+                        item_rect.top > bottom and item_rect.bottom < top:
+                    yield item
+
+    def get_cell_size(self):
+        return self._cell_size
+
+    def _get_key(self, x, y):
+        return (
+                math.floor(x / self._cell_size),
+                math.floor(y / self._cell_size),
+        )
+
+    def _yield_keys(self, rect):
+        left, bottom = self._get_key(rect.left, rect.bottom)
+        right, top = self._get_key(rect.right, rect.top)
+
+        for i in range(left, right + 1):
+            for j in range(bottom, top + 1):
+                yield i, j
+
@@ -42,8 +42,10 @@ class HoldUpdatesMixin:
     @contextlib.contextmanager
     def hold_updates(self):
         self.pause_updates()
-        yield
-        self.resume_updates()
+        try:
+            yield
+        finally:
+            self.resume_updates()
 
     @contextlib.contextmanager
     def suppress_updates(self):
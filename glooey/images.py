@@ -47,6 +47,7 @@ class Image(Widget):
                     self.image, batch=self.batch, group=self.group)
         else:
             self._sprite.image = self.image
+            self._sprite.visible = True
 
         self._sprite.x = self.rect.left
         self._sprite.y = self.rect.bottom
@@ -65,6 +66,10 @@ class Image(Widget):
             self._sprite.delete()
             self._sprite = None
 
+    def do_park(self):
+        if self._sprite is not None:
+            self._sprite.visible = False
+
     def get_image(self):
         return self._image
 
@@ -142,6 +147,9 @@ class Background(Widget):
     def do_undraw(self):
         self._artist.hide()
 
+    def do_park(self):
+        self._artist.hide(retain=True)
+
     def get_color(self):
         return self._artist.color
 
@@ -43,15 +43,14 @@ class Placeholder(Widget):
         return self._min_width, self._min_height
 
     def do_regroup(self):
-        if self.vertex_list is not None:
-            self.batch.migrate(
-                    self.vertex_list, pyglet.gl.GL_LINES,
-                    self.group, self.batch)
+        # The vertex list comes from a pool, so it can't be migrated.  It'll be 
+        # remade when the widget is redrawn.
+        self.do_undraw()
 
     def do_draw(self):
         if self.vertex_list is None:
-            self.vertex_list = self.batch.add(
-                    12, pyglet.gl.GL_LINES, self.group, 'v2f', 'c4B')
+            self.vertex_list = drawing.default_pool.add(
+                    self.batch, 12, pyglet.gl.GL_LINES, self.group, 'v2f', 'c4B')
 
         # Shrink the rectangle by half-a-pixel so there's no ambiguity about 
         # where the line should be drawn.  (The problem is that the widget rect 
@@ -196,8 +195,8 @@ class FillBar(Widget):
         self._update_fill()
 
     def do_regroup_children(self):
-        base_layer = pyglet.graphics.OrderedGroup(1, self.group)
-        fill_layer = pyglet.graphics.OrderedGroup(2, self.group)
+        base_layer = drawing.get_ordered_group(1, self.group)
+        fill_layer = drawing.get_ordered_group(2, self.group)
 
         self._fill_group = drawing.ScissorGroup(parent=fill_layer)
         self._update_fill()
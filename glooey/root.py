@@ -16,8 +16,20 @@ from glooey.helpers import *
 @autoprop
 class Root(Stack):
     custom_one_child_gets_mouse = True
+    custom_defer_layout = False
+    """
+    If true, calls to `Widget._repack()` don't update the layout right away.  
+    Instead, the widgets that need to be repacked are remembered and the 
+    layout is updated all at once the next time `flush_layout()` is called.  
+    `Gui` does this right before each frame is drawn, so any number of changes 
+    made between two frames only cost a single layout pass.
+    """
+
+    def __init__(self, window, batch=None, group=None, *, defer_layout=None):
+        self.__defer_layout = first_not_none((
+            defer_layout, self.custom_defer_layout))
+        self.__pending_repacks = []
 
-    def __init__(self, window, batch=None, group=None):
         super().__init__()
 
         self.__window = window
@@ -74,10 +86,73 @@ class Root(Stack):
     def get_territory(self):
         raise NotImplementedError
 
+    def get_defer_layout(self):
+        return self.__defer_layout
+
+    def set_defer_layout(self, defer_layout):
+        self.__defer_layout = defer_layout
+
+        # Don't leave any repacks hanging if we're going back to updating the 
+        # layout immediately.
+        if not defer_layout:
+            self.flush_layout()
+
+    def flush_layout(self):
+        """
+        Repack every widget that has been scheduled for repacking since the 
+        last time this method was called.
+
+        This method only does anything when layout is being deferred (see 
+        `set_defer_layout()`).  It's called automatically by `Gui` before each 
+        frame is drawn, but it can be called manually whenever the layout needs 
+        to be up-to-date right away, e.g. to read the size of a widget that was 
+        just added.
+
+        Each affected widget is claimed at most once, from the bottom of the 
+        hierarchy to the top, and then realigned at most once, from the top of 
+        the hierarchy to the bottom.
+        """
+        # Repacking can trigger event handlers that schedule more repacks, so 
+        # keep going until there's nothing left to do.
+        while self.__pending_repacks:
+            widgets = [
+                    w for w in self.__pending_repacks
+                    if w.root is self
+            ]
+            self.__pending_repacks = []
+
+            if not widgets:
+                break
+
+            processed, stop_points = self._claim_many(widgets)
+
+            # Realign each widget where the ascent stopped.  The root widget 
+            # needs special treatment, because its size comes from the window.
+            if self in stop_points:
+                self._resize_territory()
+
+            self._realign_many(stop_points)
+
+            for widget in reversed(processed):
+                widget.dispatch_event('on_repack')
+
     @update_function
     def _repack(self):
+        self._invalidate_claim()
+        self._invalidate_rect()
+        self._invalidate_appearance()
+
+        if self.defer_layout:
+            self._schedule_repack(self)
+            return
+
         self._claim()
+        self._resize_territory()
 
+    def _schedule_repack(self, widget):
+        self.__pending_repacks.append(widget)
+
+    def _resize_territory(self):
         too_narrow = self.territory.width < self.claimed_width
         too_short = self.territory.height < self.claimed_height
 
@@ -98,9 +173,9 @@ class Gui(Root):
     custom_clear_before_draw = True
 
     def __init__(self, window, *, cursor=None, hotspot=None,
-            clear_before_draw=None, batch=None, group=None):
+            clear_before_draw=None, batch=None, group=None, defer_layout=None):
 
-        super().__init__(window, batch, group)
+        super().__init__(window, batch, group, defer_layout=defer_layout)
 
         # Set the cursor, if the necessary arguments were given.
         if cursor and not hotspot:
@@ -115,6 +190,8 @@ class Gui(Root):
             clear_before_draw, self.custom_clear_before_draw))
 
     def on_draw(self):
+        self.flush_layout()
+
         if self.clear_before_draw:
             self.window.clear()
         self.batch.draw()
@@ -163,11 +240,13 @@ class PanningGui(Gui):
     __ https://pyglet.readthedocs.io/en/pyglet-1.2-maintenance/programming_guide/mouse.html#mouse-exclusivity
     """
 
-    def __init__(self, window, cursor, hotspot, *, batch=None, group=None):
+    def __init__(self, window, cursor, hotspot, *, batch=None, group=None,
+            defer_layout=None):
         mouse_group = pyglet.graphics.OrderedGroup(1, parent=group)
         gui_group = pyglet.graphics.OrderedGroup(0, parent=group)
 
-        super().__init__(window, batch=batch, group=gui_group)
+        super().__init__(window, batch=batch, group=gui_group,
+                defer_layout=defer_layout)
         window.set_exclusive_mouse(True)
 
         # Where the mouse is.  Because mouse exclusivity is enabled, we have to 
@@ -10,6 +10,7 @@ import pyglet
 import vecrec
 import autoprop
 
+from array import array
 from vecrec import Vector, Rect
 from glooey import drawing
 from glooey.widget import Widget
@@ -21,6 +22,7 @@ from glooey.helpers import *
 
 @autoprop
 @register_event_type('on_translate')
+@register_event_type('on_realign_content')
 class Mover(Bin):
 
     class TranslateGroup(pyglet.graphics.Group):
@@ -48,6 +50,8 @@ class Mover(Bin):
         self._translate_group = None
         self._expand_horz = True
         self._expand_vert = True
+        self._children_share_coords = False
+        self._is_realign_content_pending = False
 
     @vecrec.accept_anything_as_vector
     def pan(self, step):
@@ -99,6 +103,17 @@ class Mover(Bin):
         self.child._resize(child_rect)
         self._keep_child_in_rect()
 
+    def _on_content_realign(self):
+        # Only dispatch one event per layout step, no matter how many widgets 
+        # in the content were moved.
+        if not self._is_realign_content_pending:
+            self._is_realign_content_pending = True
+            self._defer(self._dispatch_realign_content)
+
+    def _dispatch_realign_content(self):
+        self._is_realign_content_pending = False
+        self.dispatch_event('on_realign_content', self)
+
     def do_regroup_children(self):
         self._translate_group = self.TranslateGroup(self, self.group)
         self.child._regroup(self._translate_group)
@@ -244,17 +259,34 @@ class ScrollPane(Widget):
     This widget isn't really meant to be used directly.  Instead, it's meant to 
     be a building block for widgets that need scrolling, like ScrollBox and 
     Viewport.
+
+    The scissor box only hides what's outside the visible region, though; 
+    every vertex still has to be submitted to OpenGL.  So the pane also 
+    undraws the parts of its content that are far enough out of view (see 
+    `custom_cull_margin`), and draws them again when they come back.
     """
     Mover = Mover
     custom_initial_view = 'top left'
     custom_horz_scrolling = False
     custom_vert_scrolling = False
 
+    custom_cull_margin = 100
+    """
+    How far (in pixels) outside the visible region a widget in the content has 
+    to be before it's undrawn, or None to never undraw anything.  Which widgets 
+    should be drawn is only worked out again once the view moves more than 
+    this far, so a bigger margin means more widgets are drawn but less work 
+    is done while scrolling.
+    """
+
     def __init__(self):
         super().__init__()
 
         self._mover = self.Mover()
-        self._mover.push_handlers(self.on_translate)
+        self._mover.push_handlers(
+                on_translate=self.on_translate,
+                on_realign_content=self._on_realign_content,
+        )
         self._attach_child(self._mover)
 
         self._scissor_group = None
@@ -263,8 +295,16 @@ class ScrollPane(Widget):
         self.horz_scrolling = self.custom_horz_scrolling
         self.vert_scrolling = self.custom_vert_scrolling
 
+        # The widgets that are currently culled, and the region (in the 
+        # coordinates of the child) that was used to cull them.
+        self._cull_margin = self.custom_cull_margin
+        self._culled_widgets = set()
+        self._culled_region = None
+
     def add(self, child):
+        self._forget_child()
         self._mover.add(child)
+        child.push_handlers(on_repack=self._on_child_repack)
 
         if self.is_attached_to_gui:
             self.view = self.initial_view
@@ -272,6 +312,7 @@ class ScrollPane(Widget):
             self._apply_initial_view = True
 
     def clear(self):
+        self._forget_child()
         self._mover.clear()
 
     @vecrec.accept_anything_as_vector
@@ -343,11 +384,16 @@ class ScrollPane(Widget):
 
         self._mover._resize(mover_rect)
 
+        # Wait until the content has been laid out before deciding what's in 
+        # view.
+        self._defer(self._on_resize_children)
+
     def do_regroup_children(self):
         self._scissor_group = drawing.ScissorGroup(self.rect, self.group)
         self._mover._regroup(self._scissor_group)
 
     def on_translate(self, mover):
+        self._update_culling()
         self.dispatch_event('on_scroll', self)
 
     def get_child(self):
@@ -419,6 +465,93 @@ class ScrollPane(Widget):
         self._mover.expand_vert = not new_bool
         self._repack()
 
+    def get_cull_margin(self):
+        return self._cull_margin
+
+    def set_cull_margin(self, new_margin):
+        self._cull_margin = new_margin
+        self._update_culling(force=True)
+
+    def get_culled_widgets(self):
+        """
+        Return the widgets in the content that are currently undrawn because 
+        they're too far out of view.  See `custom_cull_margin`.
+        """
+        return self._culled_widgets.copy()
+
+    def _update_culling(self, force=False):
+        """
+        Undraw the widgets in the content that are too far out of view, and 
+        redraw the ones that have come back into view.
+
+        Unless ``force`` is true, nothing is done if the view is still inside 
+        the region that was used to cull the widgets last time, because none of 
+        the widgets that could be in view were culled.  This is what keeps 
+        scrolling cheap: the content is only searched once the view has moved 
+        by about `custom_cull_margin` pixels.
+        """
+        if self._cull_margin is None:
+            if self._culled_widgets:
+                self._stop_culling()
+            return
+
+        child = self.child
+
+        if child is None or child.rect is None:
+            return
+        if self.rect is None or self._mover.rect is None:
+            return
+
+        left, bottom = \
+                self.rect.bottom_left - self._mover.rect.bottom_left - \
+                self._mover.position
+        right = left + self.rect.width
+        top = bottom + self.rect.height
+
+        region = self._culled_region
+        if not force and region is not None:
+            if region.left <= left and right <= region.right and \
+                    region.bottom <= bottom and top <= region.top:
+                return
+
+        margin = self._cull_margin
+        self._culled_region = Rect(
+                left - margin,
+                bottom - margin,
+                right - left + 2 * margin,
+                top - bottom + 2 * margin,
+        )
+        self._culled_widgets = child._cull_children(
+                self._culled_region, self._culled_widgets)
+
+    def _stop_culling(self):
+        if self.child is not None:
+            self.child._cull_children(None, self._culled_widgets)
+
+        self._culled_widgets = set()
+        self._culled_region = None
+
+    def _forget_child(self):
+        # Detaching the child will uncull its widgets, so there's no need to 
+        # redraw them here.
+        if self.child is not None:
+            self.child.remove_handlers(on_repack=self._on_child_repack)
+
+        self._culled_widgets = set()
+        self._culled_region = None
+
+    def _on_child_repack(self):
+        self._update_culling(force=True)
+
+    def _on_realign_content(self, mover):
+        # Widgets anywhere in the content can move without the child being 
+        # repacked (e.g. pins on a board), so decide again what's in view.
+        self._update_culling(force=True)
+
+    def _on_resize_children(self):
+        self._update_culling(force=True)
+        self.dispatch_event('on_resize_children', self)
+
     def _require_rects(self):
         if self.child is None:
             raise UsageError("can't scroll until the scroll pane has a child widget.")
@@ -600,7 +733,9 @@ class HScrollBar(HVScrollBar):
     HVBox = HBox
 
     def _get_scaled_grip_size(self):
-        width = self._pane.width**2 / self._pane.child.width
+        content_width = self._pane.child.width
+        width = self._pane.width**2 / content_width \
+                if content_width else self.width
         return width, self.height
 
 @autoprop
@@ -608,7 +743,9 @@ class VScrollBar(HVScrollBar):
     HVBox = VBox
 
     def _get_scaled_grip_size(self):
-        height = self._pane.height**2 / self._pane.child.height
+        content_height = self._pane.child.height
+        height = self._pane.height**2 / content_height \
+                if content_height else self.height
         return self.width, height
 
 @autoprop
@@ -669,6 +806,13 @@ class ScrollBox(Widget):
     def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
         self._pane.scroll(self.mouse_sensitivity * Vector(scroll_x, scroll_y))
 
+    def get_pane(self):
+        """
+        Return the pane being scrolled, e.g. to configure a `ListView` that was 
+        given as the ``Pane`` inner class.
+        """
+        return self._pane
+
     def get_mouse_sensitivity(self):
         return self._mouse_sensitivity
 
@@ -706,3 +850,1281 @@ class Viewport(ScrollPane):
     def set_sensitivity(self, new_sensitivity):
         self._sensitivity = new_sensitivity
 
+@autoprop
+class TileLayer(Widget):
+    """
+    Draw a big grid of tiles (e.g. the terrain of a game map), only making 
+    vertex lists for the parts of the grid that can be seen.
+
+    A map could be made out of `Image` widgets, but every tile would get its 
+    own widget and its own sprite, so a 512×512 map would need 262,144 of 
+    each.  A tile layer is just one widget.  It divides the tiles into square 
+    chunks (see `custom_chunk_size`) and draws each chunk with a single vertex 
+    list for each texture it uses.  Only the chunks in the view of the nearest 
+    `ScrollPane` (e.g. a `Viewport`) are made, and more are made as they're 
+    scrolled into view.  Chunks are deleted once they're more than a chunk 
+    away from the view.
+
+    The tiles are given as a 2D array of indices (e.g. a list of lists or a 
+    numpy array), with the first row at the top of the layer.  Each index is 
+    looked up in ``images`` (e.g. a list or a dict) to get the image to draw 
+    for that tile.  Tiles with an index or an image of None are left empty.  
+    Each tile is given as much space as the first image (see 
+    `custom_tile_size`), and only tiles with images from the same texture can 
+    share a vertex list, so it's best for the images to come from a single 
+    atlas:
+
+    >>> atlas = pyglet.image.load('terrain.png')
+    >>> images = pyglet.image.TextureGrid(pyglet.image.ImageGrid(atlas, 8, 8))
+    >>> layer = glooey.TileLayer(tiles, images)
+    >>> viewport.add(layer)
+
+    If the tiles array is changed in place, call `refresh()` or use 
+    `set_tile()` so the chunks being shown can be updated.  Use `find_tile()` 
+    to find the tile under the mouse.
+    """
+    custom_tiles = None
+    custom_images = None
+
+    custom_tile_size = None
+    """
+    The width and height of each tile, in pixels.  If None, the size of the 
+    first image is used.
+    """
+
+    custom_chunk_size = 32
+    """
+    The number of rows and columns of tiles in each chunk.  Bigger chunks mean 
+    fewer vertex lists, but more tiles that aren't in view get drawn anyway.
+    """
+
+    def __init__(self, tiles=None, images=None):
+        super().__init__()
+        self._tiles = first_not_none((tiles, self.custom_tiles, []))
+        self._images = first_not_none((images, self.custom_images, []))
+        self._tile_size = self.custom_tile_size
+        self._chunk_size = self.custom_chunk_size
+        self._pane = None
+        self._chunks = {}       # {(i, j): [vertex list, ...]}
+        self._tile_info = {}    # {index: (texture, width, height, tex coords)}
+
+    def refresh(self):
+        """
+        Redraw every chunk that's being shown, e.g. after the tiles array was 
+        changed in place.
+        """
+        self._tile_info = {}
+        self._draw()
+
+    def find_tile(self, x, y):
+        """
+        Return the row and column of the tile at the given coordinates, or 
+        None if there isn't a tile there.
+
+        The coordinates should be the same as those of the mouse events this 
+        widget receives, which already account for any scrolling.
+        """
+        if self.rect is None:
+            return None
+
+        width, height = self.tile_size
+        if not width or not height:
+            return None
+
+        i = math.floor((self.rect.top - y) / height)
+        j = math.floor((x - self.rect.left) / width)
+
+        if 0 <= i < self.num_rows and 0 <= j < self.num_cols:
+            return i, j
+        else:
+            return None
+
+    def get_tile_rect(self, i, j):
+        """
+        Return the rectangle occupied by the tile in the given row and column.
+        """
+        width, height = self.tile_size
+        return Rect(
+                self.rect.left + j * width,
+                self.rect.top - (i + 1) * height,
+                width,
+                height,
+        )
+
+    def do_attach(self):
+        # Keep track of the view of the nearest scroll pane, so only the 
+        # chunks that can be seen are made.
+        widget = self.parent
+        while not isinstance(widget, ScrollPane):
+            # The root is its own parent, so stop there.
+            if widget is None or widget.is_root:
+                widget = None
+                break
+            widget = widget.parent
+
+        self._pane = widget
+        if self._pane is not None:
+            self._pane.push_handlers(
+                    on_scroll=self._on_view_changed,
+                    on_resize_children=self._on_view_changed,
+            )
+
+    def do_detach(self):
+        if self._pane is not None:
+            self._pane.remove_handlers(
+                    on_scroll=self._on_view_changed,
+                    on_resize_children=self._on_view_changed,
+            )
+            self._pane = None
+
+    def do_claim(self):
+        width, height = self.tile_size
+        return self.num_cols * width, self.num_rows * height
+
+    def do_regroup(self):
+        self.do_undraw()
+
+    def do_draw(self):
+        # The tiles are positioned relative to the widget, so every chunk has 
+        # to be remade if the widget moves.
+        self.do_undraw()
+        self._update_chunks()
+
+    def do_undraw(self):
+        for vertex_lists in self._chunks.values():
+            for vertex_list in vertex_lists:
+                vertex_list.delete()
+
+        self._chunks = {}
+
+    def get_tiles(self):
+        return self._tiles
+
+    def set_tiles(self, new_tiles):
+        self._tiles = new_tiles
+        self._repack()
+
+    def get_tile(self, i, j):
+        return self._tiles[i][j]
+
+    def set_tile(self, i, j, new_index):
+        """
+        Change the index of the tile in the given row and column, and update 
+        the chunk it's in if that chunk is being shown.
+        """
+        self._tiles[i][j] = new_index
+
+        key = i // self._chunk_size, j // self._chunk_size
+        if key in self._chunks:
+            for vertex_list in self._chunks.pop(key):
+                vertex_list.delete()
+            self._chunks[key] = self._make_chunk(*key)
+
+    def get_images(self):
+        return self._images
+
+    def set_images(self, new_images):
+        self._images = new_images
+        self._tile_info = {}
+        self._repack()
+
+    def get_tile_size(self):
+        if self._tile_size is not None:
+            return self._tile_size
+
+        images = self._images.values() \
+                if hasattr(self._images, 'values') else self._images
+
+        for image in images:
+            if image is not None:
+                return image.width, image.height
+
+        return 0, 0
+
+    def set_tile_size(self, new_size):
+        self._tile_size = new_size
+        self._repack()
+
+    def get_chunk_size(self):
+        return self._chunk_size
+
+    def set_chunk_size(self, new_size):
+        self._chunk_size = new_size
+        self._draw()
+
+    def get_chunks(self):
+        """
+        Return the row and column of every chunk that's currently being shown.  
+        The chunk in row i and column j contains the tiles in rows ``i * 
+        chunk_size`` to ``(i + 1) * chunk_size`` and the corresponding columns.
+        """
+        return set(self._chunks)
+
+    def get_num_rows(self):
+        return len(self._tiles)
+
+    def get_num_cols(self):
+        return len(self._tiles[0]) if len(self._tiles) else 0
+
+    def _on_view_changed(self, pane):
+        self._update_chunks()
+
+    def _update_chunks(self):
+        """
+        Make the chunks that are in view, and delete those that are more than 
+        a chunk away from it.
+        """
+        if self.root is None or self.rect is None or self.group is None:
+            return
+        if self.is_hidden:
+            return
+
+        view = self._get_view_rect()
+        width, height = self.tile_size
+
+        if view is None or not width or not height:
+            self.do_undraw()
+            return
+
+        n = self._chunk_size
+        rows = range(
+                max(math.floor((self.rect.top - view.top) / height) // n, 0),
+                min(-(-math.ceil((self.rect.top - view.bottom) / height) // n),
+                    -(-self.num_rows // n)),
+        )
+        cols = range(
+                max(math.floor((view.left - self.rect.left) / width) // n, 0),
+                min(-(-math.ceil((view.right - self.rect.left) / width) // n),
+                    -(-self.num_cols // n)),
+        )
+
+        for key in list(self._chunks):
+            i, j = key
+            if not (rows.start - 1 <= i <= rows.stop and 
+                    cols.start - 1 <= j <= cols.stop):
+                for vertex_list in self._chunks.pop(key):
+                    vertex_list.delete()
+
+        for i in rows:
+            for j in cols:
+                if (i, j) not in self._chunks:
+                    self._chunks[i, j] = self._make_chunk(i, j)
+
+    def _make_chunk(self, chunk_i, chunk_j):
+        n = self._chunk_size
+        width, height = self.tile_size
+        left, top = self.rect.left, self.rect.top
+        quads = {}  # {texture id: (texture, vertices, tex coords)}
+
+        for i in range(chunk_i * n, min((chunk_i + 1) * n, self.num_rows)):
+            row = self._tiles[i]
+            y = top - (i + 1) * height
+
+            for j in range(chunk_j * n, min((chunk_j + 1) * n, self.num_cols)):
+                info = self._get_tile_info(row[j])
+                if info is None:
+                    continue
+
+                texture, w, h, tex_coords = info
+                x = left + j * width
+
+                try:
+                    _, vertices, coords = quads[texture.id]
+                except KeyError:
+                    _, vertices, coords = quads[texture.id] = texture, [], []
+
+                vertices.extend((x, y, x + w, y, x + w, y + h, x, y + h))
+                coords.extend(tex_coords)
+
+        return [
+                self.batch.add(
+                    len(vertices) // 2,
+                    pyglet.gl.GL_QUADS,
+                    drawing.get_sprite_group(texture, parent=self.group),
+                    ('v2f/static', vertices),
+                    ('t3f/static', coords),
+                )
+                for texture, vertices, coords in quads.values()
+        ]
+
+    def _get_tile_info(self, index):
+        if index is None:
+            return None
+
+        try:
+            return self._tile_info[index]
+        except KeyError:
+            pass
+
+        image = self._images[index]
+
+        if image is None:
+            info = None
+        else:
+            texture = image.get_texture()
+            info = texture, image.width, image.height, texture.tex_coords
+
+        self._tile_info[index] = info
+        return info
+
+    def _get_view_rect(self):
+        """
+        Return the part of the GUI that can be seen, in the same coordinates as 
+        this widget, or None if that isn't known yet.
+        """
+        pane = self._pane
+
+        if pane is None:
+            return self.root.rect
+
+        if pane.rect is None or pane._mover.rect is None:
+            return None
+        if pane.child is None or pane.child.rect is None:
+            return None
+
+        return pane.view
+
+
+class _VirtualMover(Mover):
+    """
+    The mover used by `ListView` and `GridView`.
+
+    The part of the content that's in view can change even if the content 
+    itself isn't resized, e.g. when the view gets taller.  So the content is 
+    told to update its widgets every time the mover is resized.
+    """
+
+    def do_resize_children(self):
+        super().do_resize_children()
+        self.child._update_widgets()
+
+@autoprop
+class ListView(ScrollPane):
+    """
+    Scroll through a long list of items, only making widgets for the items 
+    that can actually be seen.
+
+    Putting every item in a `VBox` and scrolling the box with a `ScrollBox` 
+    works fine for short lists, but every item gets a widget (and vertex lists 
+    to go with it) and every widget gets laid out, even though all but a 
+    handful are clipped.  A list view instead makes widgets only for the rows 
+    that are in view, plus a few extra rows above and below (see 
+    `custom_overscan`).  As the list is scrolled, the rows that leave the view 
+    are reused for the rows that come into view.  This means that the number of 
+    widgets, and the time it takes to scroll, don't depend on how many items 
+    there are.
+
+    The items can be any sequence.  Widgets are made for them with the 
+    ``make_row`` callback, which is given an item and should return a new 
+    widget to display it.  If a ``bind_row`` callback is also given, it is 
+    called with an existing row widget and a new item whenever that widget is 
+    reused, and should update the widget to display the new item.  Without 
+    ``bind_row``, rows that leave the view are discarded and new widgets are 
+    made for the rows that come into view.  Subclasses can reimplement 
+    `do_make_row()` and `do_bind_row()` instead of providing callbacks, which 
+    is convenient when the list view is the ``Pane`` inner class of a 
+    `ScrollBox`:
+
+    >>> class Names(glooey.ListView):
+    ...     def do_make_row(self, item):
+    ...         return glooey.Label(item)
+    ...     def do_bind_row(self, row, item):
+    ...         row.text = item
+    ...         return True
+    ...
+    >>> class NameBox(glooey.ScrollBox):
+    ...     Pane = Names
+    ...     class VBar(glooey.VScrollBar):
+    ...         ...
+    ...
+    >>> box = NameBox()
+    >>> box.pane.items = names
+
+    By default every row is `custom_row_height` pixels tall, so the position of 
+    every row can be calculated without looking at any widgets.  The rows are 
+    given exactly this much space, so they can't claim more.  If 
+    `custom_variable_row_height` is enabled, each row is instead as tall as it 
+    claims to be, and `custom_row_height` is just an estimate used for the 
+    rows that haven't been shown yet.  In this case the list may get taller or 
+    shorter as new rows are shown and measured.
+
+    If the items are changed in place, call `refresh()` to update the rows 
+    that are being shown.
+    """
+    Mover = _VirtualMover
+    custom_vert_scrolling = True
+    custom_cull_margin = None
+
+    custom_row_height = 20
+    """
+    The height of each row, in pixels.  If `custom_variable_row_height` is 
+    enabled, this is only an estimate for the rows that haven't been measured 
+    yet.
+    """
+
+    custom_variable_row_height = False
+    """
+    If true, each row is as tall as it claims to be.  Otherwise, every row is 
+    exactly `custom_row_height` pixels tall.
+    """
+
+    custom_overscan = 2
+    """
+    How many rows to keep ready above and below the rows that are actually 
+    visible, so that they don't have to be made at the last moment.
+    """
+
+    def __init__(self, items=None, make_row=None, bind_row=None):
+        super().__init__()
+
+        self._items = items if items is not None else []
+        self._make_row = make_row
+        self._bind_row = bind_row
+        self._row_height = self.custom_row_height
+        self._variable_row_height = self.custom_variable_row_height
+        self._overscan = self.custom_overscan
+
+        self._content = _ListRows(self)
+        super().add(self._content)
+
+    def add(self, child):
+        raise UsageError("can't add widgets to a ListView; set its items instead.")
+
+    def clear(self):
+        self.items = []
+
+    def refresh(self):
+        """
+        Update the rows being shown to reflect any changes made to the items.
+
+        Call this method after changing the sequence of items in place, e.g. by 
+        appending, removing, or replacing items.  Every row being shown is 
+        rebound (or remade) and, if the heights of the rows are variable, 
+        remeasured.
+        """
+        self._content._reset()
+
+    def jump_to_item(self, index):
+        """
+        Scroll so that the row for the given item is at the top of the view.
+        """
+        self._require_rects()
+        content = self._content
+        offset = content._heights.get_offset(index)
+        self.jump((0, content.rect.height - offset - self.rect.height))
+
+    def do_make_row(self, item):
+        """
+        Return a new widget to display the given item.
+
+        The default implementation calls the ``make_row`` callback given to 
+        the constructor.
+        """
+        if self._make_row is None:
+            raise UsageError(f"{self} doesn't know how to make rows; provide a make_row() callback or reimplement do_make_row().")
+
+        return self._make_row(item)
+
+    def do_bind_row(self, row, item):
+        """
+        Update a row widget that was showing one item to show another, and 
+        return True.  Return False if the widget can't be reused for the given 
+        item, in which case it is discarded and a new one is made.
+
+        The default implementation calls the ``bind_row`` callback given to 
+        the constructor, or returns False if there isn't one.
+        """
+        if self._bind_row is None:
+            return False
+
+        self._bind_row(row, item)
+        return True
+
+    def on_translate(self, mover):
+        self._content._update_widgets()
+        super().on_translate(mover)
+
+    def get_items(self):
+        return self._items
+
+    def set_items(self, new_items):
+        self._items = new_items
+        self._content._reset()
+
+    def get_rows(self):
+        """
+        Return a dictionary of the rows that currently have widgets, where the 
+        keys are indices into the items and the values are the widgets.
+        """
+        return dict(self._content._widgets)
+
+    def get_make_row(self):
+        return self._make_row
+
+    def set_make_row(self, new_callback):
+        self._make_row = new_callback
+        self._content._reset(keep_widgets=False)
+
+    def get_bind_row(self):
+        return self._bind_row
+
+    def set_bind_row(self, new_callback):
+        self._bind_row = new_callback
+
+    def get_row_height(self):
+        return self._row_height
+
+    def set_row_height(self, new_height):
+        self._row_height = new_height
+        self._content._reset()
+
+    def get_variable_row_height(self):
+        return self._variable_row_height
+
+    def set_variable_row_height(self, new_bool):
+        self._variable_row_height = new_bool
+        self._content._reset()
+
+    def get_overscan(self):
+        return self._overscan
+
+    def set_overscan(self, new_overscan):
+        self._overscan = new_overscan
+        self._content._update_widgets()
+
+
+@autoprop
+class GridView(ScrollPane):
+    """
+    Scroll through a big grid of cells, e.g. a spreadsheet or a palette of 
+    icons, only making widgets for the cells that can actually be seen.
+
+    This is the two-dimensional counterpart to `ListView`.  Putting every cell 
+    in a `Grid` means that startup time and memory grow with the number of 
+    cells, even though only a handful of them are visible at once.  A grid view 
+    instead makes widgets only for the cells that are in view, plus a few extra 
+    rows and columns around them (see `custom_overscan`), and reuses those 
+    widgets as the view moves.
+
+    The rows and columns are laid out just like in a `Grid`, except that every 
+    row and column has a fixed size (see `custom_cell_width`, 
+    `custom_cell_height`, `set_row_height()`, and `set_col_width()`).  That 
+    way, the cells in view and the cell under the mouse can be found by 
+    searching the row and column boundaries, without looking at any widgets.
+
+    Widgets are made for the cells with the ``make_cell`` callback, which is 
+    given a row and column index and should return a new widget (or None, if 
+    the cell should be empty).  If a ``bind_cell`` callback is also given, it's 
+    called with an existing widget and a new row and column index whenever 
+    that widget is reused, and should update the widget to show the new cell.  
+    Subclasses can reimplement `do_make_cell()` and `do_bind_cell()` instead 
+    of providing callbacks.  For example, a palette of icons might look like 
+    this:
+
+    >>> class Palette(glooey.GridView):
+    ...     custom_num_cols = 8
+    ...     custom_cell_width = custom_cell_height = 32
+    ...
+    ...     def __init__(self, icons):
+    ...         super().__init__(num_rows=math.ceil(len(icons) / 8))
+    ...         self.icons = icons
+    ...
+    ...     def do_make_cell(self, i, j):
+    ...         icon = self._get_icon(i, j)
+    ...         return glooey.Image(icon) if icon else None
+    ...
+    ...     def do_bind_cell(self, cell, i, j):
+    ...         icon = self._get_icon(i, j)
+    ...         if icon: cell.image = icon
+    ...         return icon is not None
+    ...
+    ...     def _get_icon(self, i, j):
+    ...         k = 8 * i + j
+    ...         return self.icons[k] if k < len(self.icons) else None
+
+    If the data being shown changes, call `refresh()` to update the cells 
+    that are being shown.
+    """
+    Mover = _VirtualMover
+    custom_horz_scrolling = True
+    custom_vert_scrolling = True
+    custom_cull_margin = None
+
+    custom_num_rows = 0
+    """
+    The number of rows in the grid.
+    """
+
+    custom_num_cols = 0
+    """
+    The number of columns in the grid.
+    """
+
+    custom_cell_width = 50
+    """
+    The default width of each column, in pixels.  See `set_col_width()`.
+    """
+
+    custom_cell_height = 50
+    """
+    The default height of each row, in pixels.  See `set_row_height()`.
+    """
+
+    custom_cell_padding = 0
+    """
+    The amount of space between adjacent rows and columns.
+    """
+
+    custom_overscan = 1
+    """
+    How many rows and columns to keep ready around the cells that are actually 
+    visible, so that they don't have to be made at the last moment.
+    """
+
+    def __init__(self, num_rows=None, num_cols=None, make_cell=None, 
+            bind_cell=None):
+        super().__init__()
+
+        self._make_cell = make_cell
+        self._bind_cell = bind_cell
+        self._overscan = self.custom_overscan
+
+        self._content = _GridCells(self)
+        super().add(self._content)
+
+        if num_rows is not None:
+            self.num_rows = num_rows
+        if num_cols is not None:
+            self.num_cols = num_cols
+
+    def add(self, child):
+        raise UsageError("can't add widgets to a GridView; set its number of rows and columns instead.")
+
+    def clear(self):
+        with self.hold_updates():
+            self.num_rows = 0
+            self.num_cols = 0
+
+    def refresh(self):
+        """
+        Update the cells being shown to reflect any changes to the data.
+
+        Every cell being shown is rebound (or remade).
+        """
+        self._content._reset()
+
+    def jump_to_cell(self, i, j):
+        """
+        Scroll so that the given cell is in the top left corner of the view.
+        """
+        self._require_rects()
+        content = self._content
+        cell_rect = content._grid.get_cell_rect(i, j)
+        self.jump((
+                cell_rect.left - content.rect.left,
+                cell_rect.top - content.rect.bottom - self.rect.height,
+        ))
+
+    def find_cell_under_mouse(self, x, y):
+        """
+        Return the (row, col) of the cell under the given mouse coordinate, or 
+        None if there isn't one.
+
+        It doesn't matter whether or not the cell has a widget, so this can be 
+        used to react to clicks on empty cells.
+        """
+        if self.rect is None or not self.is_under_mouse(x, y):
+            return None
+
+        x, y = self._mover.screen_to_child_coords(x, y)
+        return self._content._grid.find_cell_under_mouse(x, y)
+
+    def do_make_cell(self, i, j):
+        """
+        Return a new widget to display the given cell, or None if the cell 
+        should be empty.
+
+        The default implementation calls the ``make_cell`` callback given to 
+        the constructor.
+        """
+        if self._make_cell is None:
+            raise UsageError(f"{self} doesn't know how to make cells; provide a make_cell() callback or reimplement do_make_cell().")
+
+        return self._make_cell(i, j)
+
+    def do_bind_cell(self, cell, i, j):
+        """
+        Update a widget that was showing one cell to show another, and return 
+        True.  Return False if the widget can't be reused for the given cell 
+        (e.g. because the cell is empty), in which case it is discarded and 
+        `do_make_cell()` is called instead.
+
+        The default implementation calls the ``bind_cell`` callback given to 
+        the constructor, or returns False if there isn't one.
+        """
+        if self._bind_cell is None:
+            return False
+
+        return self._bind_cell(cell, i, j) is not False
+
+    def on_translate(self, mover):
+        self._content._update_widgets()
+        super().on_translate(mover)
+
+    def get_cells(self):
+        """
+        Return a dictionary of the cells that currently have widgets, where the 
+        keys are (row, col) tuples and the values are the widgets.
+        """
+        return dict(self._content._widgets)
+
+    def get_make_cell(self):
+        return self._make_cell
+
+    def set_make_cell(self, new_callback):
+        self._make_cell = new_callback
+        self._content._reset(keep_widgets=False)
+
+    def get_bind_cell(self):
+        return self._bind_cell
+
+    def set_bind_cell(self, new_callback):
+        self._bind_cell = new_callback
+
+    def get_num_rows(self):
+        return self._content._grid.requested_num_rows
+
+    def set_num_rows(self, new_num):
+        self._content._grid.num_rows = new_num
+        self._content._relayout()
+
+    def get_num_cols(self):
+        return self._content._grid.requested_num_cols
+
+    def set_num_cols(self, new_num):
+        self._content._grid.num_cols = new_num
+        self._content._relayout()
+
+    def get_cell_width(self):
+        return self._content._grid.default_col_width
+
+    def set_cell_width(self, new_width):
+        self._content._grid.default_col_width = new_width
+        self._content._relayout()
+
+    def get_cell_height(self):
+        return self._content._grid.default_row_height
+
+    def set_cell_height(self, new_height):
+        self._content._grid.default_row_height = new_height
+        self._content._relayout()
+
+    def get_cell_padding(self):
+        return self._content._grid.inner_padding
+
+    def set_cell_padding(self, new_padding):
+        self._content._grid.inner_padding = new_padding
+        self._content._relayout()
+
+    def get_row_height(self, row):
+        """
+        Return the height of the given row, or the default cell height if it 
+        hasn't been set.
+        """
+        return self._content._grid.requested_row_heights.get(
+                row, self.cell_height)
+
+    def set_row_height(self, row, new_height):
+        """
+        Make the given row a different height than the rest.
+        """
+        self._content._grid.set_row_height(row, new_height)
+        self._content._relayout()
+
+    def del_row_height(self, row):
+        """
+        Make the given row the default cell height again.
+        """
+        self._content._grid.del_row_height(row)
+        self._content._relayout()
+
+    def get_col_width(self, col):
+        """
+        Return the width of the given column, or the default cell width if it 
+        hasn't been set.
+        """
+        return self._content._grid.requested_col_widths.get(
+                col, self.cell_width)
+
+    def set_col_width(self, col, new_width):
+        """
+        Make the given column a different width than the rest.
+        """
+        self._content._grid.set_col_width(col, new_width)
+        self._content._relayout()
+
+    def del_col_width(self, col):
+        """
+        Make the given column the default cell width again.
+        """
+        self._content._grid.del_col_width(col)
+        self._content._relayout()
+
+    def get_overscan(self):
+        return self._overscan
+
+    def set_overscan(self, new_overscan):
+        self._overscan = new_overscan
+        self._content._update_widgets()
+
+
+class _VirtualContent(Widget):
+    """
+    The widget scrolled by `ListView` and `GridView`.
+
+    It claims enough space for every item, but only has children for the items 
+    near the view.  Those children are positioned where they would be if every 
+    item had a widget.  Each child is identified by a key, e.g. the index of a 
+    row or the (row, col) of a cell.  Subclasses decide which keys are near the 
+    view, where the widget for each key goes, and how to make and bind those 
+    widgets.
+    """
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = view
+        self._widgets = {}  # {key: widget}
+        self._spare_widgets = []
+        self._keys = None
+        self._is_updating = False
+        self._children_can_overlap = False
+
+        # Scrolling only adds and rebinds a few widgets at a time, and the rest 
+        # of the widgets stay where they are.  So unless the layout itself 
+        # changes, only the widgets that were just added or rebound need to be 
+        # resized.
+        self._unplaced_widgets = {}  # {widget: key}
+        self._placed_rect = None
+        self._is_layout_stale = True
+
+    def do_child_claim_changed(self, child):
+        # The widgets that were just added or rebound will be resized anyway, 
+        # but if any other widget changes size, lay everything out again.
+        if child not in self._unplaced_widgets:
+            self._is_layout_stale = True
+
+    def do_resize_children(self):
+        # Widgets that are being bound to new items may repack this widget 
+        # before the update is finished.  The update repacks this widget once 
+        # it's done, so there's no need to lay anything out in the meantime.
+        if self._is_updating:
+            return
+
+        # If the view got bigger, more widgets may be needed.  Those widgets 
+        # need to be claimed before they can be resized, so this method will be 
+        # called again once they have been.
+        if self._sync_widgets():
+            self._repack()
+            return
+
+        if self._is_layout_stale or self.rect != self._placed_rect:
+            widgets = self._widgets.items()
+        else:
+            widgets = [(k, w) for w, k in self._unplaced_widgets.items()]
+
+        for key, widget in widgets:
+            widget._resize(self._get_rect(key))
+
+        self._unplaced_widgets = {}
+        self._placed_rect = self.rect
+        self._is_layout_stale = False
+
+    def do_find_children_near_mouse(self, x, y):
+        if self.rect is None:
+            return
+
+        widget = self._widgets.get(self._find_key(x, y))
+
+        if widget is not None:
+            yield widget
+
+    def _update_widgets(self):
+        if self._sync_widgets():
+            self._repack()
+
+    def _relayout(self):
+        """
+        Lay out every widget again, e.g. because the sizes of the rows or 
+        columns changed.
+        """
+        self._is_layout_stale = True
+        self._repack()
+
+    def _reset(self, keep_widgets=True):
+        """
+        Forget which items the widgets are showing, e.g. because the items 
+        changed.  Unless ``keep_widgets`` is false, the widgets are kept so 
+        they can be reused.
+        """
+        if keep_widgets:
+            self._spare_widgets.extend(self._widgets.values())
+        else:
+            for widget in self._widgets.values():
+                self._detach_child(widget)
+
+        self._widgets = {}
+        self._unplaced_widgets = {}
+        self._keys = None
+
+        # The number of items may have changed, so repack even if no widgets 
+        # are being shown.  Widgets will be made as part of the repack if 
+        # possible.
+        self._sync_widgets()
+        self._relayout()
+
+    def _sync_widgets(self):
+        """
+        Make sure that every item near the view, and no other item, has a 
+        widget.
+
+        Return False if nothing had to be changed.  Otherwise, the widgets that 
+        were added or rebound still need to be claimed and resized.
+        """
+        keys = self._find_keys_near_view()
+
+        if not self._spare_widgets and keys == self._keys:
+            return False
+
+        widgets = self._widgets
+        unplaced_widgets = self._unplaced_widgets
+        spare_widgets = self._spare_widgets
+        self._spare_widgets = []
+        self._keys = keys
+
+        for key in list(widgets):
+            if key not in keys:
+                spare_widgets.append(widgets.pop(key))
+
+        self._is_updating = True
+
+        try:
+            for key in keys:
+                if key in widgets:
+                    continue
+
+                # Reuse the widgets that scrolled out of view, if possible.  The 
+                # widget is added to the dictionary before being bound, in case 
+                # binding it causes this widget to be claimed.
+                while spare_widgets and key not in widgets:
+                    widget = widgets[key] = spare_widgets.pop()
+                    unplaced_widgets[widget] = key
+
+                    if not self._bind_widget(widget, key):
+                        del widgets[key]
+                        del unplaced_widgets[widget]
+                        self._detach_child(widget)
+
+                # New widgets are regrouped right away, rather than regrouping 
+                # every widget once the update is done.
+                if key not in widgets:
+                    widget = self._make_widget(key)
+                    if widget is not None:
+                        widgets[key] = self._attach_child(widget)
+                        unplaced_widgets[widget] = key
+                        if self.group is not None:
+                            widget._regroup(self.group)
+
+            for widget in spare_widgets:
+                unplaced_widgets.pop(widget, None)
+                self._detach_child(widget)
+
+        finally:
+            self._is_updating = False
+
+        return True
+
+    def _get_view_rect(self):
+        """
+        Return the part of this widget that's visible in the view, or None if 
+        the view hasn't been given a size yet.  See `ScrollPane.get_view()`.
+        """
+        view = self._view
+
+        if self.rect is None or view.rect is None:
+            return None
+
+        mover = view._mover
+        left, bottom = \
+                view.rect.bottom_left - mover.rect.bottom_left - mover.position
+
+        return Rect(left, bottom, view.rect.width, view.rect.height)
+
+    def _find_keys_near_view(self):
+        raise NotImplementedError
+
+    def _find_key(self, x, y):
+        raise NotImplementedError
+
+    def _get_rect(self, key):
+        raise NotImplementedError
+
+    def _make_widget(self, key):
+        raise NotImplementedError
+
+    def _bind_widget(self, widget, key):
+        raise NotImplementedError
+
+
+class _ListRows(_VirtualContent):
+    """
+    The widget scrolled by `ListView`.  The keys are indices into the items.
+    """
+
+    def __init__(self, view):
+        super().__init__(view)
+        self._heights = _RowHeights(len(view.items), view.row_height)
+        self._max_row_width = 0
+
+    def do_claim(self):
+        heights = self._heights
+
+        # Measure the rows being shown.  The rows are claimed before this 
+        # widget, so these are their current heights.
+        if self._view.variable_row_height:
+            for i, row in self._widgets.items():
+                if heights.set_height(i, row.claimed_height):
+                    self._is_layout_stale = True
+
+        # Only ever get wider, so the list doesn't change width as it's 
+        # scrolled past rows of different widths.
+        for row in self._widgets.values():
+            self._max_row_width = max(self._max_row_width, row.claimed_width)
+
+        return self._max_row_width, heights.total
+
+    def _reset(self, keep_widgets=True):
+        self._heights = _RowHeights(len(self._view.items), self._view.row_height)
+        self._max_row_width = 0
+        super()._reset(keep_widgets)
+
+    def _find_keys_near_view(self):
+        """
+        Return the range of rows that are visible in the list view, padded on 
+        both ends by the amount of overscan.
+        """
+        view_rect = self._get_view_rect()
+        heights = self._heights
+
+        if view_rect is None or heights.num_rows == 0:
+            return range(0)
+
+        # Work out which part of this widget is visible, as distances down from 
+        # its top edge.
+        top_offset = self.rect.top - view_rect.top
+        bottom_offset = self.rect.top - view_rect.bottom
+
+        first = heights.find_row(top_offset)
+        last = heights.find_row(bottom_offset)
+
+        # The bottom edge of the view is exclusive.  Don't count the row below 
+        # the view if the view ends right where that row begins.
+        if last > first and heights.get_offset(last) >= bottom_offset:
+            last -= 1
+
+        overscan = self._view.overscan
+        return range(
+                max(first - overscan, 0),
+                min(last + 1 + overscan, heights.num_rows),
+        )
+
+    def _find_key(self, x, y):
+        if self._heights.num_rows:
+            return self._heights.find_row(self.rect.top - y)
+
+    def _get_rect(self, i):
+        heights = self._heights
+        height = heights.get_height(i)
+        bottom = self.rect.top - heights.get_offset(i) - height
+        return Rect(self.rect.left, bottom, self.rect.width, height)
+
+    def _make_widget(self, i):
+        return self._view.do_make_row(self._view.items[i])
+
+    def _bind_widget(self, row, i):
+        return self._view.do_bind_row(row, self._view.items[i])
+
+
+class _GridCells(_VirtualContent):
+    """
+    The widget scrolled by `GridView`.  The keys are (row, col) tuples.
+
+    The rows and columns are laid out by a sparse `drawing.Grid`, which knows 
+    where every row and column is without having to make a rect for every 
+    cell.
+    """
+
+    def __init__(self, view):
+        super().__init__(view)
+        self._grid = drawing.Grid(
+                num_rows=view.custom_num_rows,
+                num_cols=view.custom_num_cols,
+                default_row_height=view.custom_cell_height,
+                default_col_width=view.custom_cell_width,
+                inner_padding=view.custom_cell_padding,
+                sparse=True,
+        )
+
+    def do_claim(self):
+        return self._grid.make_claim()
+
+    def _find_keys_near_view(self):
+        """
+        Return the cells that are visible in the grid view, padded on all sides 
+        by the amount of overscan.
+        """
+        view_rect = self._get_view_rect()
+
+        if view_rect is None:
+            return _CellRange(range(0), range(0))
+
+        # This is called before the cells are resized, so make sure the rows 
+        # and columns are laid out.  Nothing is recalculated unless something 
+        # changed.
+        self._grid.make_cells(self.rect)
+
+        rows, cols = self._grid.find_cells_in_rect(view_rect)
+        overscan = self._view.overscan
+
+        def pad(lines, num_lines):
+            if not lines:
+                return lines
+            return range(
+                    max(lines.start - overscan, 0),
+                    min(lines.stop + overscan, num_lines),
+            )
+
+        return _CellRange(
+                pad(rows, self._grid.num_rows),
+                pad(cols, self._grid.num_cols),
+        )
+
+    def _find_key(self, x, y):
+        return self._grid.find_cell_under_mouse(x, y)
+
+    def _get_rect(self, cell):
+        return self._grid.get_cell_rect(*cell)
+
+    def _make_widget(self, cell):
+        return self._view.do_make_cell(*cell)
+
+    def _bind_widget(self, widget, cell):
+        return self._view.do_bind_cell(widget, *cell)
+
+
+class _RowHeights:
+    """
+    Convert between row indices and distances from the top of a `ListView`.
+
+    Rows that haven't been measured are assumed to have the default height, so 
+    no memory is needed for the rows of a list with fixed-height rows.  Once 
+    rows start being measured, the differences between their heights and the 
+    default height are kept in a Fenwick tree (a.k.a. binary indexed tree).  
+    This makes it possible to change the height of a row, to find the offset 
+    of a row, and to find the row at an offset in O(log n) time, without ever 
+    having to iterate over all the rows.
+    """
+
+    def __init__(self, num_rows, default_height):
+        self.num_rows = num_rows
+        self.default_height = default_height
+        self.heights = {}   # {index: measured height}
+        self.tree = None
+        self.total = num_rows * default_height
+
+    def get_height(self, i):
+        return self.heights.get(i, self.default_height)
+
+    def set_height(self, i, height):
+        delta = height - self.get_height(i)
+        if not delta:
+            return False
+
+        if self.tree is None:
+            self.tree = array('d', bytes(8 * (self.num_rows + 1)))
+
+        self.heights[i] = height
+        self.total += delta
+
+        j = i + 1
+        while j <= self.num_rows:
+            self.tree[j] += delta
+            j += j & -j
+
+        return True
+
+    def get_offset(self, i):
+        """
+        Return the distance from the top of the list to the top of the given 
+        row.
+        """
+        offset = i * self.default_height
+
+        if self.tree is not None:
+            j = i
+            while j > 0:
+                offset += self.tree[j]
+                j -= j & -j
+
+        return offset
+
+    def find_row(self, offset):
+        """
+        Return the index of the row at the given distance from the top of the 
+        list.  Offsets above the first row or below the last row give the 
+        first and last rows, respectively.
+        """
+        if self.tree is None:
+            if self.default_height <= 0:
+                return 0
+            i = int(offset // self.default_height)
+            return clamp(i, 0, self.num_rows - 1)
+
+        # Descend the tree, skipping over blocks of rows that end before the 
+        # offset.  This finds the number of rows that are completely above the 
+        # offset, which is also the index of the row that contains it.
+        i = 0
+        step = 1 << self.num_rows.bit_length()
+
+        while step:
+            j = i + step
+            if j <= self.num_rows:
+                block = step * self.default_height + self.tree[j]
+                if block <= offset:
+                    i = j
+                    offset -= block
+            step >>= 1
+
+        return min(i, self.num_rows - 1)
+
+
+class _CellRange:
+    """
+    The cells in the given ranges of rows and columns.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+
+    def __eq__(self, other):
+        return isinstance(other, _CellRange) and \
+                (self.rows, self.cols) == (other.rows, other.cols)
+
+    def __contains__(self, cell):
+        i, j = cell
+        return i in self.rows and j in self.cols
+
+    def __iter__(self):
+        for i in self.rows:
+            for j in self.cols:
+                yield i, j
@@ -7,6 +7,7 @@ Widgets that can display and input text.
 import pyglet
 import autoprop
 
+from collections import OrderedDict
 from vecrec import Vector, Rect
 from glooey import drawing
 from glooey.widget import Widget
@@ -33,6 +34,9 @@ class Label(Widget):
     def __init__(self, text=None, line_wrap=None, **style):
         super().__init__()
         self._layout = None
+        self._layout_key = None
+        self._layout_style = {}
+        self._is_updating_document = False
         self._text = text or self.custom_text
         self._line_wrap_width = 0
         self._style = {}
@@ -69,97 +73,56 @@ class Label(Widget):
         return repr.format(**args)
 
     def do_claim(self):
-        # Make sure the label's text and style are up-to-date before we request 
-        # space.  Be careful!  This means that do_draw() can be called before 
-        # the widget has self.rect or self.group, which usually cannot happen.
-        self.do_draw(ignore_rect=True)
-
-        # Return the amount of space needed to render the label.
-        return self._layout.content_width, self._layout.content_height
-
-    def do_draw(self, ignore_rect=False):
-        # Any time we need to draw this widget, just delete the underlying 
-        # label object and make a new one.  This isn't any slower than keeping 
-        # the old object, because all the vertex lists would be redrawn either 
-        # way.  And this is more flexible, because it allows us to reset the 
-        # batch, the group, and the wrap_lines attribute.
-        if self._layout is not None:
-            self._layout.delete()
+        # Measure the text without making the layout that will draw it.  Most 
+        # labels (e.g. "OK", "Cancel", column headers) have the same text and 
+        # style as some other label, so this is usually just a cache lookup.
+        return measure_text(self._text, self._style, self._line_wrap_width)
 
-        kwargs = {
-                'multiline': True,
-                'wrap_lines': False,
-                'batch': self.batch,
-                'group': self.group
-        }
-        # Usually self.rect is guaranteed to be set by the time this method is 
-        # called, but that is not the case for this widget.  The do_claim() 
-        # method needs to call do_draw() to see how much space the text will 
-        # need, and that happens before self.rect is set (since it's part of 
-        # the process of setting self.rect). 
-        if not ignore_rect:
-            kwargs['width'] = self.rect.width
-            kwargs['height'] = self.rect.height
+    def do_draw(self):
+        self._update_layout()
+
+        # Resize and move the layout in a single update, because each of these 
+        # changes would otherwise lay out the text all over again.
+        self._layout.begin_update()
 
         # Enable line wrapping, if the user requested it.  The width of the 
         # label is set to the value given by the user when line-wrapping was 
-        # enabled.  This is done after the size of the assigned rect is 
-        # considered, so the text will wrap at the specified line width no 
-        # matter how much space is available to it.  This ensures that the text 
-        # takes up all of the height it requested.  It would be better if the 
-        # text could update its height claim after knowing how much width it 
-        # got, but that's a non-trivial change.
+        # enabled, rather than the width of the assigned rect, so the text will 
+        # wrap at the specified line width no matter how much space is 
+        # available to it.  This ensures that the text takes up all of the 
+        # height it requested.  It would be better if the text could update its 
+        # height claim after knowing how much width it got, but that's a 
+        # non-trivial change.
         if self._line_wrap_width:
-            kwargs['width'] = self._line_wrap_width
-            kwargs['wrap_lines'] = True
-        
-        # It's best to make a fresh document each time.  Previously I was 
-        # storing the document as a member variable, but I ran into corner 
-        # cases where the document would have an old style that wouldn't be 
-        # compatible with the new TextLayout (specifically 'align' != 'left' if 
-        # line wrapping is no loner enabled).
-        document = pyglet.text.decode_text(self._text)
-        document.push_handlers(self.on_insert_text, self.on_delete_text)
-
-        if self._layout:
-            self._layout.delete()
-        self._layout = self.do_make_new_layout(document, kwargs)
-
-        # Use begin_update() and end_update() to prevent the layout from 
-        # generating new vertex lists until the styles and coordinates have 
-        # been set.
-        self._layout.begin_update()
-
-        # The layout will crash if it doesn't have an explicit width and the 
-        # style specifies an alignment.
-        if self._layout.width is None:
-            self._layout.width = self._layout.content_width
-
-        document.set_style(0, len(self._text), self._style)
-
-        if not ignore_rect:
-            self._layout.x = self.rect.bottom_left.x
-            self._layout.y = self.rect.bottom_left.y
+            self._layout.width = self._line_wrap_width
+        else:
+            self._layout.width = self.rect.width
 
+        self._layout.height = self.rect.height
+        self._layout.x = self.rect.bottom_left.x
+        self._layout.y = self.rect.bottom_left.y
         self._layout.end_update()
 
     def do_undraw(self):
         if self._layout is not None:
             self._layout.delete()
+            self._invalidate_layout()
 
     def do_make_new_layout(self, document, kwargs):
         return pyglet.text.layout.TextLayout(document, **kwargs)
 
     def on_insert_text(self, start, text):
-        self._text = self._layout.document.text
-        self.dispatch_event('on_edit_text', self)
+        if not self._is_updating_document:
+            self._text = self._layout.document.text
+            self.dispatch_event('on_edit_text', self)
 
     def on_delete_text(self, start, end):
-        self._text = self._layout.document.text
-        self.dispatch_event('on_edit_text', self)
+        if not self._is_updating_document:
+            self._text = self._layout.document.text
+            self.dispatch_event('on_edit_text', self)
 
     def get_text(self):
-        return self._layout.document.text
+        return self._text
 
     def set_text(self, text, width=None, **style):
         self._text = text
@@ -313,6 +276,181 @@ class Label(Widget):
 
         self._repack()
 
+    def _update_layout(self):
+        """
+        Make sure the layout shows the current text and style.
+
+        The same document and layout are kept for as long as possible, and 
+        only the text and style that changed are given to them.  A new layout 
+        is only made if there isn't one yet, if the batch or group changed, or 
+        if line wrapping was turned on or off.
+        """
+        layout_key = self.batch, self.group, bool(self._line_wrap_width)
+
+        if self._layout is None or self._layout_key != layout_key:
+            self._make_layout()
+            self._layout_key = layout_key
+            return
+
+        document = self._layout.document
+        style = {
+                k: self._style.get(k)
+                for k in self._style.keys() | self._layout_style.keys()
+                if self._style.get(k) != self._layout_style.get(k)
+        }
+        is_new_text = document.text != self._text
+        is_new_width = self._line_wrap_width and \
+                self._layout.width != self._line_wrap_width
+
+        if not (is_new_text or is_new_width or style):
+            return
+
+        self._layout.begin_update()
+        self._is_updating_document = True
+
+        try:
+            # Only replace the part of the text that changed.  Labels that are 
+            # updated every frame (e.g. counters) usually only change a few 
+            # characters at the end.
+            if is_new_text:
+                i = _find_common_prefix(document.text, self._text)
+                document.delete_text(i, len(document.text))
+                document.insert_text(i, self._text[i:])
+
+            # Changing only the color is much faster than changing anything 
+            # else, because the text doesn't have to be laid out again.
+            if style:
+                document.set_style(0, len(self._text), style)
+                self._layout_style = self._style.copy()
+
+            if is_new_width:
+                self._layout.width = self._line_wrap_width
+
+        finally:
+            self._is_updating_document = False
+            self._layout.end_update()
+
+    def _make_layout(self):
+        if self._layout is not None:
+            self._layout.delete()
+
+        kwargs = {
+                'multiline': True,
+                'wrap_lines': bool(self._line_wrap_width),
+                'batch': self.batch,
+                'group': self.group
+        }
+        if self._line_wrap_width:
+            kwargs['width'] = self._line_wrap_width
+
+        # Make a fresh document whenever a new layout is needed.  Previously I 
+        # was storing the document as a member variable, but I ran into corner 
+        # cases where the document would have an old style that wouldn't be 
+        # compatible with the new TextLayout (specifically 'align' != 'left' if 
+        # line wrapping is no loner enabled).
+        document = pyglet.text.decode_text(self._text)
+        document.push_handlers(self.on_insert_text, self.on_delete_text)
+
+        self._layout = self.do_make_new_layout(document, kwargs)
+
+        # Use begin_update() and end_update() to prevent the layout from 
+        # generating new vertex lists until the styles and coordinates have 
+        # been set.
+        self._layout.begin_update()
+
+        # The layout will crash if it doesn't have an explicit width and the 
+        # style specifies an alignment.
+        if self._layout.width is None:
+            self._layout.width = self._layout.content_width
+
+        document.set_style(0, len(self._text), self._style)
+        self._layout_style = self._style.copy()
+        self._layout.end_update()
+
+    def _invalidate_layout(self):
+        """
+        Make a new layout the next time the label is drawn, e.g. because an 
+        attribute that can only be given to the layout's constructor changed.
+        """
+        self._layout_key = None
+
+
+def measure_text(text, style, wrap_width=0):
+    """
+    Return the width and height that the given text would take up if it were 
+    drawn with the given style.
+
+    The text is laid out without making any vertex lists, and the result is 
+    cached.  The cache only remembers the most recently measured texts (see 
+    `max_text_measurements`), and can be emptied with 
+    `clear_text_measurements()`, e.g. if new fonts were loaded.
+    """
+    if not text:
+        return 0, 0
+
+    style = {
+            k: tuple(v) if isinstance(v, list) else v
+            for k, v in style.items()
+            if k not in _styles_not_affecting_size
+    }
+    key = text, wrap_width, frozenset(style.items())
+
+    try:
+        _text_measurements.move_to_end(key)
+        return _text_measurements[key]
+    except KeyError:
+        pass
+
+    document = pyglet.text.decode_text(text)
+    document.set_style(0, len(text), style)
+    layout = _MeasuringLayout(
+            document,
+            width=wrap_width or None,
+            multiline=True,
+            wrap_lines=bool(wrap_width),
+    )
+    size = _text_measurements[key] = layout.content_width, layout.content_height
+
+    while len(_text_measurements) > max_text_measurements:
+        _text_measurements.popitem(last=False)
+
+    return size
+
+def clear_text_measurements():
+    """
+    Forget every size that was cached by `measure_text()`.
+    """
+    _text_measurements.clear()
+
+# The maximum number of sizes that `measure_text()` will remember.
+max_text_measurements = 1024
+
+_text_measurements = OrderedDict()
+
+# These styles don't change how the text is laid out.  The alignment is left 
+# out because it only moves lines around within the width of the layout, and 
+# it would crash a layout with no width.
+_styles_not_affecting_size = {
+        'color', 'background_color', 'underline', 'align',
+}
+
+class _MeasuringLayout(pyglet.text.layout.TextLayout):
+    """
+    A text layout that calculates `content_width` and `content_height`, but 
+    doesn't make any vertex lists.
+    """
+
+    def _update(self):
+        if self._document.text:
+            self._get_lines()
+
+def _find_common_prefix(a, b):
+    n = min(len(a), len(b))
+    for i in range(n):
+        if a[i] != b[i]:
+            return i
+    return n
+
 
 @autoprop
 @register_event_type('on_focus')
@@ -457,6 +595,7 @@ class EditableLabel(Label):
 
     def set_selection_color(self, new_color):
         self._selection_color = new_color
+        self._invalidate_layout()
         self._draw()
 
     def get_selection_background_color(self):
@@ -464,6 +603,7 @@ class EditableLabel(Label):
 
     def set_selection_background_color(self, new_color):
         self._selection_background_color = new_color
+        self._invalidate_layout()
         self._draw()
 
     def get_unfocus_on_enter(self):
@@ -5,6 +5,7 @@ The base class from which all widgets derive.
 """
 
 import time
+import heapq
 import pyglet
 import autoprop
 
@@ -233,6 +234,27 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
     children.
     """
 
+    SpatialIndex = None
+    """
+    A class used to quickly find the children under the mouse, e.g. 
+    `drawing.SpatialHash`.
+
+    By default, every child is checked each time the mouse moves, which can 
+    get slow for containers with thousands of children (e.g. a `Board` with 
+    lots of markers on a map).  If this attribute is set, the container keeps 
+    an instance of the given class up-to-date with the rect of each child and 
+    consults it in `do_find_children_near_mouse()`.  The index assumes that a 
+    child can only be under the mouse if the mouse is within its rect, so it 
+    shouldn't be used if `is_under_mouse()` is reimplemented to say otherwise.
+    """
+
+    # The layout algorithms (claim, realign, regroup, etc.) use explicit work 
+    # lists rather than recursion, so that very deep widget hierarchies don't 
+    # exceed python's recursion limit.  These attributes hold the work lists 
+    # while a layout pass is in progress; see `__defer()` and `_claim()`.
+    __layout_steps = None
+    __claim_stack = None
+
     def __init__(self):
         """
         Initialize the widget.
@@ -251,9 +273,21 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         self.__children = set()
 
         self.__children_under_mouse = set()
-        self.__children_can_overlap = True
+        self.__unchanged_children_under_mouse = None
+        self.__spatial_index = self.SpatialIndex() if self.SpatialIndex else None
         self.__mouse_grabber = None
 
+        # Containers that know their children can't overlap (e.g. grids) can 
+        # set this to False, which allows mouse events to be routed more 
+        # quickly when the mouse stays over the same child.
+        self._children_can_overlap = True
+
+        # Containers that move their children into a different coordinate 
+        # system (e.g. movers) set this to False, so that `_cull_children()` 
+        # won't compare the children's rects to a rect that doesn't apply.
+        self._children_share_coords = True
+        self.__coords_owner = None
+
         # The amount of space requested by the user for this widget.
         self.__width_hint = first_not_none((
                 self.custom_width_hint,
@@ -273,12 +307,33 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         # widget.  This is just the size of the content plus any padding.
         self.__claimed_width = 0
         self.__claimed_height = 0
+
+        # Claims are only recalculated when something that might affect them 
+        # changes.  The stale flag is set when this widget or one of its 
+        # descendants needs to be claimed again, and the set keeps track of 
+        # which children need to be visited to find those descendants.  The 
+        # generation is incremented each time the claim actually changes.
         self.__is_claim_stale = True
+        self.__stale_children = set()
+        self.__claim_generation = 0
 
         # The space assigned to the widget by it's parent.  This cannot be 
         # smaller than self.claimed_rect, but it can be larger.
         self.__assigned_rect = None
 
+        # Whether or not the widget has to be realigned the next time its 
+        # parent resizes it, even if it's given the same space as before.  The 
+        # claim generation is recorded so that the widget can also tell if its 
+        # own claim has changed since it was last realigned.
+        self.__is_realign_needed = True
+        self.__realigned_claim_generation = None
+
+        # The appearance version is incremented whenever something happens 
+        # that might change how the widget looks.  Together with the rect, it 
+        # lets `_realign()` tell whether the widget needs to be redrawn.
+        self.__appearance_version = 0
+        self.__drawn_appearance = None
+
         # The rect the widget should actually use to render itself.  This is 
         # determined by the alignment function from the content rect and the 
         # assigned rect.
@@ -290,6 +345,7 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
 
         self.__is_hidden = False
         self.__is_parent_hidden = False
+        self.__is_culled = False
         self.__is_enabled = True
 
         # Attribute controlling mouse events.
@@ -356,7 +412,7 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         """
         return widget in self.__children
 
-    def hide(self):
+    def hide(self, retain=False):
         """
         Make the widget invisible.
 
@@ -366,12 +422,20 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         not what you want, you should remove the widget from it container 
         rather than simply hiding it.  It's safe to hide a widget that's 
         already hidden.
+
+        If ``retain`` is true, the widget and its children keep their vertex 
+        lists while they're hidden (see `do_park()`), so that unhiding them 
+        doesn't have to allocate anything.  This is meant for widgets that are 
+        hidden and unhidden often, like the states of a rollover deck.
         """
         if self.is_visible:
             self._ungrab_mouse()
-            self._undraw_all()
+            if retain:
+                self._park_all()
+            else:
+                self._undraw_all()
         self.__is_hidden = True
-        self._hide_children()
+        self._hide_children(retain=retain)
 
     def unhide(self, draw=True):
         """
@@ -382,9 +446,9 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         unhidden.
         """
         self.__is_hidden = False
-        if self.is_visible and draw:
-            self._draw_all()
-        self._unhide_children(draw)
+        if self.is_visible:
+            if draw: self._draw_all()
+            self._unhide_children(draw)
 
     def enable(self):
         """
@@ -450,6 +514,18 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         else:
             raise NotImplementedError
 
+    def do_child_claim_changed(self, child):
+        """
+        React to the claim of one of this widget's children changing.
+
+        This method is called as soon as the child's new claim has been 
+        calculated, which is always before this widget's own `do_claim()` is 
+        called.  Containers with lots of children can implement this method to 
+        keep track of which children changed, so that `do_claim()` doesn't have 
+        to look at every child.  The default implementation does nothing.
+        """
+        pass
+
     def do_resize(self):
         """
         React to a change in the widget's size.
@@ -549,6 +625,20 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         """
         pass
 
+    def do_park(self):
+        """
+        Stop showing any shapes or images associated with this widget, but 
+        keep their vertex lists around.
+
+        This method is called instead of `do_undraw()` when the widget is 
+        hidden with ``hide(retain=True)``.  Widgets that can make their vertex 
+        lists invisible in place (e.g. by hiding a sprite or making the 
+        geometry degenerate) should override this method, and should make 
+        themselves visible again the next time `do_draw()` is called.  The 
+        default implementation just calls `do_undraw()`.
+        """
+        self.do_undraw()
+
     def do_find_children_near_mouse(self, x, y):
         """
         Yield all the children that could be under the given mouse coordinate.
@@ -563,9 +653,14 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         The default implementation just yields all of the widgets children, but 
         subclasses may be able to use knowledge of their geometry to quickly 
         yield a smaller set of children to check.  :class:`~glooey.Grid` is a 
-        good example of a widget that does this.
+        good example of a widget that does this.  If a `SpatialIndex` is being 
+        used, the default implementation only yields the children that it 
+        finds.
         """
-        yield from self.__children
+        if self.__spatial_index is not None:
+            yield from self.__spatial_index.find(x, y)
+        else:
+            yield from self.__children
 
     def on_mouse_press(self, x, y, button, modifiers):
         """
@@ -1128,9 +1223,10 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         True if this widgets or one of its parents is hidden.
 
         See `hide()` for a precise description of what it means for a widget to 
-        be hidden.
+        be hidden.  Widgets that have been culled (see `is_culled`) are also 
+        considered hidden.
         """
-        return self.__is_hidden or self.__is_parent_hidden
+        return self.__is_hidden or self.__is_parent_hidden or self.__is_culled
 
     @property
     def is_visible(self):
@@ -1141,6 +1237,18 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         """
         return not self.is_hidden
 
+    @property
+    def is_culled(self):
+        """
+        True if this widget isn't being drawn because its parent knows it 
+        can't be seen, e.g. because it's been scrolled out of view.
+
+        Culled widgets behave like hidden widgets, except that the decision is 
+        made by the widget's container rather than the user.  See 
+        `_cull_children()`.
+        """
+        return self.__is_culled
+
     @property
     def is_enabled(self):
         """
@@ -1282,18 +1390,21 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
             color=claimed,
             batch=self.batch,
             group=pyglet.graphics.OrderedGroup(1, layer),
+            pool=drawing.default_pool,
         )
         drawing.Outline(
             rect=self.__assigned_rect,
             color=assigned,
             batch=self.batch,
             group=pyglet.graphics.OrderedGroup(2, layer),
+            pool=drawing.default_pool,
         )
         drawing.Outline(
             rect=self.rect,
             color=content,
             batch=self.batch,
             group=pyglet.graphics.OrderedGroup(3, layer),
+            pool=drawing.default_pool,
         )
 
     @update_function
@@ -1310,24 +1421,37 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         `Widget` subclasses, where the attribute being set might change the 
         shape of the widget.  If the attribute being set might change the 
         widget's appearance, but *not* it's size, call `_draw()` instead.
+
+        If the root widget is deferring layout (see `Root.set_defer_layout()`),
+        this method just makes a note that the widget needs to be repacked.
+        The actual repack happens the next time `Root.flush_layout()` is
+        called, which `Gui` does right before every frame is drawn.
         """
+        self._invalidate_claim()
+        self._invalidate_rect()
+        self._invalidate_appearance()
+
         if not self.is_attached_to_gui:
             return
 
+        if self.root.defer_layout:
+            self.root._schedule_repack(self)
+            return
+
         has_claim_changed = self._claim()
 
         # If the widget is a different size than it used to be, give its parent 
-        # a chance to repack it.
+        # a chance to repack it.  The parent is repacked as a separate step, 
+        # rather than by calling it directly, so that climbing a deep hierarchy 
+        # doesn't use one stack frame per level.
         if has_claim_changed:
-            self.__is_claim_stale = False
-            self.parent._repack()
-            self.__is_claim_stale = True
+            Widget.__defer(self.parent._repack)
 
-        # Otherwise, stop recursing and resize the widget's children.
+        # Otherwise, stop climbing and resize the widget's children.
         else:
             self._realign()
 
-        self.dispatch_event('on_repack')
+        Widget.__defer(lambda: self.dispatch_event('on_repack'))
 
     def _claim(self):
         """
@@ -1336,38 +1460,129 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         More specifically, this methods updates ``self.__claimed_width`` and 
         ``self.__claimed_height`` to reflect the current state of the widget and 
         its children, then returns whether or not the claim changed since the 
-        last time this method was called.  If this function is called more than 
-        once within a single repack (a common scenario because every widget 
-        depends on the claim of all its children and grandchildren), the first 
-        call will update the claim and any subsequent calls will simply return 
-        False without recalculating anything.
+        last time this method was called.  Claims are memoized: unless this 
+        widget or one of its descendants has been invalidated (see 
+        `_invalidate_claim()`) since its claim was last calculated, this method 
+        simply returns False without recalculating anything.  This means that 
+        changing one widget only recalculates the claims of that widget and its 
+        parents, not those of its siblings.
 
         When the claim needs to be recalculated, the first step is the update 
-        the claims made by all the widget's children, since this widget's claim 
-        will depend on that information.  This is a recursive process that may 
-        descend all the way down the widget hierarchy.  The next step is to 
+        the claims made by any of the widget's children that have been 
+        invalidated, since this widget's claim will depend on that information.  
+        This process may descend all the way down the widget hierarchy.  The 
+        next step is to 
         delegate the actual calculation of the minimum width and height needed 
         *for the contents of the widget (i.e. excluding padding)* to 
         `do_claim()`, which should be overridden in `Widget` subclasses.  
         Finally, the claim is modified to account for padding and the 
         corresponding private attributes are updated.
 
+        The descent is implemented with an explicit stack rather than with 
+        recursion.  When this method is called on a child by the parent's claim, 
+        it just pushes the child onto that stack and returns False.  Only the 
+        outermost call actually returns whether the claim changed.
+
         This method should not be called outside of a repack.  If you're using 
         glooey to make a GUI, I can't think of a scenario where you should call 
         or override this method.
         """
-        # Only calculate the claim once during each repack.
+        # Don't recalculate the claim unless something has changed.
         if not self.__is_claim_stale:
             return False
 
-        # Have each child widget claim space for itself, so this widget can 
-        # take those space requirements into account.
-        for child in self.__children:
-            child._claim()
+        # If a parent widget is already claiming, it will update this widget's 
+        # claim before its own.
+        if Widget.__claim_stack is not None:
+            Widget.__claim_stack.append((self, self.__pop_stale_children()))
+            return False
+
+        # Have each stale child widget claim space for itself, so this widget 
+        # can take those space requirements into account.  Each widget's claim 
+        # is updated once all of its children have been popped off the stack.
+        Widget.__claim_stack = stack = [(self, self.__pop_stale_children())]
+
+        try:
+            while stack:
+                widget, children = stack[-1]
+                child = next(children, None)
+
+                if child is not None:
+                    child._claim()
+                else:
+                    stack.pop()
+                    has_claim_changed = widget.__update_claim()
+        finally:
+            Widget.__claim_stack = None
+
+        return has_claim_changed
+
+    def _invalidate_claim(self):
+        """
+        Indicate that this widget's claim needs to be recalculated the next time 
+        it is claimed.
+
+        The widget's parents are invalidated as well, so that the next claim 
+        made by any of them will find their way down to this widget.  Note that 
+        this doesn't actually recalculate anything; call `_repack()` for that.  
+        `_repack()` calls this method itself, so there's usually no reason to 
+        call it directly.
+        """
+        widget = self
+        widget.__is_claim_stale = True
 
+        while widget.parent is not None and not widget.is_root:
+            parent = widget.parent
+            parent.__stale_children.add(widget)
+
+            if parent.__is_claim_stale:
+                break
+
+            parent.__is_claim_stale = True
+            widget = parent
+
+    def _invalidate_rect(self):
+        """
+        Indicate that this widget needs to be realigned (and redrawn) the next 
+        time its parent resizes it, even if it's given the same space as 
+        before.
+
+        Normally `_resize()` skips widgets that are given the same space as 
+        before and whose claims haven't changed, along with all their children.  
+        `_repack()` calls this method itself, so there's usually no reason to 
+        call it directly.
+        """
+        self.__is_realign_needed = True
+
+    def _invalidate_appearance(self):
+        """
+        Indicate that this widget needs to be redrawn the next time it's 
+        realigned, even if its rect doesn't change.
+
+        Widgets that are realigned without having changed size or appearance 
+        (e.g. because a sibling changed size) aren't redrawn.  `_repack()` 
+        calls this method itself, and `_draw()` always redraws the widget, so 
+        there's usually no reason to call it directly.
+        """
+        self.__appearance_version += 1
+
+    def __pop_stale_children(self):
+        """
+        Return an iterator over the children that need to be claimed again, and 
+        forget about them.
+        """
+        stale_children, self.__stale_children = self.__stale_children, set()
+        return iter(stale_children)
+
+    def __update_claim(self):
+        """
+        Calculate the claim for this widget, assuming that the claims of its 
+        children are already up-to-date, and return whether or not it changed.
+        """
         # Make note of the previous claim, so we can say whether or not it has 
         # changed.
         previous_claim = self.__claimed_width, self.__claimed_height
+        previous_min = self.__min_width, self.__min_height
 
         # Keep track of the amount of space the widget needs for itself (min_*) 
         # and for itself in addition to its padding (claimed_*).
@@ -1378,10 +1593,85 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
 
         self.__claimed_width = self.__min_width + self.total_horz_padding
         self.__claimed_height = self.__min_height + self.total_vert_padding
+        self.__is_claim_stale = False
+
+        has_claim_changed = \
+                previous_claim != (self.__claimed_width, self.__claimed_height)
+        has_min_changed = \
+                previous_min != (self.__min_width, self.__min_height)
 
-        # Return whether or not the claim has changed since the last repack.  
+        if has_claim_changed or has_min_changed:
+            self.__claim_generation += 1
+
+        if has_claim_changed and self.__parent is not None:
+            self.__parent.do_child_claim_changed(self)
+
+        # Return whether or not the claim has changed since the last repack. 
         # This determines whether the widget's parent needs to be repacked.
-        return previous_claim != (self.__claimed_width, self.__claimed_height)
+        return has_claim_changed
+
+    def _claim_many(self, widgets):
+        """
+        Update the claims of several widgets at once, making sure that no
+        widget is claimed more than once.
+
+        This is the first half of a deferred repack (see
+        `Root.flush_layout()`), and it's only meant to be called on the root
+        widget.  The given widgets are processed from the bottom of the
+        hierarchy to the top.  If the claim of any widget changes, its parent
+        is processed as well, just like in `_repack()`.
+
+        The return value is a tuple of two lists.  The first contains every
+        widget that was processed, in the order they were processed.  The
+        second contains the widgets that still need to be realigned, i.e. the
+        widgets where the ascent stopped because their claims didn't change.
+        """
+        # Use a heap so that the deepest widgets are always processed first.
+        # The id() breaks ties without ever having to compare two widgets.
+        queue = [(-w.__get_depth(), id(w), w) for w in widgets]
+        heapq.heapify(queue)
+
+        processed = []
+        stop_points = []
+        seen = set()
+
+        while queue:
+            neg_depth, _, widget = heapq.heappop(queue)
+
+            if widget in seen:
+                continue
+
+            seen.add(widget)
+            processed.append(widget)
+
+            # The claim is memoized, so this widget won't be claimed again if 
+            # one of its parents ends up being claimed later in this loop.
+            has_claim_changed = widget._claim()
+
+            if has_claim_changed and not widget.is_root:
+                parent = widget.parent
+                parent._invalidate_claim()
+                parent._invalidate_rect()
+                heapq.heappush(queue, (neg_depth + 1, id(parent), parent))
+            else:
+                stop_points.append(widget)
+
+        return processed, stop_points
+
+    def _realign_many(self, widgets):
+        """
+        Realign several widgets at once, making sure that no widget is 
+        realigned more than once.
+
+        This is the second half of a deferred repack (see 
+        `Root.flush_layout()`), and it's only meant to be called on the root 
+        widget.  The given widgets are processed from the top of the hierarchy 
+        to the bottom, and any widget that was already realigned as part of one 
+        of its parents is skipped.
+        """
+        for widget in sorted(widgets, key=lambda w: w.__get_depth()):
+            if widget.__is_realign_needed:
+                widget._realign()
 
     def _resize(self, new_rect):
         """
@@ -1402,6 +1692,17 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         if int(new_rect.height) < int(self.claimed_height):
             raise UsageError(f"cannot assign {self} a smaller height ({new_rect.height} px) than it claimed ({self.claimed_height} px).")
 
+        # Don't do anything if the widget was given the same space as last 
+        # time and nothing else has happened that could change its layout.  
+        # This skips the whole subtree beneath this widget.
+        is_layout_unchanged = (
+                not self.__is_realign_needed and
+                self.__realigned_claim_generation == self.__claim_generation and
+                self.__assigned_rect == new_rect
+        )
+        if is_layout_unchanged:
+            return
+
         self.__assigned_rect = new_rect
         self._realign()
 
@@ -1427,6 +1728,21 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         if self.__assigned_rect is None:
             return
 
+        self.__is_realign_needed = False
+        self.__realigned_claim_generation = self.__claim_generation
+
+        # Keep track of the nearest container that moves its content into 
+        # another coordinate system.  Parents are always realigned before their 
+        # children (including after being detached and attached again), so the 
+        # parent's value is up to date.
+        parent = self.__parent
+        if parent is None:
+            self.__coords_owner = None
+        elif not parent._children_share_coords:
+            self.__coords_owner = parent
+        else:
+            self.__coords_owner = parent.__coords_owner
+
         # Subtract padding from the full amount of space assigned to this 
         # widget.
         max_rect = self.__assigned_rect.copy()
@@ -1458,20 +1774,37 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
             self.__padded_rect.height += self.total_vert_padding
             self.do_resize()
 
+            # Let the parent know where this widget is now, if the parent is 
+            # keeping track of that.
+            parent = self.__parent
+            if parent is not None and parent.__spatial_index is not None:
+                parent.__spatial_index.add(self, self.__rect)
+
+            # Let the nearest container that moves its content into another 
+            # coordinate system (e.g. a mover) know that something in its 
+            # content moved, e.g. so a scroll pane can decide again which 
+            # widgets are in view.
+            if self.__coords_owner is not None:
+                self.__coords_owner._on_content_realign()
+
         # Repacking a widget should always cause it to be redrawn.  Widgets use 
         # `_repack()` to indicate that their size or appearance may have 
         # changed, so it's possible that only the appearance changed.  For 
         # example, this would happen if you replaced an image with another of 
-        # the same size.  If the widget isn't ready to draw for some reason, 
-        # `_draw()` won't do anything.
-        self._draw()
+        # the same size.  `_repack()` bumps the appearance version to account 
+        # for this, so the widget only needs to be redrawn if its rect or its 
+        # appearance version changed since it was last drawn.  If the widget 
+        # isn't ready to draw for some reason, `_draw()` won't do anything.
+        if self.__drawn_appearance != (self.__rect, self.__appearance_version):
+            self._draw()
 
         # The children may need to be resized even if this widget doesn't.  For 
         # example, consider a container that takes up the whole window.  It's 
         # size won't change when a widget is added or removed from it, but it's 
-        # children will still need to be resized.
+        # children will still need to be resized.  This is deferred so that 
+        # each level of the hierarchy doesn't add to the call stack.
         if self.__num_children > 0:
-            self.do_resize_children()
+            Widget.__defer(self.do_resize_children)
 
     def _regroup(self, new_group):
         """
@@ -1503,9 +1836,9 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
             self._draw()
 
             if self.__num_children > 0:
-                self.do_regroup_children()
+                Widget.__defer(self.do_regroup_children)
 
-            self.dispatch_event('on_regroup')
+            Widget.__defer(lambda: self.dispatch_event('on_regroup'))
 
     @update_function
     def _repack_and_regroup_children(self):
@@ -1574,16 +1907,24 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         child.__parent = self
         self.__children.add(child)
 
+        # This widget's claim may depend on the new child, and the new child may 
+        # not have been claimed yet (or may have changed since it was).
+        self._invalidate_claim()
+        if child.__is_claim_stale:
+            child._invalidate_claim()
+
         if self.is_attached_to_gui:
             for widget in child.__yield_self_and_all_children():
                 widget.__root = self.root
                 widget.do_attach()
                 widget.dispatch_event('on_attach', widget)
 
+        # Only the new child needs to be hidden or unhidden.  Updating every 
+        # child here would make filling a container quadratic.
         if self.is_hidden:
-            self._hide_children()
+            self._hide_children([child])
         else:
-            self._unhide_children(False)
+            self._unhide_children(False, [child])
 
         self.dispatch_event('on_attach_child', self, child)
         return child
@@ -1609,9 +1950,19 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
             widget._ungrab_mouse()
             widget._undraw()
             widget.__root = None
+            widget.__is_culled = False
+
+            # The widget was just undrawn, so make sure it gets redrawn if it's 
+            # ever attached again.
+            widget.__is_realign_needed = True
 
         self.__children.discard(child)
+        self.__stale_children.discard(child)
+
+        if self.__spatial_index is not None:
+            self.__spatial_index.discard(child)
         child.__parent = None
+        self._invalidate_claim()
 
         # Set the detached child's ``group`` and ``rect`` attributes to None, 
         # so that its new parent will have to supply them before the child can 
@@ -1652,6 +2003,11 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
            parent calls its `_regroup()` method.
 
         4. The widget must not be hidden.
+
+        Calling this method always redraws the widget (assuming it can be 
+        drawn), so it can be used to force a redraw.  During a repack, though, 
+        widgets are only redrawn if their rect or their appearance changed 
+        since the last time they were drawn (see `_invalidate_appearance()`).
         """
         if self.root is None: return
         if self.rect is None: return
@@ -1659,14 +2015,14 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         if self.is_hidden: return
 
         self.do_draw()
+        self.__drawn_appearance = self.__rect, self.__appearance_version
 
     def _draw_all(self):
         """
         Draw this widget and all of its children.
         """
-        self._draw()
-        for child in self.__children:
-            child._draw_all()
+        for widget in self.__yield_self_and_all_children():
+            widget._draw()
 
     def _undraw(self):
         """
@@ -1677,15 +2033,31 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         should implement that method rather than overriding this one.
         """
         self.do_undraw()
+        self.__drawn_appearance = None
 
     def _undraw_all(self):
         """
         Undraw this widget and all of its children.
         """
-        self._undraw()
+        for widget in self.__yield_self_and_all_children():
+            widget._undraw()
 
-        for child in self.__children:
-            child._undraw_all()
+    def _park(self):
+        """
+        Stop showing this widget without deleting its vertex lists.
+
+        The actual work is delegated to `do_park()`.  The widget will be fully 
+        redrawn the next time `_draw()` is called.
+        """
+        self.do_park()
+        self.__drawn_appearance = None
+
+    def _park_all(self):
+        """
+        Park this widget and all of its children.
+        """
+        for widget in self.__yield_self_and_all_children():
+            widget._park()
 
     def _grab_mouse(self):
         """
@@ -1701,15 +2073,15 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         grabbing the mouse.
         """
 
-        if self.is_root:
-            return
+        widget = self
 
-        if self.parent.__mouse_grabber is not None:
-            grabber = self.root.__find_mouse_grabber()
-            raise UsageError(f"{grabber} is already grabbing the mouse, {self} can't grab it.")
+        while not widget.is_root:
+            if widget.parent.__mouse_grabber is not None:
+                grabber = self.root.__find_mouse_grabber()
+                raise UsageError(f"{grabber} is already grabbing the mouse, {self} can't grab it.")
 
-        self.parent.__mouse_grabber = self
-        self.parent._grab_mouse()
+            widget.parent.__mouse_grabber = widget
+            widget = widget.parent
 
     def _ungrab_mouse(self, x=None, y=None):
         """
@@ -1726,30 +2098,44 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         if not self.is_attached_to_gui:
             return
 
-        if self.is_root:
-            if (x, y) != (None, None):
-                self.dispatch_event('on_mouse_motion', x, y, 0, 0)
-            return
+        widget = self
+
+        while not widget.is_root:
+            if widget.parent.__mouse_grabber is not widget:
+                return
 
-        if self.parent.__mouse_grabber is self:
-            self.parent.__mouse_grabber = None
-            self.parent._ungrab_mouse(x, y)
+            widget.parent.__mouse_grabber = None
+            widget = widget.parent
 
-    def _hide_children(self):
+        if (x, y) != (None, None):
+            widget.dispatch_event('on_mouse_motion', x, y, 0, 0)
+
+    def _hide_children(self, children=None, retain=False):
         """
         Hide all of the widget's children.
 
         This method is part of the process of hiding the widget itself, so it 
-        is assumed that the widget is hidden when this method is called.
+        is assumed that the widget is hidden when this method is called.  If 
+        ``children`` is given, only those children (and their descendants) are 
+        hidden.  If ``retain`` is true, the children are parked rather than 
+        undrawn (see `hide()`).
         """
-        for child in self.__yield_all_children():
+        widgets = list(self.__children if children is None else children)
+
+        while widgets:
+            child = widgets.pop()
+
             if child.is_visible:
                 child._ungrab_mouse()
-                child._undraw()
+                if retain:
+                    child._park()
+                else:
+                    child._undraw()
 
             child.__is_parent_hidden = True
+            widgets.extend(child.__children)
 
-    def _unhide_children(self, draw=True):
+    def _unhide_children(self, draw=True, children=None):
         """
         Redraw any of the widget's children that were visible before the widget 
         itself was hidden.
@@ -1757,9 +2143,14 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         This method is part of the process of unhiding the widget, so it is 
         assumed that the widget itself is already visible.  We can't simply 
         draw every child, because some of the children may have been explicitly 
-        hidden independently of this one.
+        hidden independently of this one.  If ``children`` is given, only those 
+        children (and their descendants) are unhidden.
         """
-        def unhide_child(child): #
+        children = list(self.__children if children is None else children)
+
+        while children:
+            child = children.pop()
+
             # Indicate that this child's parent is no longer hidden.
             child.__is_parent_hidden = False
 
@@ -1770,25 +2161,137 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
                 if draw:
                     child._draw()
 
-                # Recursively unhide the child's children.
-                for grandchild in child.__children:
-                    unhide_child(grandchild)
+                # Unhide the child's children too.
+                children.extend(child.__children)
 
-        for child in self.__children:
-            unhide_child(child)
+    def _defer(self, step):
+        """
+        Run the given callable once the layout step currently in progress is 
+        finished, or right away if no layout step is in progress.
+
+        Children are resized in steps of their own, so calling this from 
+        `do_resize_children()` is a way to do something after every descendant 
+        of this widget has been given its new rect.
+        """
+        Widget.__defer(step)
+
+    def _on_content_realign(self):
+        """
+        Called when the rect of any widget in the content of a container that 
+        moves its children into another coordinate system changes.  See 
+        `_children_share_coords`.
+
+        Such a container is told about its children, its children's children, 
+        and so on, but not about anything inside a nested container of the 
+        same kind.  This is called once for each widget that changed, so 
+        anything expensive should be deferred (see `_defer()`).
+        """
+        pass
+
+    def _cull_children(self, rect, culled=()):
+        """
+        Undraw any descendants that are completely outside the given rect, and 
+        redraw any that had been culled but no longer are.
+
+        This is meant for containers that know only part of their content can 
+        be seen, e.g. `ScrollPane`.  The rect should be in the same coordinates 
+        as this widget's children.  Children that are entirely inside the rect 
+        are left alone, and only children that straddle its edges are 
+        searched for descendants to cull, so the cost is proportional to the 
+        number of children rather than the number of widgets.  Containers with 
+        a `SpatialIndex` that has a ``find_in_rect()`` method (e.g. 
+        `drawing.SpatialHash`) don't even need to check each of their children.  
+        Culled widgets are undrawn just like hidden ones (see `hide()`), but 
+        they don't lose their hidden state or their mouse grab.
+
+        ``culled`` should be the set returned by the previous call to this 
+        method, and the set of widgets that are culled after this call is 
+        returned.  If ``rect`` is None, every one of those widgets is unculled.
+        """
+        still_culled = set()
+        containers = [self] if rect is not None else []
+
+        if rect is not None:
+            left, bottom = rect.left, rect.bottom
+            right, top = rect.right, rect.top
+
+        while containers:
+            container = containers.pop()
+            children = container.__children
+            index = container.__spatial_index
+
+            # If the container has a spatial index that can search by rect, 
+            # every child it doesn't find can be culled without looking at it.
+            if index is not None and hasattr(index, 'find_in_rect'):
+                near_children = set(index.find_in_rect(rect))
+                still_culled.update(children - near_children)
+                children = near_children
+
+            for widget in children:
+                padded_rect = widget.__padded_rect
+
+                if padded_rect is None:
+                    continue
+
+                child_left, child_bottom = padded_rect.left, padded_rect.bottom
+                child_right, child_top = padded_rect.right, padded_rect.top
+
+                if child_right <= left or child_left >= right or \
+                        child_top <= bottom or child_bottom >= top:
+                    still_culled.add(widget)
+                    continue
+
+                if widget._children_share_coords and (
+                        child_left < left or child_right > right or
+                        child_bottom < bottom or child_top > top):
+                    containers.append(widget)
+
+        for widget in set(culled) - still_culled:
+            widget.__uncull()
+
+        for widget in still_culled.difference(culled):
+            widget.__cull()
+
+        return still_culled
+
+    def __cull(self):
+        if self.__is_culled:
+            return
+
+        if self.is_visible:
+            self._undraw()
+            self._hide_children()
+
+        self.__is_culled = True
+
+    def __uncull(self):
+        if not self.__is_culled:
+            return
+
+        self.__is_culled = False
+
+        if self.is_visible and self.parent is not None:
+            self._draw()
+            self._unhide_children()
 
     def __yield_all_children(self):
         """
-        Recursively iterate over all of this widget's children and 
-        grandchildren.
+        Iterate over all of this widget's children and grandchildren.
+
+        Parents are always yielded before their children.  An explicit stack 
+        is used instead of recursion, so this works for arbitrarily deep 
+        hierarchies.
         """
-        for child in self.__children:
-            yield from child.__yield_self_and_all_children()
+        widgets = list(self.__children)
+
+        while widgets:
+            widget = widgets.pop()
+            yield widget
+            widgets.extend(widget.__children)
 
     def __yield_self_and_all_children(self):
         """
-        Recursively iterate over this widget and all of its children and 
-        grandchildren.
+        Iterate over this widget and all of its children and grandchildren.
         """
         yield self
         yield from self.__yield_all_children()
@@ -1813,20 +2316,50 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         widget does this to replace the default linear-time search with a 
         constant-time one that takes advantage of the grids predictable 
         geometry.
+
+        Most mouse events don't move the mouse off of the child it was already 
+        over.  If that child is still under the mouse and no other child could 
+        be (either because there's only one child or because the children 
+        can't overlap), the search is skipped entirely and a cached object 
+        indicating that nothing changed is returned.
         """
         previously_under_mouse = self.__children_under_mouse
 
         if self.__mouse_grabber is not None:
             self.__children_under_mouse = {self.__mouse_grabber}
+        elif self.__is_child_under_mouse_unchanged(x, y):
+            if self.__unchanged_children_under_mouse is None:
+                self.__unchanged_children_under_mouse = \
+                        Widget.__ChildrenUnderMouse(
+                                previously_under_mouse, previously_under_mouse)
+            return self.__unchanged_children_under_mouse
         else:
             self.__children_under_mouse = {
                     w for w in self.do_find_children_near_mouse(x, y)
                     if w.is_visible and w.is_under_mouse(x, y)
             }
 
+        self.__unchanged_children_under_mouse = None
         return Widget.__ChildrenUnderMouse(
                 previously_under_mouse, self.__children_under_mouse)
 
+    def __is_child_under_mouse_unchanged(self, x, y):
+        """
+        Return true if the one child that was under the mouse last time is 
+        definitely the only child under the given mouse coordinate.
+        """
+        if len(self.__children_under_mouse) != 1:
+            return False
+
+        if self._children_can_overlap and self.__num_children > 1:
+            return False
+
+        child = next(iter(self.__children_under_mouse))
+
+        return child.parent is self and \
+                child.is_visible and \
+                child.is_under_mouse(x, y)
+
     def __find_children_under_mouse_after_leave(self):
         """
         Update the list of children under the mouse as the mouse leaves this 
@@ -1846,6 +2379,7 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         else:
             self.__children_under_mouse = set()
 
+        self.__unchanged_children_under_mouse = None
         return Widget.__ChildrenUnderMouse(
                 previously_under_mouse, self.__children_under_mouse)
 
@@ -1863,11 +2397,41 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         if self.__mouse_grabber is None:
             return None
 
-        def recursive_find(parent):
-            grabber = parent.__mouse_grabber
-            return parent if grabber is None else recursive_find(grabber)
+        widget = self
+        while widget.__mouse_grabber is not None:
+            widget = widget.__mouse_grabber
 
-        return recursive_find(self)
+        return widget
+
+    @staticmethod
+    def __defer(step):
+        """
+        Run the given callable once the layout step currently in progress is 
+        finished, or right away if no layout step is in progress.
+
+        This is what allows repacking and regrouping to work on arbitrarily 
+        deep hierarchies.  Instead of each widget recursively calling into its 
+        parent or its children, the remaining work is pushed onto a stack that 
+        is processed in a loop.  The steps deferred by any single step are run 
+        in the order they were deferred, and before any steps that were 
+        deferred earlier, so the overall order is the same as it would be with 
+        recursion.  The outermost call doesn't return until every step it 
+        caused has been run.
+        """
+        if Widget.__layout_steps is not None:
+            Widget.__layout_steps.append(step)
+            return
+
+        steps = [step]
+
+        try:
+            while steps:
+                step = steps.pop()
+                Widget.__layout_steps = deferred_steps = []
+                step()
+                steps.extend(reversed(deferred_steps))
+        finally:
+            Widget.__layout_steps = None
 
     def __update_rollover_state(self, new_state, x, y):
         """
@@ -1894,6 +2458,19 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
             )
             self.__last_rollover_state = self.__rollover_state
 
+    def __get_depth(self):
+        """
+        Return the number of parents between this widget and the root.
+        """
+        depth = 0
+        widget = self
+
+        while not widget.is_root:
+            widget = widget.parent
+            depth += 1
+
+        return depth
+
     def __get_num_children(self):
         """
         Return the number of children attached to this widget.
@@ -1934,8 +2511,8 @@ class Widget(EventDispatcher, HoldUpdatesMixin):
         """
 
         def __init__(self, previous, current):
-            self.__previous = set(previous)
-            self.__current = set(current)
+            self.__previous = frozenset(previous)
+            self.__current = frozenset(current)
 
         @property
         def previous(self):
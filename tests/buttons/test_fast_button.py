@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import pyglet
+import glooey
+
+def make_image(width=16, height=16):
+    return pyglet.image.SolidColorImagePattern((255, 0, 0, 255))\
+            .create_image(width, height)
+
+base_image = make_image()
+down_image = make_image(20, 20)
+
+class ImageButton(glooey.Button):
+    Foreground = None
+
+    class Base(glooey.Background):
+        custom_image = base_image
+
+    class Down(glooey.Background):
+        custom_image = down_image
+
+
+class FastImageButton(glooey.FastButton, ImageButton):
+    pass
+
+
+def test_same_as_button(gui):
+    slow, fast = ImageButton(), FastImageButton()
+    hbox = glooey.HBox()
+    hbox.add(slow); hbox.add(fast); gui.add(hbox)
+
+    # Both buttons claim space for their biggest state.
+    assert slow.claimed_size == fast.claimed_size == (20, 20)
+
+    assert fast.base_background['image'] is base_image
+    assert fast.over_background['image'] is None
+
+    def get_image(button):
+        artist = button._background._artist
+        tiles = artist._tile_artists.values()
+        return next(iter(tiles)).image
+
+    assert get_image(fast) is base_image
+
+    # Missing states fall back to the base state, just like for a `Button`.
+    x, y = fast.rect.center
+    gui.on_mouse_motion(x, y, 0, 0)
+    assert fast._background.state == 'base'
+
+    gui.on_mouse_press(x, y, pyglet.window.mouse.LEFT, 0)
+    assert fast._background.state == 'down'
+    assert get_image(fast) is down_image
+
+    fast.disable()
+    assert fast._background.state == 'off'
+
+def test_set_background():
+    button = FastImageButton()
+    button.set_background(base_color='green', down_color='red')
+
+    assert button.base_background['color'] == 'green'
+    assert button.down_background['color'] == 'red'
+    assert button._background.is_state_missing('over')
+
+    button.over_background = glooey.Background(color='blue')
+    assert button.over_background['color'] == 'blue'
+    assert not button._background.is_state_missing('over')
@@ -1,8 +1,29 @@
 #!/usr/bin/env python3
 
 import pytest
+import glooey
 from run_demos import run_demo
 
+class DummyWindow:
+    """
+    Stand in for a pyglet window, so that GUIs can be tested without a 
+    display.
+    """
+    width = 200
+    height = 100
+
+    def push_handlers(self, gui):
+        pass
+
+
+@pytest.fixture
+def window():
+    return DummyWindow()
+
+@pytest.fixture
+def gui(window):
+    return glooey.Gui(window)
+
 def pytest_addoption(parser):
     parser.addoption('-D', '--run-demos', action='store_true')
 
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import pytest
+import glooey
+from glooey.helpers import UsageError
+
+def log_repacks(widget):
+    repacks = []
+    widget.push_handlers(on_repack=lambda: repacks.append(widget))
+    return repacks
+
+
+def test_grid_add_many(gui):
+    grid = glooey.Grid()
+    gui.add(grid)
+    repacks = log_repacks(grid)
+
+    children = {(i, j): glooey.Placeholder() for i in range(2) for j in range(2)}
+    grid.add_many(children)
+
+    assert len(repacks) == 1
+    assert dict(grid) == children
+    assert children[0,0].rect.top_left == (0, 100)
+    assert children[1,1].rect.bottom_right == (200, 0)
+
+def test_vbox_extend(gui):
+    vbox = glooey.VBox()
+    gui.add(vbox)
+    repacks = log_repacks(vbox)
+
+    children = [glooey.Placeholder(10, 10) for i in range(3)]
+    vbox.extend(children, sizes=[0, 'expand', 0])
+
+    assert len(repacks) == 1
+    assert vbox.children == tuple(children)
+    assert children[0].rect.height == 10
+    assert children[1].rect.height == 80
+
+    vbox.extend([glooey.Placeholder(10, 10)], sizes=0)
+    assert len(vbox.children) == 4
+
+    with pytest.raises(UsageError):
+        vbox.extend([glooey.Placeholder()], sizes=[0, 0])
+
+def test_stack_extend(gui):
+    stack = glooey.Stack()
+    gui.add(stack)
+    repacks = log_repacks(stack)
+
+    back = glooey.Placeholder()
+    stack.add(back)
+    children = [glooey.Placeholder() for i in range(3)]
+    stack.extend(children)
+
+    assert len(repacks) == 2
+    assert stack.layers == [3, 2, 1, 0]
+    assert stack.children == children[::-1] + [back]
+
+def test_board_add_many(gui):
+    board = glooey.Board()
+    gui.add(board)
+    repacks = log_repacks(board)
+
+    w1, w2 = glooey.Placeholder(10, 10), glooey.Placeholder(10, 10)
+    board.add_many({
+        w1: dict(left=10, top=90),
+        w2: dict(center_percent=(0.5, 0.5)),
+    })
+
+    assert len(repacks) == 1
+    assert w1.rect.top_left == (10, 90)
+    assert w2.rect.center == (100, 50)
+
+def test_board_add_many_invalid_pin(gui):
+    board = glooey.Board()
+    gui.add(board)
+
+    w1, w2 = glooey.Placeholder(), glooey.Placeholder()
+    with pytest.raises(UsageError):
+        board.add_many({w1: dict(left=10), w2: dict(foo=10)})
+
+    assert w1.parent is None
+    assert w2.parent is None
+
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+import pyglet
+import glooey
+
+def make_image(color):
+    return pyglet.image.SolidColorImagePattern(color).create_image(16, 16)
+
+def make_deck(gui, retain):
+    deck = glooey.Deck('a',
+            a=glooey.Image(make_image((255, 0, 0, 255))),
+            b=glooey.Background(color='green', left=make_image((0, 0, 255, 255))),
+    )
+    deck.custom_retain_hidden_states = retain
+    gui.add(deck)
+    return deck
+
+def test_retain_hidden_states(gui):
+    deck = make_deck(gui, retain=True)
+    image, background = deck['a'], deck['b']
+
+    def get_tiles():
+        return list(background._artist._tile_artists.values())
+
+    deck.state = 'b'
+    sprite = image._sprite
+    vertex_lists = [x.vertex_list for x in get_tiles()]
+
+    assert not sprite.visible
+    assert vertex_lists
+
+    # Toggling back and forth reuses the same sprite and vertex lists.
+    deck.state = 'a'
+    assert image._sprite is sprite
+    assert sprite.visible
+    assert [x._hidden_vertex_list for x in get_tiles()] == vertex_lists
+    assert not any(vertex_lists[0].vertices)
+
+    deck.state = 'b'
+    assert not sprite.visible
+    assert [x.vertex_list for x in get_tiles()] == vertex_lists
+    assert any(vertex_lists[0].vertices)
+
+    # Removing a state still deletes everything.
+    deck.remove_state('a')
+    assert image._sprite is None
+
+def test_undraw_hidden_states(gui):
+    deck = make_deck(gui, retain=False)
+    image = deck['a']
+
+    deck.state = 'b'
+    assert image._sprite is None
+
+def test_state_factories(gui):
+    made = []
+
+    def make_placeholder(state, size):
+        def factory():
+            made.append(state)
+            return glooey.Placeholder(size, size)
+        return factory
+
+    deck = glooey.Deck('a',
+            a=make_placeholder('a', 10),
+            b=make_placeholder('b', 20),
+            c=make_placeholder('c', 30),
+    )
+    deck.custom_max_hidden_states = 1
+    assert made == ['a']
+    assert list(deck.known_states) == ['a', 'b', 'c']
+
+    gui.add(deck)
+
+    deck.state = 'b'
+    deck.state = 'c'
+    assert made == ['a', 'b', 'c']
+    assert deck.claimed_size == (30, 30)
+
+    # Only one hidden widget is kept, so 'a' was thrown away.
+    assert [state for state, widget in deck] == ['b', 'c']
+
+    deck.state = 'a'
+    assert made == ['a', 'b', 'c', 'a']
+    assert [state for state, widget in deck] == ['a', 'c']
+
+def test_claim_current_state_only(gui):
+    deck = glooey.Deck('a',
+            a=glooey.Placeholder(10, 10),
+            b=glooey.Placeholder(20, 20),
+    )
+    deck.custom_claim_current_state_only = True
+    deck.alignment = 'center'
+
+    gui.add(deck)
+    assert deck.claimed_size == (10, 10)
+
+    deck.state = 'b'
+    assert deck.claimed_size == (20, 20)
+    assert deck.rect.size == (20, 20)
+
+def test_rollover_factories(gui):
+    made = []
+
+    def make_placeholder(state):
+        def factory():
+            made.append(state)
+            return glooey.Placeholder(10, 10)
+        return factory
+
+    button = glooey.Button()
+    rollover = glooey.Rollover(button, 'base',
+            base=make_placeholder('base'),
+            over=make_placeholder('over'),
+            down=make_placeholder('down'),
+    )
+    hbox = glooey.HBox()
+    hbox.add(button)
+    hbox.add(rollover)
+    gui.add(hbox)
+
+    # Only the states that are shown are made.
+    x, y = button.rect.center
+    gui.on_mouse_motion(x, y, 0, 0)
+    assert rollover.state == 'over'
+    assert made == ['base', 'over']
+
+    # States that haven't been made yet aren't missing, and checking doesn't 
+    # make them.
+    assert not rollover.is_state_missing('down')
+    assert rollover.is_state_missing('off')
+    assert made == ['base', 'over']
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import pytest
+import pyglet
+from vecrec import Rect
+from glooey import drawing
+
+def make_images(num_rows, num_cols):
+    atlas = pyglet.image.SolidColorImagePattern((255, 0, 0, 255))\
+            .create_image(16 * num_cols, 16 * num_rows)
+    grid = pyglet.image.ImageGrid(atlas, num_rows, num_cols)
+    return pyglet.image.TextureGrid(grid)
+
+def make_nine_slice(images):
+    keys = [
+            'bottom_left', 'bottom', 'bottom_right',
+            'left', 'center', 'right',
+            'top_left', 'top', 'top_right',
+    ]
+    return dict(zip(keys, images))
+
+def test_shared_texture():
+    batch = pyglet.graphics.Batch()
+    images = make_images(3, 3)
+    bg = drawing.Background(
+            rect=Rect(0, 0, 100, 100),
+            batch=batch,
+            **make_nine_slice(images),
+    )
+
+    # All the images come from the same texture, so they're drawn by one
+    # artist.  The edges and the center are tiled to fill the 68 px between
+    # the corners, which takes 5 repetitions each.
+    assert bg._tile_artists == {}
+    artist = bg._shared_tile_artist
+    assert artist.vertex_list.get_size() == 4 * (4 + 4*5 + 5*5)
+
+    # The last repetition is cut short.
+    tiles = drawing.artists._make_tile_quads([
+        (Rect(0, 0, 20, 16), images[0], True, False),
+    ])
+    u0, v0, _, u1 = images[0].tex_coords[0:4]
+    assert tiles[0] == [
+            0, 0, 16, 0, 16, 16, 0, 16,
+            16, 0, 20, 0, 20, 16, 16, 16,
+    ]
+    assert tiles[1][12:15] == [u0, v0, 0]
+    assert tiles[1][15:17] == [pytest.approx(u0 + (u1 - u0) / 4), v0]
+
+    # Resizing the background changes the number of quads.
+    bg.rect = Rect(0, 0, 48, 48)
+    assert artist.vertex_list.get_size() == 4 * 9
+
+    bg.hide()
+    assert bg._shared_tile_artist is None
+    assert artist.vertex_list is None
+
+def test_separate_textures():
+    batch = pyglet.graphics.Batch()
+    bg = drawing.Background(
+            rect=Rect(0, 0, 100, 100),
+            batch=batch,
+            left=make_images(1, 1)[0],
+            right=make_images(1, 1)[0],
+    )
+    assert bg._shared_tile_artist is None
+    assert len(bg._tile_artists) == 2
+
+    # Switching to images from the same texture replaces the tiles.
+    images = make_images(1, 2)
+    bg.set_appearance(left=images[0], right=images[1])
+    assert bg._tile_artists == {}
+    assert bg._shared_tile_artist.vertex_list.get_size() == 4 * 2
+
+def test_change_usage():
+    batch = pyglet.graphics.Batch()
+    pool = drawing.default_pool
+
+    def count_live_slots():
+        return sum(
+                pool.block_size * len(blocks.vertex_lists) - len(blocks.free_slots)
+                for blocks in pool._blocks[batch].values()
+        )
+
+    bg = drawing.Background(
+            rect=Rect(0, 0, 100, 100),
+            color='green',
+            outline='red',
+            batch=batch,
+            **make_nine_slice(make_images(3, 3)),
+    )
+    color_slot = bg._color_artist.vertex_list
+    tile_artist = bg._shared_tile_artist
+    assert count_live_slots() == 2
+
+    # The old artists are deleted, rather than being left to draw over the 
+    # new ones, so the new color artist gets the old one's slot back.
+    bg.usage = 'dynamic'
+    assert count_live_slots() == 2
+    assert color_slot._is_deleted
+    assert bg._color_artist.vertex_list._start == color_slot._start
+    assert tile_artist.vertex_list is None
+    assert bg._shared_tile_artist.vertex_list is not None
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
 import pytest
+import random
 from vecrec import Rect
 from glooey import drawing, UsageError
+from glooey.drawing import grid as grid_module
 
 def test_no_cells():
     cells = drawing.make_grid(
@@ -710,5 +712,182 @@ def test_no_shared_state():
     assert grid_1.get_min_cell_rect(i, j) is rect_1
     assert grid_2.get_min_cell_rect(i, j) is rect_2
 
-    
+def test_find_cell_under_mouse():
+    grid = drawing.Grid(
+            bounding_rect=Rect.from_size(10, 10),
+            num_rows=2,
+            num_cols=2,
+            padding=2,
+    )
+    grid.make_cells()
+
+    # The cells are 2-5 and 7-8 in both directions, and rows go from the top 
+    # down.  Points on the edge of a cell count as being in that cell.
+    assert grid.find_cell_under_mouse(3, 7) == (0, 0)
+    assert grid.find_cell_under_mouse(7, 7) == (0, 1)
+    assert grid.find_cell_under_mouse(3, 3) == (1, 0)
+    assert grid.find_cell_under_mouse(8, 2) == (1, 1)
+    assert grid.find_cell_under_mouse(2, 8) == (0, 0)
+
+    # Points in the padding aren't in any cell.
+    assert grid.find_cell_under_mouse(1, 7) is None
+    assert grid.find_cell_under_mouse(5.5, 7) is None
+    assert grid.find_cell_under_mouse(3, 5.5) is None
+    assert grid.find_cell_under_mouse(9, 9) is None
+
+def test_find_cell_under_mouse_without_padding():
+    grid = drawing.Grid(
+            bounding_rect=Rect.from_size(10, 10),
+            num_rows=2,
+            num_cols=2,
+    )
+    grid.make_cells()
+
+    # Points between two cells are in the top-left-most cell.
+    assert grid.find_cell_under_mouse(5, 5) == (0, 0)
+    assert grid.find_cell_under_mouse(5, 2) == (1, 0)
+    assert grid.find_cell_under_mouse(0, 0) == (1, 0)
+    assert grid.find_cell_under_mouse(10, 10) == (0, 1)
+
+def test_find_cell_under_mouse_many_rows():
+    grid = drawing.Grid(
+            bounding_rect=Rect.from_size(10, 2000),
+            num_rows=2000,
+            num_cols=1,
+    )
+    cells = grid.make_cells()
+
+    for i in [0, 1, 999, 1000, 1998, 1999]:
+        assert grid.find_cell_under_mouse(5, cells[i,0].center_y) == (i, 0)
+
+    assert grid.find_cell_under_mouse(5, -1) is None
+    assert grid.find_cell_under_mouse(5, 2001) is None
+
+@pytest.fixture(params=['numpy', 'array'])
+def backend(request, monkeypatch):
+    if request.param == 'array':
+        monkeypatch.setattr(grid_module, 'numpy', None)
+    elif grid_module.numpy is None:
+        pytest.skip("numpy not installed")
+
+@pytest.mark.parametrize('sparse', [False, True])
+def test_incremental_updates(backend, sparse):
+    # Make lots of small changes to one grid, and make sure it always ends up 
+    # with the same cells as a grid made from scratch.
+    random.seed(0)
+
+    grid = drawing.Grid(sparse=sparse)
+    cells = {}
+    row_heights = {}
+    col_widths = {}
+    rect = Rect.from_size(200, 200)
+    previous = {}
+
+    for step in range(300):
+        i, j = random.randrange(6), random.randrange(6)
+        size = random.choice([0, 'expand', 5, 10])
+        choice = random.randrange(6)
+
+        if choice == 0 and cells:
+            del cells[random.choice(list(cells))]
+            grid.min_cell_rects = cells.copy()
+        elif choice == 1:
+            row_heights[i] = size
+            grid.set_row_height(i, size)
+        elif choice == 2:
+            col_widths[j] = size
+            grid.set_col_width(j, size)
+        elif choice == 3:
+            rect = Rect.from_size(200, 200)
+            rect.bottom_left = random.randrange(10), random.randrange(10)
+        else:
+            cells[i,j] = Rect.from_size(random.randrange(10), random.randrange(10))
+            grid.set_min_cell_rect(i, j, cells[i,j])
+
+        expected = drawing.make_grid(
+                rect,
+                cells=cells,
+                row_heights=row_heights,
+                col_widths=col_widths,
+        )
+        assert grid.make_cells(rect) == expected
+
+        # The cells before the first changed row and column are the same as 
+        # they were after the previous step.
+        first_row, first_col = grid.pop_first_changed_cell()
+        for (i, j), cell in expected.items():
+            if i < first_row and j < first_col:
+                assert previous[i,j] == cell
+        previous = expected
+
+        assert grid.make_claim() == drawing.Grid(
+                min_cell_rects=cells,
+                row_heights=row_heights,
+                col_widths=col_widths,
+        ).make_claim()
+
+        # Cells with no width or height share their edges with their 
+        # neighbors, so there's no point that's only in them.
+        for ij, cell in expected.items():
+            if cell.width and cell.height:
+                assert grid.find_cell_under_mouse(*cell.center) == ij
+
+def test_sparse_cells():
+    grid = drawing.Grid(
+            bounding_rect=Rect.from_size(10, 20),
+            num_rows=2,
+            num_cols=1,
+            sparse=True,
+    )
+    cells = grid.make_cells()
+
+    assert len(cells) == 2
+    assert (1, 0) in cells
+    assert (2, 0) not in cells
+    assert cells[1,0] == Rect(0, 0, 10, 10)
+    assert cells[1,0] is cells[1,0]
+    assert cells == {
+            (0,0): Rect(0, 10, 10, 10),
+            (1,0): Rect(0, 0, 10, 10),
+    }
+
+    with pytest.raises(KeyError):
+        cells[2,0]
+
+    # The cells are a view, so they change along with the grid.
+    grid.set_row_height(0, 0)
+    grid.set_min_cell_rect(0, 0, Rect.from_size(5, 5))
+    assert grid.make_cells() is cells
+    assert cells[0,0] == Rect(0, 15, 10, 5)
+    assert cells[1,0] == Rect(0, 0, 10, 15)
+
+    expected = dict(cells)
+    grid.sparse = False
+    assert grid.make_cells() == expected
+
+def test_find_cells_in_rect(backend):
+    grid = drawing.Grid(
+            bounding_rect=Rect(0, 0, 100, 100),
+            num_rows=4,
+            num_cols=4,
+            padding=10,
+    )
+    # Each cell is 50/4 = 12.5 px wide and tall:
+    # [10, 22.5], [32.5, 45], [55, 67.5], [77.5, 90]
+    grid.make_cells()
+
+    assert grid.find_cells_in_rect(Rect(0, 0, 100, 100)) == \
+            (range(4), range(4))
+
+    # Cells touching the edge of the rect don't count.
+    assert grid.find_cells_in_rect(Rect(22.5, 67.5, 10, 10)) == \
+            (range(0), range(0))
+    assert grid.find_cells_in_rect(Rect(22, 50, 11, 28)) == \
+            (range(0, 2), range(0, 2))
+
+    # Rects entirely outside the grid don't have any cells.
+    assert grid.find_cells_in_rect(Rect(200, 200, 10, 10)) == \
+            (range(0), range(0))
+    assert grid.find_cells_in_rect(Rect(-20, -20, 10, 10))[1] == range(0)
 
+    assert grid.get_cell_rect(1, 2) == grid.cell_rects[1, 2]
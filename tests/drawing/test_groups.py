@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import gc
+import pyglet
+from vecrec import Rect
+from glooey import drawing
+
+def make_image():
+    return pyglet.image.SolidColorImagePattern((255, 0, 0, 255))\
+            .create_image(16, 16)
+
+def test_ordered_group():
+    parent = drawing.get_ordered_group(0)
+    group = drawing.get_ordered_group(1, parent)
+
+    assert drawing.get_ordered_group(1, parent) is group
+    assert drawing.get_ordered_group(2, parent) is not group
+    assert drawing.get_ordered_group(1) is not group
+
+def test_sprite_group():
+    atlas = pyglet.image.TextureGrid(
+            pyglet.image.ImageGrid(make_image(), 2, 2))
+    texture = atlas[0].get_texture()
+    group = drawing.get_sprite_group(texture)
+
+    # Regions of the same texture share a group.
+    assert drawing.get_sprite_group(atlas[1].get_texture()) is group
+    assert drawing.get_sprite_group(make_image().get_texture()) is not group
+
+def test_num_live_groups():
+    gc.collect()
+    num_groups = drawing.get_num_live_groups()
+
+    groups = [drawing.get_ordered_group(i % 3) for i in range(100)]
+    assert drawing.get_num_live_groups() <= num_groups + 3
+
+    del groups
+    gc.collect()
+    assert drawing.get_num_live_groups() <= num_groups
+
+def test_regroup_background():
+    batch = pyglet.graphics.Batch()
+    bg = drawing.Background(
+            rect=Rect(0, 0, 100, 100),
+            color='green',
+            left=make_image(),
+            right=make_image(),
+            batch=batch,
+            group=pyglet.graphics.OrderedGroup(0),
+    )
+    color_list = bg._color_artist.vertex_list
+    tile_lists = [x.vertex_list for x in bg._tile_artists.values()]
+
+    # Regrouping to an equal group doesn't move anything.
+    num_groups = drawing.get_num_live_groups()
+    bg.group = pyglet.graphics.OrderedGroup(0)
+
+    assert bg._color_artist.vertex_list is color_list
+    assert [x.vertex_list for x in bg._tile_artists.values()] == tile_lists
+    assert drawing.get_num_live_groups() == num_groups
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import gc
+import weakref
+import pytest
+import pyglet
+import glooey
+from vecrec import Rect
+from glooey import drawing
+
+@pytest.fixture
+def batch():
+    return pyglet.graphics.Batch()
+
+def test_slots(batch):
+    pool = drawing.ArtistPool(block_size=4)
+    slots = [
+            pool.add(batch, 4, pyglet.gl.GL_QUADS, None, 'v2f', 'c4B')
+            for i in range(5)
+    ]
+    assert pool.num_vertex_lists == 2
+
+    slots[0].vertices = range(8)
+    slots[1].vertices = range(10, 18)
+    assert slots[0].get_size() == 4
+    assert list(slots[0].vertices) == list(range(8))
+    assert list(slots[1].vertices) == list(range(10, 18))
+
+    # Slots with a different group come from a different vertex list.
+    group = pyglet.graphics.OrderedGroup(1)
+    pool.add(batch, 4, pyglet.gl.GL_QUADS, group, 'v2f', 'c4B')
+    assert pool.num_vertex_lists == 3
+
+def test_delete(batch):
+    pool = drawing.ArtistPool(block_size=4)
+    slots = [
+            pool.add(batch, 4, pyglet.gl.GL_QUADS, None, 'v2f', 'c4B')
+            for i in range(4)
+    ]
+    slots[2].vertices = range(8)
+    slots[2].delete()
+    slots[2].delete()
+    assert list(slots[2].vertices) == 8 * [0]
+
+    # Deleted slots are reused before any new vertex lists are added.
+    slot = pool.add(batch, 4, pyglet.gl.GL_QUADS, None, 'v2f', 'c4B')
+    slot.vertices = range(8)
+    assert list(slots[2].vertices) == list(range(8))
+    assert pool.num_vertex_lists == 1
+
+def test_rectangle(batch):
+    pool = drawing.ArtistPool()
+    rect = Rect(0, 0, 10, 10)
+    artist = drawing.Rectangle(rect, batch=batch, pool=pool)
+    slot = artist.vertex_list
+    assert list(slot.vertices) == [0, 0, 10, 0, 10, 10, 0, 10]
+
+    # Hiding the artist keeps its slot, but doesn't draw it.
+    artist.hide()
+    assert artist.vertex_list is None
+    assert list(slot.vertices) == 8 * [0]
+
+    artist.rect = Rect(0, 0, 20, 20)
+    artist.show()
+    assert artist.vertex_list is slot
+    assert list(slot.vertices) == [0, 0, 20, 0, 20, 20, 0, 20]
+
+    # Changing the group needs a new slot.
+    artist.group = pyglet.graphics.OrderedGroup(1)
+    assert artist.vertex_list is not slot
+    assert list(slot.vertices) == 8 * [0]
+    assert list(artist.vertex_list.vertices) == [0, 0, 20, 0, 20, 20, 0, 20]
+
+    artist.delete()
+    assert artist.vertex_list is None
+    assert pool.num_vertex_lists == 2
+
+def test_release_batch(window):
+    gui = glooey.Gui(window)
+    gui.add(glooey.Placeholder())
+    batch = weakref.ref(gui.batch)
+    assert batch() in drawing.default_pool._blocks
+
+    # The pool shouldn't keep the batch (and its vertex buffers) alive once 
+    # the GUI is gone.
+    del gui
+    gc.collect()
+    assert batch() is None
+    assert not drawing.default_pool._blocks
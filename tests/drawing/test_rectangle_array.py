@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import pytest
+import pyglet
+from vecrec import Rect
+from glooey import drawing
+from glooey.drawing import artists as artists_module
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(artists_module, 'numpy', None)
+    elif artists_module.numpy is None:
+        pytest.skip("numpy not installed")
+
+@pytest.fixture
+def batch():
+    return pyglet.graphics.Batch()
+
+def test_rects(backend, batch):
+    rects = [(0, 0, 10, 20), (5, 5, 1, 1)]
+    artist = drawing.RectangleArray(rects, (255, 0, 0), batch=batch)
+
+    assert artist.vertex_list.get_size() == 8
+    assert list(artist.vertex_list.vertices) == [
+            0, 0, 10, 0, 10, 20, 0, 20,
+            5, 5, 6, 5, 6, 6, 5, 6,
+    ]
+    assert list(artist.vertex_list.colors) == 8 * [255, 0, 0, 255]
+
+def test_colors(backend, batch):
+    rects = [(0, 0, 10, 20), (5, 5, 1, 1)]
+    colors = [(1, 2, 3, 4), (5, 6, 7, 8)]
+    artist = drawing.RectangleArray(rects, colors, batch=batch)
+
+    assert list(artist.vertex_list.colors) == 4 * [1, 2, 3, 4] + 4 * [5, 6, 7, 8]
+
+    artist.set_color(1, 'white')
+    assert list(artist.vertex_list.colors) == 4 * [1, 2, 3, 4] + 4 * [255] * 4
+
+def test_set_rect(backend, batch):
+    artist = drawing.RectangleArray([(0, 0, 1, 1)] * 3, batch=batch)
+
+    artist.set_rect(1, Rect(10, 10, 5, 5))
+    assert list(artist.vertex_list.vertices[8:16]) == [
+            10, 10, 15, 10, 15, 15, 10, 15]
+
+    with pytest.raises(drawing.UsageError):
+        artist.set_color(1, 'white')
+
+def test_set_rects(backend, batch):
+    artist = drawing.RectangleArray([(0, 0, 1, 1)], batch=batch)
+
+    artist.set_rects([(0, 0, 2, 2), (1, 1, 2, 2)], [(1, 1, 1, 1)] * 2)
+    assert artist.vertex_list.get_size() == 8
+    assert list(artist.vertex_list.vertices[8:]) == [1, 1, 3, 1, 3, 3, 1, 3]
+    assert list(artist.vertex_list.colors) == 8 * [1, 1, 1, 1]
+
+    artist.hide()
+    artist.set_rects([(0, 0, 1, 1)] * 3, 'green')
+    artist.show()
+    assert artist.vertex_list.get_size() == 12
+
+def test_numpy_arrays(batch):
+    numpy = pytest.importorskip('numpy')
+
+    rects = numpy.zeros((100, 4))
+    rects[:,0] = numpy.arange(100)
+    rects[:,2:] = 1
+    colors = numpy.full((100, 4), 255, dtype=numpy.uint8)
+    artist = drawing.RectangleArray(rects, colors, batch=batch)
+
+    rects[:,1] = 10
+    artist.update_rects()
+    assert list(artist.vertex_list.vertices[-8:]) == [
+            99, 10, 100, 10, 100, 11, 99, 11]
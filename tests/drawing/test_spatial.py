@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import pytest
+from vecrec import Rect
+from glooey import drawing, UsageError
+
+def test_empty():
+    index = drawing.SpatialHash()
+    assert list(index.find(0, 0)) == []
+    assert len(index) == 0
+
+def test_find():
+    index = drawing.SpatialHash(10)
+    index.add('a', Rect(0, 0, 10, 10))
+    index.add('b', Rect(5, 5, 30, 30))
+
+    assert set(index.find(2, 2)) == {'a'}
+    assert set(index.find(7, 7)) == {'a', 'b'}
+    assert set(index.find(30, 30)) == {'b'}
+    assert set(index.find(40, 40)) == set()
+
+def test_find_edges():
+    index = drawing.SpatialHash(10)
+    index.add('a', Rect(0, 0, 10, 10))
+
+    assert set(index.find(0, 0)) == {'a'}
+    assert set(index.find(10, 10)) == {'a'}
+    assert set(index.find(10.1, 10)) == set()
+    assert set(index.find(-0.1, 0)) == set()
+
+def test_find_in_rect():
+    index = drawing.SpatialHash(10)
+    index.add('a', Rect(0, 0, 10, 10))
+    index.add('b', Rect(5, 5, 30, 30))
+    index.add('c', Rect(100, 100, 10, 10))
+
+    assert set(index.find_in_rect(Rect(0, 0, 50, 50))) == {'a', 'b'}
+    assert set(index.find_in_rect(Rect(20, 20, 5, 5))) == {'b'}
+    assert set(index.find_in_rect(Rect(10, 0, 5, 5))) == set()
+    assert len(list(index.find_in_rect(Rect(-50, -50, 200, 200)))) == 3
+
+def test_move():
+    index = drawing.SpatialHash(10)
+    index.add('a', Rect(0, 0, 10, 10))
+    index.add('a', Rect(50, 50, 10, 10))
+
+    assert set(index.find(5, 5)) == set()
+    assert set(index.find(55, 55)) == {'a'}
+    assert len(index) == 1
+
+def test_discard():
+    index = drawing.SpatialHash(10)
+    index.add('a', Rect(0, 0, 10, 10))
+    index.discard('a')
+    index.discard('b')
+
+    assert set(index.find(5, 5)) == set()
+    assert 'a' not in index
+
+def test_bad_cell_size():
+    with pytest.raises(UsageError):
+        drawing.SpatialHash(0)
+
@@ -141,5 +141,17 @@ def test_nested_holds():
         assert ex.update_log == ''
     assert ex.update_log == '12'
 
+def test_resume_after_exception():
+    ex = UpdateLogger()
+
+    try:
+        with ex.hold_updates():
+            ex.update_1()
+            raise ZeroDivisionError
+    except ZeroDivisionError:
+        pass
 
+    assert ex.update_log == '1'
 
+    ex.update_2()
+    assert ex.update_log == '12'
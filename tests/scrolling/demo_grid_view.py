@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import pyglet
+import glooey
+import run_demos
+
+class TestGridBox(glooey.ScrollBox):
+    Pane = glooey.GridView
+
+    class Frame(glooey.Frame):
+
+        class Decoration(glooey.Background):
+            custom_outline = 'green'
+
+    class HVBar:
+        custom_scale_grip = True
+
+        class Decoration(glooey.Background):
+            custom_color = 'dark'
+
+        class Grip(glooey.Button):
+            custom_size_hint = 20, 20
+            custom_alignment = 'fill'
+
+            class Base(glooey.Background):
+                custom_color = 'green'
+
+            class Over(glooey.Background):
+                custom_color = 'orange'
+
+            class Down(glooey.Background):
+                custom_color = 'purple'
+
+    class HBar(HVBar, glooey.HScrollBar):
+        pass
+
+    class VBar(HVBar, glooey.VScrollBar):
+        pass
+
+
+def make_cell(i, j):
+    return glooey.Label(f'{i},{j}')
+
+def bind_cell(cell, i, j):
+    cell.text = f'{i},{j}'
+
+
+window = pyglet.window.Window()
+gui = glooey.Gui(window)
+box = TestGridBox()
+box.size_hint = 300, 300
+box.alignment = 'center'
+box.pane.cell_width = 60
+box.pane.cell_height = 20
+box.pane.make_cell = make_cell
+box.pane.bind_cell = bind_cell
+gui.add(box)
+
+@run_demos.on_space(gui) #
+def test_grid_view():
+    box.pane.num_rows = box.pane.num_cols = 1000
+    yield "Show 1000x1000 cells, but only make labels for the visible ones."
+
+    box.pane.jump_to_cell(500, 500)
+    yield "Jump to cell (500, 500)."
+
+    box.pane.set_col_width(501, 120)
+    yield "Make column 501 wider."
+
+    box.pane.cell_padding = 5
+    yield "Put 5 px of padding between the cells."
+
+    box.pane.num_rows = box.pane.num_cols = 3
+    yield "Show 3x3 cells."
+
+pyglet.app.run()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import pyglet
+import glooey
+import run_demos
+
+class TestListBox(glooey.ScrollBox):
+    Pane = glooey.ListView
+
+    class Frame(glooey.Frame):
+
+        class Decoration(glooey.Background):
+            custom_outline = 'green'
+
+    class VBar(glooey.VScrollBar):
+        custom_scale_grip = True
+
+        class Decoration(glooey.Background):
+            custom_color = 'dark'
+
+        class Grip(glooey.Button):
+            custom_size_hint = 20, 20
+            custom_alignment = 'fill'
+
+            class Base(glooey.Background):
+                custom_color = 'green'
+
+            class Over(glooey.Background):
+                custom_color = 'orange'
+
+            class Down(glooey.Background):
+                custom_color = 'purple'
+
+
+def make_row(item):
+    return glooey.Label(item)
+
+def bind_row(row, item):
+    row.text = item
+
+
+window = pyglet.window.Window()
+gui = glooey.Gui(window)
+box = TestListBox()
+box.size_hint = 300, 300
+box.alignment = 'center'
+box.pane.make_row = make_row
+box.pane.bind_row = bind_row
+gui.add(box)
+
+@run_demos.on_space(gui) #
+def test_list_view():
+    box.pane.items = [f"Item #{i}" for i in range(100000)]
+    yield "Show 100,000 items, but only make labels for the visible ones."
+
+    box.pane.jump_to_item(50000)
+    yield "Jump to item #50000."
+
+    box.pane.items = [f"Item #{i}" for i in range(10)]
+    yield "Show 10 items."
+
+    box.pane.items = []
+    yield "Show no items."
+
+pyglet.app.run()
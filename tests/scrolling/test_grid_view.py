@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import pytest
+import glooey
+
+class Cell(glooey.Placeholder):
+
+    def __init__(self, i, j):
+        super().__init__(10, 10)
+        self.cell = i, j
+
+def bind_cell(cell, i, j):
+    cell.cell = i, j
+
+def check_cells(grid_view, rows, cols):
+    cells = grid_view.cells
+    assert sorted(cells) == [(i, j) for i in rows for j in cols]
+
+    for (i, j), cell in cells.items():
+        assert cell.cell == (i, j)
+        assert cell.rect == grid_view.child._grid.get_cell_rect(i, j)
+
+def test_only_visible_cells_are_made(gui):
+    grid_view = glooey.GridView(10000, 1000, Cell, bind_cell)
+    grid_view.cell_width = 40
+    grid_view.cell_height = 20
+    grid_view.overscan = 0
+    gui.add(grid_view)
+
+    check_cells(grid_view, range(0, 5), range(0, 5))
+    assert grid_view.child.claimed_size == (40 * 1000, 20 * 10000)
+
+def test_cells_are_recycled(gui):
+    grid_view = glooey.GridView(10000, 1000, Cell, bind_cell)
+    grid_view.cell_width = 40
+    grid_view.cell_height = 20
+    grid_view.overscan = 1
+    gui.add(grid_view)
+
+    widgets = set(grid_view.cells.values())
+    check_cells(grid_view, range(0, 6), range(0, 6))
+
+    grid_view.jump_to_cell(5000, 500)
+    check_cells(grid_view, range(4999, 5006), range(499, 506))
+    assert widgets < set(grid_view.cells.values())
+
+    grid_view.scroll((10, -10))
+    check_cells(grid_view, range(4999, 5007), range(499, 507))
+
+def test_cell_padding_and_sizes(gui):
+    grid_view = glooey.GridView(100, 100, Cell, bind_cell)
+    grid_view.cell_width = 40
+    grid_view.cell_height = 20
+    grid_view.cell_padding = 5
+    grid_view.set_row_height(1, 45)
+    grid_view.set_col_width(0, 100)
+    grid_view.overscan = 0
+    gui.add(grid_view)
+
+    assert grid_view.get_row_height(0) == 20
+    assert grid_view.get_row_height(1) == 45
+
+    # Rows: 0-20, 25-70, 75-95
+    # Cols: 0-100, 105-145, 150-190, 195-235
+    check_cells(grid_view, range(0, 3), range(0, 4))
+
+    grid_view.del_row_height(1)
+    check_cells(grid_view, range(0, 4), range(0, 4))
+
+def test_empty_cells(gui):
+    # Only make widgets for the cells on the diagonal.
+    def make_cell(i, j):
+        return Cell(i, j) if i == j else None
+
+    def bind_cell(cell, i, j):
+        if i != j: return False
+        cell.cell = i, j
+
+    grid_view = glooey.GridView(100, 100, make_cell, bind_cell)
+    grid_view.cell_width = grid_view.cell_height = 20
+    grid_view.overscan = 0
+    gui.add(grid_view)
+
+    assert sorted(grid_view.cells) == [(i, i) for i in range(5)]
+
+    grid_view.jump_to_cell(50, 50)
+    assert sorted(grid_view.cells) == [(i, i) for i in range(50, 55)]
+
+def test_find_cell_under_mouse(gui):
+    grid_view = glooey.GridView(100, 100, Cell, bind_cell)
+    grid_view.cell_width = 40
+    grid_view.cell_height = 20
+    gui.add(grid_view)
+    grid_view.jump_to_cell(50, 50)
+
+    presses = []
+    for cell in grid_view.cells.values():
+        cell.push_handlers(on_mouse_press=
+                lambda *args, cell=cell: presses.append(cell.cell))
+
+    assert grid_view.find_cell_under_mouse(45, 55) == (52, 51)
+    assert grid_view.find_cell_under_mouse(500, 500) is None
+
+    gui.on_mouse_press(45, 55, 1, 0)
+    assert presses == [(52, 51)]
+
+def test_set_num_rows_cols(gui):
+    grid_view = glooey.GridView(make_cell=Cell, bind_cell=bind_cell)
+    grid_view.cell_width = grid_view.cell_height = 20
+    grid_view.overscan = 0
+    gui.add(grid_view)
+
+    assert grid_view.cells == {}
+
+    grid_view.num_rows = 2
+    grid_view.num_cols = 3
+    check_cells(grid_view, range(2), range(3))
+
+    grid_view.clear()
+    assert grid_view.cells == {}
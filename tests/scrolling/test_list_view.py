@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+import pytest
+import glooey
+
+class Row(glooey.Placeholder):
+
+    def __init__(self, item):
+        super().__init__(10, 10)
+        self.item = item
+
+def bind_row(row, item):
+    row.item = item
+
+def check_rows(list_view, first, last):
+    rows = list_view.rows
+    assert sorted(rows) == list(range(first, last))
+
+    for i, row in rows.items():
+        assert row.item == i
+        assert row.parent is not None
+
+def test_only_visible_rows_are_made(gui):
+    list_view = glooey.ListView(range(100000), Row, bind_row)
+    list_view.overscan = 1
+    gui.add(list_view)
+
+    # 5 rows fit in the view, plus 1 row of overscan below.
+    check_rows(list_view, 0, 6)
+    assert list_view.child.claimed_height == 20 * 100000
+
+    rows = list_view.rows
+    assert rows[0].rect.top == list_view.child.rect.top
+    assert rows[1].rect.top == rows[0].rect.bottom
+
+def test_rows_are_recycled(gui):
+    list_view = glooey.ListView(range(100000), Row, bind_row)
+    list_view.overscan = 1
+    gui.add(list_view)
+
+    widgets = set(list_view.rows.values())
+
+    list_view.jump_to_item(50000)
+    check_rows(list_view, 49999, 50006)
+
+    list_view.scroll((0, -30))
+    check_rows(list_view, 50000, 50008)
+
+    # The widgets that were made for the first screen are reused, so only the 
+    # extra row of overscan above the view needed a new widget.
+    assert widgets < set(list_view.rows.values())
+    assert len(list_view.rows) == len(widgets) + 2
+
+    # The rows are where they would be if every item had a widget.
+    row = list_view.rows[50001]
+    assert row.rect.top == list_view.child.rect.top - 20 * 50001
+
+def test_rows_are_remade_without_binder(gui):
+    list_view = glooey.ListView(range(1000), Row)
+    list_view.overscan = 0
+    gui.add(list_view)
+
+    widgets = set(list_view.rows.values())
+    list_view.jump_to_item(500)
+    check_rows(list_view, 500, 505)
+
+    assert not widgets & set(list_view.rows.values())
+    assert all(w.parent is None for w in widgets)
+
+def test_set_items(gui):
+    list_view = glooey.ListView([], Row, bind_row)
+    gui.add(list_view)
+
+    assert list_view.rows == {}
+    assert list_view.child.claimed_height == 0
+
+    list_view.items = range(3)
+    check_rows(list_view, 0, 3)
+
+    list_view.items = []
+    assert list_view.rows == {}
+
+def test_variable_row_height(gui):
+    # Even rows are 10 px tall, odd rows are 40 px tall, but the row height is 
+    # estimated to be 20 px.
+    def make_row(item):
+        row = Row(item)
+        bind_row(row, item)
+        return row
+
+    def bind_row(row, item):
+        row.item = item
+        row.height_hint = 10 if item % 2 == 0 else 40
+
+    list_view = glooey.ListView(range(1000), make_row, bind_row)
+    list_view.overscan = 0
+    list_view.variable_row_height = True
+    gui.add(list_view)
+
+    rows = list_view.rows
+    check_rows(list_view, 0, 4)
+    assert [rows[i].rect.height for i in range(4)] == [10, 40, 10, 40]
+
+    # Based on the estimate, 5 rows were made to fill the view.  The last one 
+    # turned out not to be needed, but its height is remembered.
+    assert list_view.child.claimed_height == 20 * 995 + 110
+
+    # Items after the ones that have been measured are still positioned 
+    # using the estimate.
+    list_view.jump_to_item(500)
+    assert list_view.rows[500].rect.top == \
+            list_view.child.rect.top - 20 * 495 - 110
+
+def test_mouse_events(gui):
+    list_view = glooey.ListView(range(1000), Row, bind_row)
+    gui.add(list_view)
+    list_view.jump_to_item(100)
+
+    presses = []
+    for row in list_view.rows.values():
+        row.push_handlers(on_mouse_press=
+                lambda *args, row=row: presses.append(row.item))
+
+    gui.on_mouse_press(50, 55, 1, 0)
+    assert presses == [102]
+
+def test_scale_grip(gui):
+
+    class TestScrollBox(glooey.ScrollBox):
+        Pane = glooey.ListView
+
+        class VBar(glooey.VScrollBar):
+            custom_scale_grip = True
+
+            class Grip(glooey.Placeholder):
+                custom_alignment = 'fill'
+
+    box = TestScrollBox()
+    box.pane.make_row = Row
+    gui.add(box)
+    box.pane.items = range(10)
+
+    # The view is 100 px tall and the list is 200 px tall, so the grip should 
+    # take up half the scroll bar.
+    assert box.pane.child.height == 200
+    assert box._vbar._grip.height == 50
+
+    box.pane.scroll_percent((0, -1))
+    assert sorted(box.pane.rows)[-1] == 9
+    assert box._vbar._grip.rect.bottom == box._vbar.rect.bottom
+
+def test_resize_view(gui):
+    list_view = glooey.ListView(range(1000), Row, bind_row)
+    list_view.overscan = 0
+    gui.add(list_view)
+    check_rows(list_view, 0, 5)
+
+    # The list itself doesn't change size, but more of it is visible.
+    gui.window.height = 200
+    gui.on_resize(200, 200)
+    check_rows(list_view, 0, 10)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import pytest
+import glooey
+
+@pytest.fixture
+def pane(gui):
+    pane = glooey.ScrollPane()
+    pane.vert_scrolling = True
+    pane.cull_margin = 100
+
+    vbox = glooey.VBox()
+    for i in range(5000):
+        vbox.add(glooey.Placeholder(10, 20))
+
+    pane.add(vbox)
+    gui.add(pane)
+    return pane
+
+def find_drawn(pane):
+    return [
+            x for x in pane.child.children
+            if x.vertex_list is not None
+    ]
+
+def test_cull_offscreen_children(pane):
+    # The view is 100 px tall and the margin is 100 px, so only the rows in
+    # the top 200 px of the box are drawn.
+    drawn = find_drawn(pane)
+    assert len(drawn) == 10
+    assert all(x.rect.bottom >= pane.child.rect.top - 200 for x in drawn)
+    assert all(not x.is_culled for x in drawn)
+    assert len(pane.culled_widgets) == 4990
+
+def test_uncull_after_scrolling(pane):
+    drawn = find_drawn(pane)
+
+    # Scrolling less than the margin doesn't change anything.
+    pane.scroll((0, -50))
+    assert find_drawn(pane) == drawn
+
+    # Scrolling further than that draws the rows that came into view and
+    # undraws the rows that are now too far away.
+    pane.scroll((0, -100))
+    assert drawn[0].is_culled
+    assert drawn[0].vertex_list is None
+
+    view = pane.view
+    for child in pane.child.children:
+        if child.rect.bottom < view.top and child.rect.top > view.bottom:
+            assert child.vertex_list is not None
+
+def test_hidden_children_stay_hidden(pane):
+    child = pane.child.children[-1]
+    child.hide()
+
+    pane.view = 'bottom'
+    assert child.is_hidden
+    assert child.vertex_list is None
+
+    child.unhide()
+    assert child.vertex_list is not None
+
+    pane.view = 'top'
+    assert child.is_culled
+    assert child.vertex_list is None
+
+def test_disable_culling(pane):
+    pane.cull_margin = None
+    assert len(find_drawn(pane)) == 5000
+    assert not pane.culled_widgets
+
+@pytest.mark.parametrize('spatial_index', [None, glooey.drawing.SpatialHash])
+def test_cull_board_in_viewport(gui, spatial_index):
+    class Board(glooey.Board):
+        SpatialIndex = spatial_index
+
+    viewport = glooey.Viewport()
+    board = Board()
+    board.size_hint = 1000, 1000
+    pins = [glooey.Placeholder(20, 20) for i in range(100)]
+
+    for i, pin in enumerate(pins):
+        board.add(pin, left=100 * (i % 10), bottom=100 * (i // 10))
+
+    viewport.add(board)
+    gui.add(viewport)
+
+    # Only the pins in the top left corner of the board are near the view.
+    drawn = {i for i, pin in enumerate(pins) if pin.vertex_list is not None}
+    assert drawn == {80, 81, 82, 90, 91, 92}
+
+    viewport.view = 'bottom right'
+    drawn = {i for i, pin in enumerate(pins) if pin.vertex_list is not None}
+    assert drawn == {7, 8, 9, 17, 18, 19}
+
+def test_cull_nested_board_in_viewport(gui):
+    viewport = glooey.Viewport()
+    bin = glooey.Bin()
+    board = glooey.Board()
+    board.size_hint = 1000, 1000
+    pin = glooey.Placeholder(20, 20)
+    board.add(pin, left=900, bottom=0)
+
+    bin.add(board)
+    viewport.add(bin)
+    gui.add(viewport)
+
+    assert pin.is_culled
+    assert pin.vertex_list is None
+
+    # Moving the pin doesn't repack the viewport's child, but the pin still 
+    # has to be drawn once it's in view.
+    board.move(pin, left=0, top=1000)
+    assert not pin.is_culled
+    assert pin.vertex_list is not None
+
+    board.move(pin, left=900, bottom=0)
+    assert pin.is_culled
+    assert pin.vertex_list is None
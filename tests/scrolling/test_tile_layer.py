@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import pytest
+import pyglet
+import glooey
+
+@pytest.fixture
+def images():
+    atlas = pyglet.image.SolidColorImagePattern((255, 0, 0, 255))\
+            .create_image(40, 20)
+    grid = pyglet.image.ImageGrid(atlas, 2, 4)
+    return [None] + list(pyglet.image.TextureGrid(grid))
+
+@pytest.fixture
+def viewport(gui, images):
+    tiles = [[(i + j) % len(images) for j in range(512)] for i in range(512)]
+    layer = glooey.TileLayer(tiles, images)
+    layer.chunk_size = 8
+
+    viewport = glooey.ScrollPane()
+    viewport.horz_scrolling = True
+    viewport.vert_scrolling = True
+    viewport.add(layer)
+    gui.add(viewport)
+    return viewport
+
+def test_claim(viewport):
+    layer = viewport.child
+    assert layer.tile_size == (10, 10)
+    assert layer.claimed_size == (5120, 5120)
+
+def test_only_visible_chunks_are_made(viewport):
+    layer = viewport.child
+
+    # The view is 200x100 px in the top left corner, and each chunk is 80x80
+    # px, so there are 3 columns and 2 rows of chunks in view.
+    assert layer.chunks == {(i, j) for i in range(2) for j in range(3)}
+
+    # Every chunk uses the same texture, so there's one vertex list each.
+    # Empty tiles don't get vertices.
+    vertex_lists = layer._chunks[0, 0]
+    assert len(vertex_lists) == 1
+    assert vertex_lists[0].get_size() == 4 * (64 - 7)
+
+def test_chunks_follow_view(viewport):
+    layer = viewport.child
+
+    # Scrolling by less than a chunk keeps the old chunks around.
+    viewport.scroll((70, 0))
+    assert layer.chunks == {(i, j) for i in range(2) for j in range(4)}
+
+    viewport.view = 'bottom right'
+    assert layer.chunks == {(i, j) for i in range(62, 64) for j in range(61, 64)}
+
+def test_find_tile(viewport):
+    layer = viewport.child
+    top = layer.rect.top
+
+    assert layer.find_tile(5, top - 5) == (0, 0)
+    assert layer.find_tile(15, top - 25) == (2, 1)
+    assert layer.find_tile(-5, top - 5) is None
+    assert layer.find_tile(5, top + 5) is None
+
+    assert layer.get_tile_rect(2, 1).bottom_left == (10, top - 30)
+
+def test_set_tile(viewport):
+    layer = viewport.child
+
+    layer.set_tile(0, 0, 1)
+    assert layer.get_tile(0, 0) == 1
+    assert layer._chunks[0, 0][0].get_size() == 4 * (64 - 6)
+
+    # Tiles that aren't in view don't need to be drawn right away.
+    layer.set_tile(100, 100, 0)
+    assert layer.tiles[100][100] == 0
+    assert (12, 12) not in layer.chunks
+
+def test_hide(viewport):
+    layer = viewport.child
+
+    layer.hide()
+    assert layer.chunks == set()
+
+    layer.unhide()
+    assert len(layer.chunks) == 6
+
+def test_no_scroll_pane(gui, images):
+    tiles = [[1] * 16 for i in range(8)]
+    layer = glooey.TileLayer(tiles, images)
+    layer.chunk_size = 8
+    gui.add(layer)
+
+    # Without a scroll pane, every chunk is in view.
+    assert layer._pane is None
+    assert layer.chunks == {(0, 0), (0, 1)}
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""\
+Compare how long it takes to create, hide and show lots of `Rectangle`
+artists with and without an `ArtistPool`, and how many vertex lists end up
+in the batch.
+
+Without a pool, every rectangle adds its own vertex list to the batch, and
+hiding a rectangle deletes its vertex list.  With a pool, the rectangles
+share a few big vertex lists, and hiding a rectangle just makes its slot
+degenerate.
+"""
+
+import timeit
+import pyglet
+from vecrec import Rect
+from glooey import drawing
+
+print(__doc__)
+
+def create(num_artists, pool):
+    batch = pyglet.graphics.Batch()
+    return [
+            drawing.Rectangle(
+                Rect(i % 100, i // 100, 1, 1),
+                batch=batch,
+                pool=pool,
+            )
+            for i in range(num_artists)
+    ]
+
+def hide_and_show(artists):
+    for artist in artists:
+        artist.hide()
+    for artist in artists:
+        artist.show()
+
+def num_vertex_lists(artists, pool):
+    if pool is None:
+        return len(artists)
+    else:
+        return pool.num_vertex_lists
+
+def time_ms(f):
+    t = min(timeit.repeat(f, number=1, repeat=3))
+    return f'{1e3 * t:.1f}'
+
+
+print(f"{'pool':>6}  {'artists':>8}  {'create (ms)':>12}  {'hide/show (ms)':>15}  {'vertex lists':>13}")
+
+for use_pool in [False, True]:
+    for num_artists in [1000, 10000]:
+        pool = drawing.ArtistPool() if use_pool else None
+        artists = create(num_artists, pool)
+        create_time = time_ms(lambda: create(num_artists, drawing.ArtistPool() if use_pool else None))
+        hide_show_time = time_ms(lambda: hide_and_show(artists))
+        print(f"{str(use_pool):>6}  {num_artists:>8}  {create_time:>12}  {hide_show_time:>15}  {num_vertex_lists(artists, pool):>13}")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""\
+Compare how long it takes to fill containers that are already attached to the
+GUI one widget at a time, and all at once with the bulk methods (e.g.
+`Grid.add_many()`, `VBox.extend()`, `Board.add_many()`).
+
+Adding widgets one at a time repacks the container after every widget, so the
+total time grows quadratically.  The bulk methods only repack once, so the
+total time should grow linearly, i.e. the time per widget should stay roughly
+constant.  The one-at-a-time benchmarks are skipped for the biggest containers,
+because they take too long.
+"""
+
+import timeit
+import glooey
+
+print(__doc__)
+
+class DummyWindow:
+    width = 1000
+    height = 1000
+
+    def push_handlers(self, gui):
+        pass
+
+
+def fill_grid(num_children, bulk):
+    gui = glooey.Gui(DummyWindow())
+    grid = glooey.Grid()
+    gui.add(grid)
+
+    n = int(num_children**0.5)
+    children = {(i, j): glooey.Placeholder(1, 1)
+            for i in range(n) for j in range(n)}
+
+    if bulk:
+        grid.add_many(children)
+    else:
+        for (i, j), child in children.items():
+            grid.add(i, j, child)
+
+def fill_vbox(num_children, bulk):
+    gui = glooey.Gui(DummyWindow())
+    vbox = glooey.VBox()
+    gui.add(vbox)
+
+    children = [glooey.Placeholder(1, 0) for i in range(num_children)]
+
+    if bulk:
+        vbox.extend(children, sizes=0)
+    else:
+        for child in children:
+            vbox.add(child, size=0)
+
+def fill_board(num_children, bulk):
+    gui = glooey.Gui(DummyWindow())
+    board = glooey.Board()
+    gui.add(board)
+
+    children = {
+            glooey.Placeholder(1, 1): dict(left=i % 990, bottom=i // 990)
+            for i in range(num_children)
+    }
+
+    if bulk:
+        board.add_many(children)
+    else:
+        for child, kwargs in children.items():
+            board.add(child, **kwargs)
+
+def time_per_child(fill, num_children, bulk):
+    t = min(timeit.repeat(
+            lambda: fill(num_children, bulk), number=1, repeat=3))
+    return f'{1e6 * t / num_children:.1f}'
+
+
+print(f"{'container':>10}  {'children':>10}  {'one-by-one (µs/child)':>22}  {'bulk (µs/child)':>16}")
+
+for name, fill in [('Grid', fill_grid), ('VBox', fill_vbox), ('Board', fill_board)]:
+    for num_children in [100, 1000, 10000]:
+        one_by_one = time_per_child(fill, num_children, False) \
+                if num_children <= 1000 else '-'
+        bulk = time_per_child(fill, num_children, True)
+        print(f"{name:>10}  {num_children:>10}  {one_by_one:>22}  {bulk:>16}")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""\
+Count how many items of a long, scrolled inventory are actually drawn (i.e.
+have vertex lists in the batch), and how long it takes to scroll through the
+inventory, for different values of `ScrollPane.cull_margin`.
+
+Without culling (margin=None), every item is drawn all the time, even though
+all but a handful are clipped by the scissor box.  With culling, only the items
+near the view are drawn.  A bigger margin means more items are drawn, but the
+pane has to decide which items to draw less often while scrolling.
+"""
+
+import timeit
+import glooey
+
+print(__doc__)
+
+class DummyWindow:
+    width = 400
+    height = 600
+
+    def push_handlers(self, gui):
+        pass
+
+
+class Item(glooey.Placeholder):
+    custom_size_hint = 100, 40
+
+def show_inventory(num_items, margin):
+    gui = glooey.Gui(DummyWindow())
+    pane = glooey.ScrollPane()
+    pane.vert_scrolling = True
+    pane.cull_margin = margin
+    vbox = glooey.VBox()
+    vbox.extend([Item() for i in range(num_items)], sizes=0)
+    pane.add(vbox)
+    gui.add(pane)
+    return pane
+
+def scroll(pane):
+    for i in range(100):
+        pane.scroll((0, -7))
+
+def num_drawn(pane):
+    return sum(x.vertex_list is not None for x in pane.child.children)
+
+def time_ms(f):
+    t = min(timeit.repeat(f, number=1, repeat=3))
+    return f'{1e3 * t:.1f}'
+
+
+print(f"{'items':>8}  {'margin':>8}  {'drawn':>8}  {'100 scrolls (ms)':>17}")
+
+for num_items in [500, 5000]:
+    for margin in [None, 0, 100, 400]:
+        pane = show_inventory(num_items, margin)
+        scroll_time = time_ms(lambda: scroll(pane))
+        print(f"{num_items:>8}  {str(margin):>8}  {num_drawn(pane):>8}  {scroll_time:>17}")
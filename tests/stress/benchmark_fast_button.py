@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+"""\
+Compare a toolbar of 200 Kenney buttons made with `Button` and with
+`FastButton`: how many widgets it takes, how long it takes to make and show
+the toolbar, and how long it takes to hover over every button.
+
+Each `Button` has a background widget for each of its four rollover states,
+while each `FastButton` has one background widget that changes appearance.
+"""
+
+import timeit
+import glooey
+import glooey.themes.kenney as kenney
+
+# The Kenney theme replaces `glooey.drawing.colors`, but colors are looked up
+# in the `glooey.drawing.color` module.
+glooey.drawing.color.colors.update(glooey.drawing.colors)
+
+print(__doc__)
+
+class DummyWindow:
+    width = 2000
+    height = 2000
+
+    def push_handlers(self, gui):
+        pass
+
+
+class FastKenneyButton(glooey.FastButton, kenney.Button):
+    pass
+
+
+def make_toolbar(cls, num_buttons=200):
+    gui = glooey.Gui(DummyWindow())
+    grid = glooey.Grid()
+    grid.num_cols = 10
+    for i in range(num_buttons):
+        grid.add(i // 10, i % 10, cls(f'{i}'))
+    gui.add(grid)
+    return gui, grid
+
+def count_widgets(gui):
+    return sum(1 for x in gui._Widget__yield_all_children())
+
+def hover(gui, grid):
+    for button in grid._Widget__children:
+        x, y = button.rect.center
+        gui.on_mouse_motion(x, y, 0, 0)
+        gui.on_mouse_press(x, y, 1, 0)
+        gui.on_mouse_release(x, y, 1, 0)
+
+def time_ms(f):
+    t = min(timeit.repeat(f, number=1, repeat=3))
+    return f'{1e3 * t:.1f}'
+
+
+print(f"{'button':>10}  {'widgets':>8}  {'create (ms)':>12}  {'hover (ms)':>11}")
+
+for cls in [kenney.Button, FastKenneyButton]:
+    gui, grid = make_toolbar(cls)
+    name = 'Button' if cls is kenney.Button else 'FastButton'
+    create_time = time_ms(lambda: make_toolbar(cls))
+    hover_time = time_ms(lambda: hover(gui, grid))
+    print(f"{name:>10}  {count_widgets(gui):>8}  {create_time:>12}  {hover_time:>11}")
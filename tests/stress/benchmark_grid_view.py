@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""\
+Compare how long it takes to show and scroll through a big grid of cells
+using a `Grid` in a `ScrollPane` (one widget per cell) and using a `GridView`
+(one widget per visible cell).
+
+The time it takes to fill the `Grid` and the number of widgets it needs grow
+with the number of cells, while the `GridView` should take about the same
+amount of time and the same number of widgets no matter how many cells there
+are.  The `Grid` benchmarks are skipped for the biggest grids, because they
+take too long.
+"""
+
+import timeit
+import glooey
+
+print(__doc__)
+
+class DummyWindow:
+    width = 600
+    height = 600
+
+    def push_handlers(self, gui):
+        pass
+
+
+class Cell(glooey.Placeholder):
+    custom_size_hint = 32, 32
+
+    def __init__(self, i, j):
+        super().__init__()
+        self.cell = i, j
+
+def bind_cell(cell, i, j):
+    cell.cell = i, j
+
+def show_grid(n):
+    gui = glooey.Gui(DummyWindow())
+    pane = glooey.ScrollPane()
+    pane.horz_scrolling = pane.vert_scrolling = True
+    grid = glooey.Grid(n, n, default_row_height=0, default_col_width=0)
+    grid.add_many({(i, j): Cell(i, j) for i in range(n) for j in range(n)})
+    pane.add(grid)
+    gui.add(pane)
+    return pane
+
+def show_grid_view(n):
+    gui = glooey.Gui(DummyWindow())
+    grid_view = glooey.GridView(n, n, Cell, bind_cell)
+    grid_view.cell_width = grid_view.cell_height = 32
+    gui.add(grid_view)
+    return grid_view
+
+def scroll(pane):
+    for i in range(100):
+        pane.scroll((5, -7))
+
+def num_widgets(pane):
+    return len(pane.child)
+
+def time_ms(f):
+    t = min(timeit.repeat(f, number=1, repeat=3))
+    return f'{1e3 * t:.1f}'
+
+
+print(f"{'widget':>10}  {'cells':>10}  {'show (ms)':>10}  {'100 scrolls (ms)':>17}  {'widgets':>8}")
+
+for name, show in [('Grid', show_grid), ('GridView', show_grid_view)]:
+    for n in [10, 100, 1000]:
+        if name == 'Grid' and n > 100:
+            continue
+
+        pane = show(n)
+        show_time = time_ms(lambda: show(n))
+        scroll_time = time_ms(lambda: scroll(pane))
+        print(f"{name:>10}  {n * n:>10}  {show_time:>10}  {scroll_time:>17}  {num_widgets(pane):>8}")
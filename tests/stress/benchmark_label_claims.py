@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+"""\
+Time how long it takes to make and show a table of 1,000 labels that only
+contain 20 different strings (e.g. column headers and "OK"/"Cancel" buttons),
+and how long it takes to repack the table once it's shown.
+
+Labels measure their text through a shared cache, so only the first label
+with each string and style actually has to lay its text out to be claimed.
+"""
+
+import timeit
+import glooey
+
+print(__doc__)
+
+class DummyWindow:
+    width = 4000
+    height = 4000
+
+    def push_handlers(self, gui):
+        pass
+
+
+strings = [f'Column {i}' for i in range(18)] + ['OK', 'Cancel']
+
+def make_table(num_labels=1000):
+    gui = glooey.Gui(DummyWindow())
+    grid = glooey.Grid()
+    grid.num_cols = 20
+    for i in range(num_labels):
+        grid.add(i // 20, i % 20, glooey.Label(strings[i % len(strings)]))
+    gui.add(grid)
+    return grid
+
+def repack(grid):
+    for label in grid._Widget__children:
+        label._repack()
+
+def time_ms(f):
+    t = min(timeit.repeat(f, number=1, repeat=5))
+    return f'{1e3 * t:.1f}'
+
+
+grid = make_table()
+
+print(f"{'labels':>7}  {'create (ms)':>12}  {'repack (ms)':>12}")
+print(f"{1000:>7}  {time_ms(make_table):>12}  {time_ms(lambda: repack(grid)):>12}")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+"""\
+Time how long it takes to update the text of 1,000 HUD-style labels (e.g.
+counters that change every frame), and to change their color.
+"""
+
+import timeit
+import glooey
+
+print(__doc__)
+
+class DummyWindow:
+    width = 2000
+    height = 2000
+
+    def push_handlers(self, gui):
+        pass
+
+
+def make_labels(num_labels):
+    gui = glooey.Gui(DummyWindow())
+    grid = glooey.Grid()
+    grid.num_cols = 20
+    labels = [glooey.Label(f'Score: {i:04d}') for i in range(num_labels)]
+    for i, label in enumerate(labels):
+        grid.add(i // 20, i % 20, label)
+    gui.add(grid)
+    return labels
+
+def update_text(labels, frame):
+    for i, label in enumerate(labels):
+        label.text = f'Score: {(i + frame) % 10000:04d}'
+
+def update_color(labels, frame):
+    color = 'red' if frame % 2 else 'green'
+    for label in labels:
+        label.color = color
+
+def time_ms(f, num_frames=10):
+    frames = iter(range(1000000))
+    t = min(timeit.repeat(lambda: f(next(frames)), number=1, repeat=num_frames))
+    return f'{1e3 * t:.1f}'
+
+
+labels = make_labels(1000)
+
+print(f"{'update':>8}  {'labels':>7}  {'ms/frame':>9}")
+print(f"{'text':>8}  {len(labels):>7}  {time_ms(lambda i: update_text(labels, i)):>9}")
+print(f"{'color':>8}  {len(labels):>7}  {time_ms(lambda i: update_color(labels, i)):>9}")
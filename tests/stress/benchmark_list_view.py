@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+"""\
+Compare how long it takes to show and scroll through a long list of items
+using a `VBox` in a `ScrollPane` (one widget per item) and using a `ListView`
+(one widget per visible row).
+
+The time it takes to fill the `VBox` and the number of widgets it needs grow
+with the number of items, while the `ListView` should take about the same
+amount of time and the same number of widgets no matter how many items there
+are.  The `VBox` benchmarks are skipped for the biggest lists, because they
+take too long.
+"""
+
+import timeit
+import glooey
+
+print(__doc__)
+
+class DummyWindow:
+    width = 400
+    height = 600
+
+    def push_handlers(self, gui):
+        pass
+
+
+class Row(glooey.Placeholder):
+    custom_size_hint = 100, 20
+
+    def __init__(self, item):
+        super().__init__()
+        self.item = item
+
+def bind_row(row, item):
+    row.item = item
+
+def show_vbox(num_items):
+    gui = glooey.Gui(DummyWindow())
+    pane = glooey.ScrollPane()
+    pane.vert_scrolling = True
+    vbox = glooey.VBox()
+    vbox.extend([Row(i) for i in range(num_items)], sizes=0)
+    pane.add(vbox)
+    gui.add(pane)
+    return pane
+
+def show_list_view(num_items):
+    gui = glooey.Gui(DummyWindow())
+    list_view = glooey.ListView(range(num_items), Row, bind_row)
+    gui.add(list_view)
+    return list_view
+
+def scroll(pane):
+    for i in range(100):
+        pane.scroll((0, -7))
+
+def num_widgets(pane):
+    return len(pane.child)
+
+def time_ms(f):
+    t = min(timeit.repeat(f, number=1, repeat=3))
+    return f'{1e3 * t:.1f}'
+
+
+print(f"{'widget':>10}  {'items':>8}  {'show (ms)':>10}  {'100 scrolls (ms)':>17}  {'widgets':>8}")
+
+for name, show in [('VBox', show_vbox), ('ListView', show_list_view)]:
+    for num_items in [100, 1000, 10000, 100000]:
+        if name == 'VBox' and num_items > 10000:
+            continue
+
+        pane = show(num_items)
+        show_time = time_ms(lambda: show(num_items))
+        scroll_time = time_ms(lambda: scroll(pane))
+        print(f"{name:>10}  {num_items:>8}  {show_time:>10}  {scroll_time:>17}  {num_widgets(pane):>8}")
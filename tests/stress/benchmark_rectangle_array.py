@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""\
+Compare how long it takes to move every rectangle in a heatmap made of
+`Rectangle` artists (one vertex list and one python tuple per rectangle) and
+made with a single `RectangleArray` (with and without numpy).
+"""
+
+import timeit
+import random
+import pyglet
+from vecrec import Rect
+from glooey import drawing
+from glooey.drawing import artists
+
+print(__doc__)
+
+def make_rects(n, offset):
+    return [(i % 100 * 4 + offset, i // 100 * 4, 3, 3) for i in range(n)]
+
+def make_colors(n):
+    return [(random.randrange(256), 0, 0, 255) for i in range(n)]
+
+def update_rectangles(rectangles, rects, colors):
+    for rectangle, rect, color in zip(rectangles, rects, colors):
+        rectangle.rect = Rect(*rect)
+        rectangle.color = color
+
+def update_array(array, rects, colors):
+    array.set_rects(rects, colors)
+
+def time_ms(f):
+    t = min(timeit.repeat(f, number=1, repeat=3))
+    return f'{1e3 * t:.1f}'
+
+
+print(f"{'artist':>24}  {'rects':>8}  {'update (ms)':>12}")
+
+numpy = artists.numpy
+
+for num_rects in [1000, 10000]:
+    batch = pyglet.graphics.Batch()
+    rects = make_rects(num_rects, 1)
+    colors = make_colors(num_rects)
+
+    rectangles = [drawing.Rectangle(batch=batch) for i in range(num_rects)]
+    t = time_ms(lambda: update_rectangles(rectangles, rects, colors))
+    print(f"{'Rectangle':>24}  {num_rects:>8}  {t:>12}")
+
+    array = drawing.RectangleArray(make_rects(num_rects, 0), batch=batch)
+
+    artists.numpy = None
+    t = time_ms(lambda: update_array(array, rects, colors))
+    print(f"{'RectangleArray (python)':>24}  {num_rects:>8}  {t:>12}")
+
+    artists.numpy = numpy
+    if numpy is not None:
+        rects_array = numpy.array(rects, dtype=float)
+        colors_array = numpy.array(colors, dtype=numpy.uint8)
+        t = time_ms(lambda: update_array(array, rects_array, colors_array))
+        print(f"{'RectangleArray (numpy)':>24}  {num_rects:>8}  {t:>12}")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+"""\
+Compare how long it takes to route mouse events to the children of a `Board`, 
+with and without a spatial index.
+
+Each board is filled with small markers scattered randomly over a 1000x1000 
+area, then 100 mouse motion events are sent through the GUI.  The 
+linear search checks every marker for every event, while the spatial index 
+only checks the markers near the mouse.
+"""
+
+import random
+import timeit
+import glooey
+
+print(__doc__)
+
+class DummyWindow:
+    width = 1000
+    height = 1000
+
+    def push_handlers(self, gui):
+        pass
+
+
+class LinearBoard(glooey.Board):
+    pass
+
+
+class IndexedBoard(glooey.Board):
+    SpatialIndex = glooey.drawing.SpatialHash
+
+
+def make_gui(board_cls, num_children):
+    random.seed(0)
+    gui = glooey.Gui(DummyWindow())
+    board = board_cls()
+
+    for i in range(num_children):
+        marker = glooey.Placeholder(10, 10)
+        left = random.uniform(0, 990)
+        bottom = random.uniform(0, 990)
+        board.add(marker, left=left, bottom=bottom)
+
+    gui.add(board)
+    return gui
+
+def move_mouse(gui, num_events=100):
+    random.seed(1)
+    for i in range(num_events):
+        x = random.uniform(0, 1000)
+        y = random.uniform(0, 1000)
+        gui.on_mouse_motion(x, y, 0, 0)
+
+
+print(f"{'children':>10}  {'linear (ms)':>12}  {'indexed (ms)':>12}")
+
+for num_children in [100, 1000, 10000]:
+    times = []
+
+    for board_cls in [LinearBoard, IndexedBoard]:
+        gui = make_gui(board_cls, num_children)
+        times.append(min(timeit.repeat(
+                lambda: move_mouse(gui), number=1, repeat=3)))
+
+    linear, indexed = (1000 * t for t in times)
+    print(f"{num_children:>10}  {linear:>12.1f}  {indexed:>12.1f}")
+
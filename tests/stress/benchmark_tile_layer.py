@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+"""\
+Compare how long it takes to show and scroll through a square tile map made
+of `Image` widgets in a `Grid` (one widget and one sprite per tile) and made
+with a `TileLayer` (one vertex list per chunk in view).
+
+The time it takes to show the `Grid` grows with the number of tiles, while
+the `TileLayer` should take about the same amount of time no matter how big
+the map is.  The `Grid` benchmarks are skipped for the biggest maps, because
+they take too long.
+"""
+
+import timeit
+import pyglet
+import glooey
+
+print(__doc__)
+
+class DummyWindow:
+    width = 800
+    height = 600
+
+    def push_handlers(self, gui):
+        pass
+
+
+atlas = pyglet.image.SolidColorImagePattern((0, 128, 0, 255))\
+        .create_image(128, 128)
+images = pyglet.image.TextureGrid(pyglet.image.ImageGrid(atlas, 4, 4))
+
+tiles = {
+        size: [[(i * j) % len(images) for j in range(size)] for i in range(size)]
+        for size in [32, 64, 512]
+}
+
+def show_grid(size):
+    gui = glooey.Gui(DummyWindow())
+    pane = glooey.ScrollPane()
+    pane.horz_scrolling = pane.vert_scrolling = True
+    grid = glooey.Grid(default_row_height=0, default_col_width=0)
+    grid.padding = 0
+    for i, row in enumerate(tiles[size]):
+        for j, index in enumerate(row):
+            grid[i, j] = glooey.Image(images[index])
+    pane.add(grid)
+    gui.add(pane)
+    return pane
+
+def show_tile_layer(size):
+    gui = glooey.Gui(DummyWindow())
+    pane = glooey.ScrollPane()
+    pane.horz_scrolling = pane.vert_scrolling = True
+    pane.add(glooey.TileLayer(tiles[size], images))
+    gui.add(pane)
+    return pane
+
+def scroll(pane):
+    for i in range(100):
+        pane.scroll((7, -7))
+
+def num_vertex_lists(pane):
+    if isinstance(pane.child, glooey.TileLayer):
+        return sum(len(x) for x in pane.child._chunks.values())
+    else:
+        return len(pane.child)
+
+def time_ms(f):
+    t = min(timeit.repeat(f, number=1, repeat=3))
+    return f'{1e3 * t:.1f}'
+
+
+print(f"{'widget':>10}  {'tiles':>10}  {'show (ms)':>10}  {'100 scrolls (ms)':>17}  {'vertex lists':>13}")
+
+for name, show in [('Grid', show_grid), ('TileLayer', show_tile_layer)]:
+    for size in [32, 64, 512]:
+        if name == 'Grid' and size > 64:
+            continue
+
+        pane = show(size)
+        show_time = time_ms(lambda: show(size))
+        scroll_time = time_ms(lambda: scroll(pane))
+        print(f"{name:>10}  {f'{size}x{size}':>10}  {show_time:>10}  {scroll_time:>17}  {num_vertex_lists(pane):>13}")
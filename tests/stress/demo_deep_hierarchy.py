@@ -12,6 +12,10 @@ after running it I realized that glooey hits python's recursion limit after
 only ~200 levels of nesting.  200 levels is a lot, but it's conceivable a real 
 GUI could want that many (since so many of the widgets are pretty deeply nested 
 themselves).
+
+The layout algorithms no longer recurse, so `test_deep_hierarchy.py` now checks 
+that much deeper hierarchies can be laid out.  Mouse events are still 
+propagated recursively, though, so this demo keeps the original depth.
 """
 
 import pyglet
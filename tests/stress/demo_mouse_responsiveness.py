@@ -70,11 +70,11 @@ window = pyglet.window.Window()
 gui = glooey.Gui(window)
 grid = glooey.Grid()
 
-print()
-for i in range(window.height // UNIT):
-    for j in range(window.width // UNIT):
-        grid.add(i, j, TestButton())
-        print(f"\rAdding row [{i+1}/{window.height // UNIT}]", end='')
+grid.add_many({
+    (i, j): TestButton()
+    for i in range(window.height // UNIT)
+    for j in range(window.width // UNIT)
+})
 
 cursor = pyglet.image.load('assets/misc/cursor_green_circle.png')
 hotspot = 8, 8
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+"""\
+Make sure that deeply nested widgets can be laid out without hitting python's
+recursion limit.  This is the automated counterpart to
+`demo_deep_hierarchy.py`.
+"""
+
+import sys
+import pytest
+import glooey
+
+DEPTH = 5000
+
+class CenteredBin(glooey.Bin):
+    custom_alignment = 'center'
+
+
+@pytest.fixture
+def deep_widgets(gui):
+    bins = [CenteredBin() for i in range(DEPTH)]
+    widget = glooey.Placeholder(10, 10)
+
+    for parent, child in zip(bins, bins[1:]):
+        parent.add(child)
+
+    bins[-1].add(widget)
+    gui.add(bins[0])
+
+    return gui, bins, widget
+
+
+def test_depth_exceeds_recursion_limit():
+    assert DEPTH > sys.getrecursionlimit()
+
+def test_attach(deep_widgets):
+    gui, bins, widget = deep_widgets
+
+    assert widget.root is gui
+    assert widget.rect.size == (10, 10)
+    assert bins[0].rect.size == (10, 10)
+
+def test_repack(deep_widgets):
+    gui, bins, widget = deep_widgets
+
+    widget.size_hint = 20, 30
+    assert widget.rect.size == (20, 30)
+    assert bins[0].claimed_size == (20, 30)
+
+    bins[0].padding = 5
+    assert bins[0].claimed_size == (30, 40)
+    assert widget.rect.size == (20, 30)
+
+def test_deferred_repack(deep_widgets):
+    gui, bins, widget = deep_widgets
+    gui.defer_layout = True
+
+    widget.size_hint = 20, 30
+    bins[DEPTH // 2].padding = 5
+    assert widget.rect.size == (10, 10)
+
+    gui.flush_layout()
+    assert widget.rect.size == (20, 30)
+    assert bins[0].claimed_size == (30, 40)
+
+def test_hide_unhide(deep_widgets):
+    gui, bins, widget = deep_widgets
+
+    bins[0].hide()
+    assert widget.is_hidden
+
+    bins[0].unhide()
+    assert widget.is_visible
+
+def test_detach(deep_widgets):
+    gui, bins, widget = deep_widgets
+
+    gui.clear()
+    assert widget.root is None
+
+    gui.add(bins[0])
+    assert widget.root is gui
+    assert widget.rect.size == (10, 10)
+
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import glooey
+
+def make_label(gui, text):
+    label = glooey.Label(text)
+    gui.add(label)
+    return label
+
+def test_retain_layout(gui):
+    label = make_label(gui, "Score: 10")
+    layout, document = label._layout, label._layout.document
+    edits = []
+    label.push_handlers(on_edit_text=edits.append)
+
+    label.text = "Score: 11"
+    label.color = 'red'
+    label.font_size = 20
+
+    assert label._layout is layout
+    assert layout.document is document
+    assert document.text == "Score: 11"
+    assert document.get_style('color') == glooey.Color.from_anything('red').tuple
+    assert document.get_style('font_size') == 20
+    assert edits == []
+
+    # Deleted styles are removed from the document too.
+    del label.font_size
+    assert document.get_style('font_size') is None
+
+    # Line wrapping can't be turned on without a new layout.
+    label.enable_line_wrap(100)
+    assert label._layout is not layout
+    assert label._layout._wrap_lines
+
+def test_hidden_label(gui):
+    label = glooey.Label("Hello")
+    label.hide()
+    gui.add(label)
+    label.text = "Hello world"
+
+    # Hidden labels are measured without laying out any text in the batch.
+    assert label._layout is None
+    assert label.text == "Hello world"
+    assert label.claimed_size == glooey.measure_text("Hello world", label._style)
+
+    label.unhide()
+    assert label._layout.batch is label.batch
+
+def test_measure_text(gui):
+    glooey.clear_text_measurements()
+    styles = [
+            dict(font_size=10),
+            dict(font_size=14, bold=True, align='center'),
+            dict(font_size=10, line_spacing=30),
+    ]
+    for style in styles:
+        for wrap in [0, 50]:
+            label = make_label(gui, "Cancel or OK")
+            label.set_style(**style)
+            label.enable_line_wrap(wrap)
+
+            # The measured size must match the size of the layout that is 
+            # actually drawn.
+            layout = label._layout
+            assert label.claimed_size == \
+                    (layout.content_width, layout.content_height)
+
+    # Sizes are cached, and colors don't change the size.
+    size = glooey.measure_text("OK", dict(font_size=12, color=(0, 0, 0, 255)))
+    assert glooey.measure_text("OK", dict(font_size=12)) is size
+    assert glooey.measure_text("", dict(font_size=12)) == (0, 0)
+
+    # The cache is bounded.
+    glooey.text.max_text_measurements, default = 2, glooey.text.max_text_measurements
+    try:
+        for text in ["a", "b", "c"]:
+            glooey.measure_text(text, {})
+        assert len(glooey.text._text_measurements) == 2
+    finally:
+        glooey.text.max_text_measurements = default
+        glooey.clear_text_measurements()
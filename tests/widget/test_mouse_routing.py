@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import pytest
+import glooey
+
+class CountingHBox(glooey.HBox):
+
+    def __init__(self):
+        super().__init__()
+        self.num_searches = 0
+
+    def do_find_children_near_mouse(self, x, y):
+        self.num_searches += 1
+        yield from super().do_find_children_near_mouse(x, y)
+
+
+@pytest.fixture
+def dummy_widgets(gui):
+    hbox = CountingHBox()
+    left, right = glooey.EventLogger(), glooey.EventLogger()
+    hbox.add(left); hbox.add(right); gui.add(hbox)
+    return gui, hbox, left, right
+
+
+def test_search_skipped_over_same_child(dummy_widgets):
+    gui, hbox, left, right = dummy_widgets
+
+    gui.on_mouse_motion(25, 50, 0, 0)
+    assert hbox.num_searches == 1
+
+    gui.on_mouse_motion(26, 51, 1, 1)
+    gui.on_mouse_motion(27, 52, 1, 1)
+    assert hbox.num_searches == 1
+
+def test_enter_and_leave_sibling(dummy_widgets):
+    gui, hbox, left, right = dummy_widgets
+    entered, exited = [], []
+    left.push_handlers(
+            on_mouse_enter=lambda x, y: entered.append(left),
+            on_mouse_leave=lambda x, y: exited.append(left),
+    )
+    right.push_handlers(
+            on_mouse_enter=lambda x, y: entered.append(right),
+            on_mouse_leave=lambda x, y: exited.append(right),
+    )
+
+    gui.on_mouse_motion(25, 50, 0, 0)
+    gui.on_mouse_motion(26, 50, 1, 0)
+    assert entered == [left]
+    assert exited == []
+
+    gui.on_mouse_motion(150, 50, 124, 0)
+    assert entered == [left, right]
+    assert exited == [left]
+
+def test_hidden_child_is_left(dummy_widgets):
+    gui, hbox, left, right = dummy_widgets
+    exited = []
+    left.push_handlers(on_mouse_leave=lambda x, y: exited.append(left))
+
+    gui.on_mouse_motion(25, 50, 0, 0)
+    left.hide()
+    gui.on_mouse_motion(26, 50, 1, 0)
+    assert exited == [left]
+
+def test_board_spatial_index(gui):
+    class IndexedBoard(glooey.Board):
+        SpatialIndex = glooey.drawing.SpatialHash
+
+    board = IndexedBoard()
+    widgets = [glooey.Placeholder(10, 10) for i in range(5)]
+    for i, widget in enumerate(widgets):
+        board.add(widget, left=20*i, bottom=0)
+    gui.add(board)
+
+    assert list(board.do_find_children_near_mouse(45, 5)) == [widgets[2]]
+    assert list(board.do_find_children_near_mouse(55, 5)) == []
+
+    board.move(widgets[2], left=50, bottom=0)
+    assert list(board.do_find_children_near_mouse(45, 5)) == []
+    assert list(board.do_find_children_near_mouse(55, 5)) == [widgets[2]]
+
+    board.remove(widgets[2])
+    assert list(board.do_find_children_near_mouse(55, 5)) == []
+
+def test_stack_spatial_index(gui):
+    class IndexedStack(glooey.Stack):
+        SpatialIndex = glooey.drawing.SpatialHash
+        custom_one_child_gets_mouse = True
+
+    stack = IndexedStack()
+    back, front = glooey.Placeholder(), glooey.Placeholder(10, 10)
+    front.alignment = 'center'
+    stack.add_back(back); stack.add_front(front); gui.add(stack)
+
+    assert list(stack.do_find_children_near_mouse(100, 50)) == [front]
+    assert list(stack.do_find_children_near_mouse(10, 10)) == [back]
+
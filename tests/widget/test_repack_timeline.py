@@ -51,6 +51,14 @@ class DummyBin(RepackObserver, glooey.Bin):
         return super().add(widget)
 
 
+class DummyHBox(RepackObserver, glooey.HBox):
+    pass
+
+
+class DummyVBox(RepackObserver, glooey.VBox):
+    custom_alignment = 'top left'
+
+
 class DummyPlaceholder(RepackObserver, glooey.Placeholder):
     pass
 
@@ -105,14 +113,8 @@ def test_repack_gui(dummy_widgets):
     assert TIMELINE == [
             gui._repack,
             gui._claim,
-              bin._claim,
-                widget._claim,
             gui._realign,
             gui._draw,
-              bin._realign,
-              bin._draw,
-                widget._realign,
-                widget._draw,
     ]
 
 def test_repack_bin(dummy_widgets):
@@ -124,11 +126,8 @@ def test_repack_bin(dummy_widgets):
     assert TIMELINE == [
             bin._repack,
             bin._claim,
-              widget._claim,
             bin._realign,
             bin._draw,
-              widget._realign,
-              widget._draw,
     ]
     
 def test_repack_widget(dummy_widgets):
@@ -143,6 +142,95 @@ def test_repack_widget(dummy_widgets):
             widget._realign,
             widget._draw,
     ]
+
+def test_repack_widget_with_siblings():
+    gui = DummyGui(DummyWindow())
+    hbox = DummyHBox()
+    widget, sibling = DummyPlaceholder(), DummyPlaceholder()
+    hbox.pack(widget); hbox.pack(sibling); gui.add(hbox)
+
+    # The widget's claim changes, so its parents need to be claimed again, but 
+    # its sibling doesn't.
+    del TIMELINE[:]
+    widget.size_hint = 20, 20
+    assert TIMELINE[:4] == [
+            widget._repack,
+            widget._claim,
+              hbox._repack,
+              hbox._claim,
+    ]
+    assert sibling._claim not in TIMELINE
+
+def test_repack_only_moved_cells():
+    gui = DummyGui(DummyWindow())
+    vbox = DummyVBox()
+    widgets = [DummyPlaceholder(10, 1) for i in range(50)]
+    for widget in widgets: vbox.pack(widget)
+    gui.add(vbox)
+
+    def count_realigns():
+        return sum(f.__name__ == '_realign' for f in TIMELINE)
+
+    # Adding a widget to the end of the box doesn't move any of the others, so 
+    # only the box itself, its parent, and the new widget are realigned.
+    del TIMELINE[:]
+    vbox.pack(DummyPlaceholder(10, 1))
+    assert count_realigns() == 3
+
+    # Adding a widget to the top of the box moves all the others.
+    del TIMELINE[:]
+    vbox.insert(DummyPlaceholder(10, 1), 0)
+    assert count_realigns() == 3 + 51
+
+    # Removing a widget from the middle of the box only moves the ones below 
+    # it, and the removed widget itself isn't realigned.
+    del TIMELINE[:]
+    vbox.remove(vbox.children[26])
+    assert count_realigns() == 2 + 25
+
+    # Making a widget in the middle of the box taller moves the widgets below 
+    # it, but the widgets above it stay put.
+    del TIMELINE[:]
+    vbox.children[40].height_hint = 2
+    assert count_realigns() == 2 + 1 + 10
+
+def test_reattach_box_redraws_children():
+    gui = DummyGui(DummyWindow())
+    vbox = DummyVBox()
+    widgets = [DummyPlaceholder(10, 10) for i in range(2)]
+    vbox.extend(widgets, sizes=0)
+    gui.add(vbox)
+
+    gui.clear()
+    del TIMELINE[:]
+    gui.add(vbox)
+
+    for widget in widgets:
+        assert widget._draw in TIMELINE
+
+def test_repack_sibling_without_redraw():
+    gui = DummyGui(DummyWindow())
+    vbox = DummyVBox()
+    widget = DummyPlaceholder(10, 10)
+    widget.alignment = 'top left'
+    sibling = DummyPlaceholder(10, 10)
+    vbox.pack(widget); vbox.pack(sibling); gui.add(vbox)
+
+    # Making the sibling wider makes the widget's cell wider too, so the 
+    # widget has to be realigned.  But it's alignment keeps it in the same 
+    # place, so it doesn't have to be redrawn.
+    del TIMELINE[:]
+    sibling.width_hint = 20
+    assert widget._realign in TIMELINE
+    assert widget._draw not in TIMELINE
+
+    # It should still be possible to force a redraw.
+    del TIMELINE[:]
+    widget._draw()
+    assert TIMELINE == [
+            widget._draw,
+    ]
+
 def test_regroup_gui(dummy_widgets):
     gui, bin, widget = dummy_widgets
     bin.add(widget); gui.add(bin)
@@ -182,3 +270,80 @@ def test_regroup_widget(dummy_widgets):
             widget._draw,
     ]
 
+
+def test_deferred_repack(dummy_widgets):
+    gui, bin, widget = dummy_widgets
+    bin.add(widget); gui.add(bin)
+    gui.defer_layout = True
+
+    del TIMELINE[:]
+    widget._repack()
+    bin._repack()
+    widget._repack()
+    assert TIMELINE == [
+            widget._repack,
+            bin._repack,
+            widget._repack,
+    ]
+
+    del TIMELINE[:]
+    gui.flush_layout()
+    assert TIMELINE == [
+              widget._claim,
+            bin._claim,
+              widget._claim,
+            bin._realign,
+            bin._draw,
+              widget._realign,
+              widget._draw,
+    ]
+
+    del TIMELINE[:]
+    gui.flush_layout()
+    assert TIMELINE == []
+
+def test_deferred_repack_on_draw(dummy_widgets):
+    gui, bin, widget = dummy_widgets
+    bin.add(widget); gui.add(bin)
+    gui.defer_layout = True
+    gui.clear_before_draw = False
+
+    del TIMELINE[:]
+    widget._repack()
+    gui.on_draw()
+    assert TIMELINE == [
+            widget._repack,
+            widget._claim,
+            widget._realign,
+            widget._draw,
+    ]
+
+def test_disable_deferred_repack(dummy_widgets):
+    gui, bin, widget = dummy_widgets
+    bin.add(widget); gui.add(bin)
+    gui.defer_layout = True
+
+    del TIMELINE[:]
+    widget._repack()
+    gui.defer_layout = False
+    assert TIMELINE == [
+            widget._repack,
+            widget._claim,
+            widget._realign,
+            widget._draw,
+    ]
+
+@pytest.mark.parametrize('defer_layout', [False, True])
+def test_repack_gui(gui, defer_layout):
+    gui.defer_layout = defer_layout
+    gui.add(glooey.Placeholder(10, 10))
+    gui.flush_layout()
+    assert gui.claimed_size == (10, 10)
+
+    gui.padding = 20
+    gui.flush_layout()
+    assert gui.claimed_size == (50, 50)
+
+    gui.size_hint = 80, 60
+    gui.flush_layout()
+    assert gui.claimed_size == (120, 100)